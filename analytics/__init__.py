@@ -0,0 +1,6 @@
+"""Пакет аналитики истории оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+from .compute import MoodAnalytics, MoodProfile, analyze, ewma, profile, rolling_mean, streaks
+from .series import MoodSeries, MoodSeriesCache, mood_series_cache
@@ -0,0 +1,220 @@
+"""Модуль векторных расчетов по ряду оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+import math
+from dataclasses import dataclass
+
+import numpy as np
+
+from consts.analytics import EPOCH_WEEKDAY, EWMA_MAX_EXPONENT, SECONDS_PER_DAY, SECONDS_PER_HOUR
+from .series import MoodSeries
+
+
+@dataclass(frozen=True, slots=True)
+class MoodProfile:
+    """
+    Распределение оценок по значениям признака, например по дням недели
+
+    Attributes:
+        counts (np.ndarray): количество записей по значениям признака
+        means (np.ndarray): средняя оценка по значениям признака. NaN - записей нет
+    """
+
+    counts: np.ndarray
+    means: np.ndarray
+
+
+@dataclass(frozen=True, slots=True)
+class MoodAnalytics:
+    """
+    Аналитика истории оценок пользователя
+
+    Attributes:
+        first_day (int): номер первого дня рядов по дням от начала эпохи (UTC)
+        counts (np.ndarray): количество записей по дням от first_day до текущего дня
+        means (np.ndarray): средняя оценка по дням. NaN - записей нет
+        rolling_means (np.ndarray): средняя оценка записей за окно дней, заканчивающееся днем. NaN - записей нет
+        ewma (np.ndarray): экспоненциальное среднее средних оценок дней с записями. NaN - записей еще не было
+        weekday (MoodProfile): распределение по дням недели, понедельник - 0
+        hour (MoodProfile): распределение по часам суток (UTC)
+        current_streak (int): количество дней подряд с записями, заканчивающихся сегодня или вчера
+        longest_streak (int): наибольшее количество дней подряд с записями
+        active_days (int): количество дней с записями
+        count (int): количество записей
+        mean (float): средняя оценка. NaN - записей нет
+    """
+
+    first_day: int
+    counts: np.ndarray
+    means: np.ndarray
+    rolling_means: np.ndarray
+    ewma: np.ndarray
+    weekday: MoodProfile
+    hour: MoodProfile
+    current_streak: int
+    longest_streak: int
+    active_days: int
+    count: int
+    mean: float
+
+
+def _means(sums: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    means: np.ndarray = np.full(len(counts), np.nan)
+    np.divide(sums, counts, out=means, where=counts > 0)
+    return means
+
+
+def profile(keys: np.ndarray, scores: np.ndarray, size: int) -> MoodProfile:
+    """
+    Количество записей и средняя оценка по значениям признака
+
+    Args:
+        keys (np.ndarray): значения признака записей от 0 до size - 1
+        scores (np.ndarray): оценки записей
+        size (int): количество значений признака
+
+    Returns:
+        MoodProfile: распределение оценок по значениям признака
+    """
+    counts: np.ndarray = np.bincount(keys, minlength=size)
+    return MoodProfile(counts, _means(np.bincount(keys, weights=scores, minlength=size), counts))
+
+
+def rolling_mean(sums: np.ndarray, counts: np.ndarray, window: int) -> np.ndarray:
+    """
+    Средняя оценка записей за скользящее окно дней
+
+    Args:
+        sums (np.ndarray): сумма оценок по дням
+        counts (np.ndarray): количество записей по дням
+        window (int): размер окна в днях
+
+    Returns:
+        np.ndarray: средняя оценка записей окна, заканчивающегося днем. NaN - в окне нет записей
+
+    Notes:
+        Суммы окон - разности накопленных сумм, расчет линейный и не зависит от размера окна
+    """
+    window_sums: np.ndarray = np.cumsum(sums)
+    window_counts: np.ndarray = np.cumsum(counts)
+    window_sums[window:] -= window_sums[:-window].copy()
+    window_counts[window:] -= window_counts[:-window].copy()
+    return _means(window_sums, window_counts)
+
+
+def ewma(values: np.ndarray, alpha: float) -> np.ndarray:
+    """
+    Экспоненциальное скользящее среднее ряда с пропусками
+
+    Args:
+        values (np.ndarray): значения ряда. NaN - пропуск, среднее на нем не меняется
+        alpha (float): коэффициент сглаживания от 0 (не включая) до 1
+
+    Returns:
+        np.ndarray: среднее y[t] = (1 - alpha) * y[t - 1] + alpha * x[t], y[0] = x[0] по значениям без
+        пропусков, на пропусках - последнее среднее. NaN - значений еще не было
+
+    Examples:
+        >>> ewma(np.array([1.0, np.nan, 3.0]), 0.5) # array([1.0, 1.0, 2.0])
+
+    Notes:
+        Рекуррентная формула раскрыта в накопленную сумму x[k] / (1 - alpha) ** k. Чтобы делитель не
+        выходил за пределы float64, ряд считается блоками, в которых он не меньше 10 ** -EWMA_MAX_EXPONENT,
+        среднее переносится между блоками
+    """
+    present: np.ndarray = ~np.isnan(values)
+    observed: np.ndarray = values[present]
+
+    if not len(observed):
+        return np.full(len(values), np.nan)
+
+    smoothed: np.ndarray = observed.astype(np.float64)
+    decay: float = 1.0 - alpha
+
+    if decay > 0.0:
+        block: int = max(1, int(EWMA_MAX_EXPONENT / -math.log10(decay)))
+        powers: np.ndarray = decay ** np.arange(min(block, len(observed)), dtype=np.float64)
+        previous: float = float(observed[0])
+
+        for start in range(0, len(observed), block):
+            chunk: np.ndarray = observed[start : start + block]
+            chunk_powers: np.ndarray = powers[: len(chunk)]
+            smoothed[start : start + len(chunk)] = chunk_powers * (
+                decay * previous + alpha * np.cumsum(chunk / chunk_powers)
+            )
+            previous = float(smoothed[start + len(chunk) - 1])
+
+    # Номер последнего значения без пропуска для каждой позиции ряда, -1 - значений еще не было
+    positions: np.ndarray = np.cumsum(present) - 1
+    return np.where(positions >= 0, smoothed[np.maximum(positions, 0)], np.nan)
+
+
+def streaks(counts: np.ndarray) -> tuple[int, int]:
+    """
+    Серии дней подряд с записями
+
+    Args:
+        counts (np.ndarray): количество записей по дням, последний день - текущий
+
+    Returns:
+        tuple[int, int]: текущая серия и наибольшая серия в днях. Текущая серия продолжается, если
+        записи были вчера, а сегодня еще нет
+    """
+    days: np.ndarray = np.flatnonzero(counts)
+
+    if not len(days):
+        return 0, 0
+
+    # Границы серий - разрывы между соседними днями с записями
+    breaks: np.ndarray = np.flatnonzero(np.diff(days) != 1)
+    starts: np.ndarray = np.concatenate(([0], breaks + 1))
+    ends: np.ndarray = np.concatenate((breaks, [len(days) - 1]))
+    lengths: np.ndarray = ends - starts + 1
+    current: int = int(lengths[-1]) if days[-1] >= len(counts) - 2 else 0
+    return current, int(lengths.max())
+
+
+def analyze(series: MoodSeries, now: int, window: int, alpha: float) -> MoodAnalytics:
+    """
+    Аналитика ряда оценок за все время
+
+    Args:
+        series (MoodSeries): ряд оценок пользователя
+        now (int): текущее время в секундах от начала эпохи
+        window (int): окно скользящего среднего в днях
+        alpha (float): коэффициент сглаживания экспоненциального среднего
+
+    Returns:
+        MoodAnalytics: ряды по дням от первой записи до текущего дня, распределения и серии
+
+    Examples:
+        >>> import time
+        >>>
+        >>> analytics: MoodAnalytics = analyze(series, int(time.time()), 7, 0.3)
+    """
+    days: np.ndarray = series.timestamps // SECONDS_PER_DAY
+    scores: np.ndarray = series.scores.astype(np.int64)
+    today: int = int(now // SECONDS_PER_DAY)
+    first_day: int = min(int(days[0]), today) if len(days) else today
+    length: int = max(today, int(days[-1]) if len(days) else today) - first_day + 1
+
+    counts: np.ndarray = np.bincount(days - first_day, minlength=length)
+    sums: np.ndarray = np.bincount(days - first_day, weights=scores, minlength=length)
+    means: np.ndarray = _means(sums, counts)
+    current_streak, longest_streak = streaks(counts[: today - first_day + 1])
+
+    return MoodAnalytics(
+        first_day=first_day,
+        counts=counts,
+        means=means,
+        rolling_means=rolling_mean(sums, counts, window),
+        ewma=ewma(means, alpha),
+        weekday=profile((days + EPOCH_WEEKDAY) % 7, scores, 7),
+        hour=profile(series.timestamps // SECONDS_PER_HOUR % 24, scores, 24),
+        current_streak=current_streak,
+        longest_streak=longest_streak,
+        active_days=int(np.count_nonzero(counts)),
+        count=len(series),
+        mean=float(scores.mean()) if len(series) else math.nan,
+    )
@@ -0,0 +1,229 @@
+"""Модуль рядов оценок настроения пользователей в памяти воркера"""
+
+__author__: str = "Digital Horizons"
+
+from dataclasses import dataclass
+
+import numpy as np
+from sqlalchemy import BigInteger, Select, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import TTLCache
+from core.conditional import ResourceVersion
+from core.config import settings
+from models import MoodEntryModel
+
+# Тип массива оценок: оценка хранится в БД как SmallInteger
+SCORE_DTYPE: type[np.integer] = np.int16
+# Тип массива меток времени создания записей в секундах от начала эпохи
+TIMESTAMP_DTYPE: type[np.integer] = np.int64
+
+
+@dataclass(frozen=True, slots=True)
+class MoodSeries:
+    """
+    Неизменяемый ряд неудаленных записей настроения пользователя, упорядоченный по времени создания
+
+    Attributes:
+        timestamps (np.ndarray): метки времени создания записей в секундах от начала эпохи (int64)
+        scores (np.ndarray): оценки записей (int16)
+        max_id (int): наибольший идентификатор записи ряда. 0 - записей нет
+        version (ResourceVersion): версия истории пользователя, по которой загружен ряд
+
+    Examples:
+        >>> series: MoodSeries = await mood_series_cache.get(session_db, user_id, version)
+        >>> print(len(series), series.nbytes)
+    """
+
+    timestamps: np.ndarray
+    scores: np.ndarray
+    max_id: int
+    version: ResourceVersion
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Объем массивов ряда
+
+        Returns:
+            int: размер массивов в байтах (10 байт на запись)
+        """
+        return self.timestamps.nbytes + self.scores.nbytes
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[int, int, int]], version: ResourceVersion) -> "MoodSeries":
+        """
+        Ряд из строк выборки
+
+        Args:
+            rows (list[tuple[int, int, int]]): идентификатор, метка времени создания и оценка записей
+            version (ResourceVersion): версия истории пользователя
+
+        Returns:
+            MoodSeries: ряд, упорядоченный по времени создания
+        """
+        ids, timestamps, scores = _columns(rows)
+        order: np.ndarray = np.argsort(timestamps, kind="stable")
+
+        return cls(timestamps[order], scores[order], int(ids.max(initial=0)), version)
+
+    def appended(self, rows: list[tuple[int, int, int]], version: ResourceVersion) -> "MoodSeries":
+        """
+        Новый ряд с добавленными записями
+
+        Args:
+            rows (list[tuple[int, int, int]]): идентификатор, метка времени создания и оценка новых записей
+            version (ResourceVersion): версия истории пользователя с новыми записями
+
+        Returns:
+            MoodSeries: ряд с добавленными записями. Текущий ряд не изменяется
+
+        Notes:
+            Записи обычно создаются в текущий момент и дописываются в конец. Импортированные записи
+            с прошлым временем создания встают на свои места сортировкой слиянием
+        """
+        ids, timestamps, scores = _columns(rows)
+        timestamps = np.concatenate((self.timestamps, timestamps))
+        scores = np.concatenate((self.scores, scores))
+
+        if len(self) and len(rows) and timestamps[len(self) :].min() < self.timestamps[-1]:
+            order: np.ndarray = np.argsort(timestamps, kind="stable")
+            timestamps, scores = timestamps[order], scores[order]
+
+        return MoodSeries(timestamps, scores, max(self.max_id, int(ids.max(initial=0))), version)
+
+
+def _columns(rows: list[tuple[int, int, int]]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if not rows:
+        return np.empty(0, np.int64), np.empty(0, TIMESTAMP_DTYPE), np.empty(0, SCORE_DTYPE)
+
+    ids, timestamps, scores = zip(*rows)
+    return (
+        np.fromiter(ids, np.int64, len(rows)),
+        np.fromiter(timestamps, TIMESTAMP_DTYPE, len(rows)),
+        np.fromiter(scores, SCORE_DTYPE, len(rows)),
+    )
+
+
+def _series_select(user_id: int) -> Select:
+    return select(
+        MoodEntryModel.id,
+        # Секунды считает БД: строки приходят целыми числами без создания объектов datetime
+        cast(func.floor(func.extract("epoch", MoodEntryModel.created_at)), BigInteger),
+        MoodEntryModel.score,
+    ).where(MoodEntryModel.user_id == user_id, MoodEntryModel.deleted_at.is_(None))
+
+
+class MoodSeriesCache:
+    """
+    Кэш рядов оценок пользователей с догрузкой новых записей
+
+    Attributes:
+        maxsize (int): максимальное количество рядов пользователей в кэше
+        ttl (float): время жизни ряда пользователя в кэше в секундах
+
+    Examples:
+        >>> version: ResourceVersion = await get_user_entries_version(session_db, user_id)
+        >>> series: MoodSeries = await mood_series_cache.get(session_db, user_id, version)
+
+    Notes:
+        История пользователя загружается один раз. При следующих запросах ряд сверяется с текущей
+        версией истории: если после загрузки только добавлялись записи (из любого воркера), из БД
+        читаются записи с updated_at больше версии ряда по индексу ix_mood_entry_user_id_updated_at
+        и дописываются в ряд, если количество и наибольший идентификатор записей пользователя в БД
+        совпадают с рядом. Изменение или удаление записей приводит к полной перезагрузке.
+        Ряд за 10 лет по нескольку записей в день занимает сотни килобайт
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._series: TTLCache[int, MoodSeries] = TTLCache(maxsize, ttl)
+
+    async def get(self, session_db: AsyncSession, user_id: int, version: ResourceVersion) -> MoodSeries:
+        """
+        Ряд оценок пользователя, соответствующий версии истории
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при изменении истории
+            user_id (int): идентификатор пользователя
+            version (ResourceVersion): текущая версия истории пользователя
+
+        Returns:
+            MoodSeries: ряд неудаленных записей пользователя. Массивы ряда не изменяются вызывающим кодом
+        """
+        series: MoodSeries | None = self._series.get(user_id)
+
+        if series is not None and series.version == version:
+            return series
+
+        if series is not None:
+            series = await self._append(session_db, user_id, series, version)
+
+        if series is None:
+            series = MoodSeries.from_rows(list(await session_db.execute(_series_select(user_id))), version)
+
+        self._series.set(user_id, series)
+        return series
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Сброс ряда пользователя
+
+        Args:
+            user_id (int): идентификатор пользователя
+        """
+        self._series.pop(user_id)
+
+    def clear(self) -> None:
+        """Очистка всех рядов"""
+        self._series.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика использования кэша рядов
+
+        Returns:
+            dict[str, int]: размер кэша, количество попаданий и промахов
+        """
+        return self._series.stats()
+
+    async def _append(
+        self, session_db: AsyncSession, user_id: int, series: MoodSeries, version: ResourceVersion
+    ) -> MoodSeries | None:
+        added: int = version.count - series.version.count
+
+        if added <= 0 or series.version.last_modified is None:
+            return None
+
+        rows: list[tuple[int, int, int]] = list(
+            await session_db.execute(
+                _series_select(user_id).where(MoodEntryModel.updated_at > series.version.last_modified)
+            )
+        )
+
+        # Кроме новых записей изменились старые или часть новых не видна по updated_at - нужна перезагрузка
+        if len(rows) != added or any(row[0] <= series.max_id for row in rows):
+            return None
+
+        appended: MoodSeries = series.appended(rows, version)
+        count, max_id = (
+            await session_db.execute(
+                select(func.count(), func.coalesce(func.max(MoodEntryModel.id), 0)).where(
+                    MoodEntryModel.user_id == user_id, MoodEntryModel.deleted_at.is_(None)
+                )
+            )
+        ).one()
+
+        # Ряд сверяется с записями в БД: удаление, не изменившее версию, или запись вне выборки дают перезагрузку
+        if count != len(appended) or max_id != appended.max_id:
+            return None
+
+        return appended
+
+
+# Глобальный экземпляр кэша рядов оценок
+mood_series_cache: MoodSeriesCache = MoodSeriesCache(settings.ANALYTICS_CACHE_SIZE, settings.ANALYTICS_TTL)
@@ -0,0 +1,3 @@
+"""Пакет нагрузочных и микро-бенчмарков"""
+
+__author__: str = "Digital Horizons"
@@ -0,0 +1,92 @@
+"""
+Расчет аналитики истории оценок по ряду в памяти на синтетической истории за несколько лет
+
+Замеряются расчет всех показателей по массивам ряда, сборка и сериализация ответа для разного
+количества последних дней и догрузка новых записей в ряд. БД не используется: время загрузки ряда
+зависит от БД и выполняется один раз на пользователя.
+
+Examples:
+    python -m benchmarks.analytics --output analytics.json
+    python -m benchmarks.analytics --years 10 --entries-per-day 5
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from analytics import MoodAnalytics, MoodSeries, analyze
+from benchmarks.common import run_environment, time_per_op, write_report
+from consts.analytics import DEFAULT_ANALYTICS_DAYS, DEFAULT_EWMA_ALPHA, DEFAULT_ROLLING_WINDOW, MAX_ANALYTICS_DAYS
+from core.conditional import ResourceVersion
+from schemas.mood_analytics import MoodAnalyticsSchema
+
+# Количество дней в году
+DAYS_PER_YEAR: int = 365
+
+
+def make_series(years: int, entries_per_day: int, now: int) -> MoodSeries:
+    """
+    Синтетический ряд оценок с пропущенными днями
+
+    Args:
+        years (int): длина истории в годах
+        entries_per_day (int): среднее количество записей в день
+        now (int): текущее время в секундах от начала эпохи
+
+    Returns:
+        MoodSeries: ряд, заканчивающийся текущим временем
+    """
+    randomizer: np.random.Generator = np.random.default_rng(0)
+    count: int = years * DAYS_PER_YEAR * entries_per_day
+    timestamps: np.ndarray = np.sort(randomizer.integers(now - years * DAYS_PER_YEAR * 86400, now, count))
+    scores: np.ndarray = randomizer.integers(1, 11, count)
+    rows: list[tuple[int, int, int]] = list(zip(range(1, count + 1), timestamps.tolist(), scores.tolist()))
+    return MoodSeries.from_rows(rows, ResourceVersion(None, count, None))
+
+
+def main(years: int, entries_per_day: int) -> dict[str, Any]:
+    """
+    Замеры расчета, сборки ответа и догрузки записей
+
+    Args:
+        years (int): длина истории в годах
+        entries_per_day (int): среднее количество записей в день
+
+    Returns:
+        dict[str, Any]: сведения о запуске и время операций в наносекундах
+    """
+    now: int = int(time.time())
+    series: MoodSeries = make_series(years, entries_per_day, now)
+    analytics: MoodAnalytics = analyze(series, now, DEFAULT_ROLLING_WINDOW, DEFAULT_EWMA_ALPHA)
+    new_rows: list[tuple[int, int, int]] = [(series.max_id + 1, now, 5)]
+
+    return {
+        "environment": run_environment(),
+        "config": {"years": years, "entries_per_day": entries_per_day},
+        "series": {"entries": len(series), "bytes": series.nbytes},
+        "analyze": time_per_op(lambda: analyze(series, now, DEFAULT_ROLLING_WINDOW, DEFAULT_EWMA_ALPHA)),
+        "render": {
+            str(days): time_per_op(
+                lambda: MoodAnalyticsSchema.from_analytics(
+                    analytics, DEFAULT_ROLLING_WINDOW, DEFAULT_EWMA_ALPHA, days
+                ).model_dump_json()
+            )
+            for days in (DEFAULT_ANALYTICS_DAYS, MAX_ANALYTICS_DAYS)
+        },
+        "append": time_per_op(lambda: series.appended(new_rows, series.version)),
+    }
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--entries-per-day", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=None)
+    args: argparse.Namespace = parser.parse_args()
+
+    write_report(main(args.years, args.entries_per_day), args.output)
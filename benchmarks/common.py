@@ -0,0 +1,107 @@
+"""Общие функции бенчмарков: статистика задержек и сведения об окружении запуска"""
+
+__author__: str = "Digital Horizons"
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+
+def summarize(latencies: list[float], unit: str = "us") -> dict[str, float | int]:
+    """
+    Сводка распределения задержек
+
+    Args:
+        latencies (list[float]): задержки
+        unit (str): единица измерения задержек, добавляется к названиям полей
+
+    Returns:
+        dict[str, float | int]: количество, среднее, p50, p95, p99 и максимум
+
+    Examples:
+        >>> summarize([120.0, 95.5, 101.2], "us") # {'count': 3, 'mean_us': 105.6, 'p50_us': 101.2, ...}
+    """
+    if not latencies:
+        return {"count": 0}
+
+    ordered: list[float] = sorted(latencies)
+
+    def percentile(fraction: float) -> float:
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        f"mean_{unit}": round(statistics.fmean(ordered), 3),
+        f"p50_{unit}": round(percentile(0.50), 3),
+        f"p95_{unit}": round(percentile(0.95), 3),
+        f"p99_{unit}": round(percentile(0.99), 3),
+        f"max_{unit}": round(ordered[-1], 3),
+    }
+
+
+def time_per_op(func: Callable[[], Any], repeat: int = 5) -> dict[str, float]:
+    """
+    Время одного вызова функции
+
+    Args:
+        func (Callable[[], Any]): замеряемая функция без аргументов
+        repeat (int): количество серий замеров. Количество вызовов в серии подбирается автоматически
+
+    Returns:
+        dict[str, float]: лучшее и медианное по сериям время вызова в наносекундах
+    """
+    timer: timeit.Timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    timings: list[float] = [elapsed / number * 1_000_000_000 for elapsed in timer.repeat(repeat, number)]
+
+    return {"ns_per_op": round(min(timings), 1), "median_ns_per_op": round(statistics.median(timings), 1)}
+
+
+def run_environment() -> dict[str, Any]:
+    """
+    Сведения о запуске для сравнения результатов между коммитами
+
+    Returns:
+        dict[str, Any]: коммит, наличие незакоммиченных изменений, версии Python и платформа, время запуска
+    """
+    def git(*args: str) -> str | None:
+        try:
+            return subprocess.run(
+                ["git", *args], capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status: str | None = git("status", "--porcelain", "--untracked-files=no")
+
+    return {
+        "commit": git("rev-parse", "HEAD"),
+        "dirty": bool(status) if status is not None else None,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def write_report(report: dict[str, Any], output: Path | None) -> None:
+    """
+    Вывод результатов в JSON
+
+    Args:
+        report (dict[str, Any]): результаты бенчмарка
+        output (Path | None): файл для сохранения. None - вывод в stdout
+    """
+    data: str = json.dumps(report, indent=2, ensure_ascii=False)
+
+    if output is None:
+        print(data)
+    else:
+        output.write_text(data + "\n", encoding="utf-8")
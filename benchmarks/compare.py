@@ -0,0 +1,102 @@
+"""
+Сравнение двух JSON отчетов бенчмарков, например до и после изменения
+
+Для каждого числового показателя, присутствующего в обоих отчетах, выводятся оба значения
+и относительное изменение в процентах.
+
+Examples:
+    python -m benchmarks.compare baseline.json current.json
+    python -m benchmarks.compare baseline.json current.json --threshold 5
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any
+
+from benchmarks.common import write_report
+
+
+def flatten(report: dict[str, Any], prefix: str = "") -> dict[str, float]:
+    """
+    Числовые показатели отчета с путями через точку
+
+    Args:
+        report (dict[str, Any]): отчет бенчмарка
+        prefix (str): путь родительского раздела
+
+    Returns:
+        dict[str, float]: значения по путям
+
+    Examples:
+        >>> flatten({"latency": {"p50_ms": 1.5}, "environment": {"cpu_count": 8}}) # {'latency.p50_ms': 1.5}
+    """
+    values: dict[str, float] = {}
+
+    for key, value in report.items():
+        path: str = f"{prefix}{key}"
+
+        # Сведения о запуске и параметры не сравниваются
+        if not prefix and key in ("environment", "config"):
+            continue
+
+        if isinstance(value, dict):
+            values.update(flatten(value, f"{path}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[path] = value
+
+    return values
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> dict[str, Any]:
+    """
+    Изменения показателей между отчетами
+
+    Args:
+        baseline (dict[str, Any]): отчет до изменения
+        current (dict[str, Any]): отчет после изменения
+        threshold (float): минимальное изменение в процентах для попадания в результат
+
+    Returns:
+        dict[str, Any]: коммиты отчетов и изменения показателей
+    """
+    baseline_values: dict[str, float] = flatten(baseline)
+    current_values: dict[str, float] = flatten(current)
+    changes: dict[str, dict[str, float | None]] = {}
+
+    for path, before in baseline_values.items():
+        after: float | None = current_values.get(path)
+
+        if after is None:
+            continue
+
+        change: float | None = round((after - before) / before * 100, 2) if before else None
+
+        if change is None or abs(change) >= threshold:
+            changes[path] = {"baseline": before, "current": after, "change_percent": change}
+
+    return {
+        "baseline_commit": baseline.get("environment", {}).get("commit"),
+        "current_commit": current.get("environment", {}).get("commit"),
+        "changes": changes,
+    }
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.0, help="минимальное изменение в процентах")
+    parser.add_argument("--output", type=Path, default=None)
+    args: argparse.Namespace = parser.parse_args()
+
+    write_report(
+        compare(
+            json.loads(args.baseline.read_text(encoding="utf-8")),
+            json.loads(args.current.read_text(encoding="utf-8")),
+            args.threshold,
+        ),
+        args.output,
+    )
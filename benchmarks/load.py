@@ -0,0 +1,169 @@
+"""
+Нагрузочный тест HTTP API: задержки p50/p95/p99 и пропускная способность
+
+По умолчанию запросы идут в приложение в том же процессе через ASGI (без сети), приложение
+работает с БД из настроек - для воспроизводимых результатов нужна локальная Postgres с
+тестовыми данными. С --base-url нагрузка подается на запущенный сервер.
+
+Examples:
+    python -m benchmarks.load --token <токен сессии> --concurrency 32 --requests 5000 --output load.json
+    python -m benchmarks.load --base-url http://127.0.0.1:8000 --token <токен> --path /feed --path /friends
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import asyncio
+import itertools
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Iterator
+
+import httpx
+
+from benchmarks.common import run_environment, summarize, write_report
+
+# Маршруты по умолчанию: основные чтения пользователя
+DEFAULT_PATHS: tuple[str, ...] = (
+    "/feed",
+    "/mood-entries",
+    "/stats/mood?start=2026-01-01&end=2026-12-31&period=week",
+    "/tags/autocomplete?q=a",
+    "/friends",
+    "/friends/suggestions",
+    "/settings",
+)
+
+
+async def _worker(
+    client: httpx.AsyncClient,
+    paths: Iterator[str],
+    remaining: Iterator[int],
+    latencies: dict[str, list[float]],
+    statuses: Counter[str],
+) -> None:
+    for _ in remaining:
+        path: str = next(paths)
+        start: float = time.perf_counter()
+
+        try:
+            response: httpx.Response = await client.get(path)
+            statuses[str(response.status_code)] += 1
+        except httpx.HTTPError as exc:
+            statuses[type(exc).__name__] += 1
+            continue
+
+        latencies[path].append((time.perf_counter() - start) * 1000)
+
+
+async def run_load(
+    client: httpx.AsyncClient, paths: list[str], concurrency: int, requests: int
+) -> tuple[float, dict[str, list[float]], Counter[str]]:
+    """
+    Подача нагрузки заданным количеством одновременных клиентов
+
+    Args:
+        client (httpx.AsyncClient): HTTP клиент
+        paths (list[str]): маршруты, запрашиваемые по кругу
+        concurrency (int): количество одновременных запросов
+        requests (int): общее количество запросов
+
+    Returns:
+        tuple[float, dict[str, list[float]], Counter[str]]: длительность в секундах, задержки в миллисекундах
+        по маршрутам и количество ответов по кодам
+    """
+    # Общие итераторы: порядок маршрутов одинаков между запусками при любом числе клиентов
+    path_cycle: Iterator[str] = itertools.cycle(paths)
+    remaining: Iterator[int] = iter(range(requests))
+    latencies: dict[str, list[float]] = {path: [] for path in paths}
+    statuses: Counter[str] = Counter()
+
+    start: float = time.perf_counter()
+    await asyncio.gather(
+        *(_worker(client, path_cycle, remaining, latencies, statuses) for _ in range(concurrency))
+    )
+    return time.perf_counter() - start, latencies, statuses
+
+
+async def main(
+    base_url: str | None, token: str | None, paths: list[str], concurrency: int, requests: int, warmup: int
+) -> dict[str, Any]:
+    """
+    Прогрев и замер нагрузки
+
+    Args:
+        base_url (str | None): адрес запущенного сервера. None - приложение в текущем процессе
+        token (str | None): токен сессии для заголовка Authorization
+        paths (list[str]): маршруты, запрашиваемые по кругу
+        concurrency (int): количество одновременных запросов
+        requests (int): количество замеряемых запросов
+        warmup (int): количество запросов прогрева, не попадающих в результат
+
+    Returns:
+        dict[str, Any]: сведения о запуске, пропускная способность, распределение задержек и коды ответов
+    """
+    headers: dict[str, str] = {"Authorization": f"Bearer {token}"} if token else {}
+    limits: httpx.Limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    client_options: dict[str, Any] = {"base_url": base_url or "http://bench", "headers": headers, "limits": limits}
+
+    if base_url is None:
+        from main import app
+
+        client_options["transport"] = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with httpx.AsyncClient(timeout=30.0, **client_options) as client:
+        await run_load(client, paths, concurrency, warmup)
+        duration, latencies, statuses = await run_load(client, paths, concurrency, requests)
+
+    if base_url is None:
+        from core.database import engine, replica_set
+        from logger import log_pipeline
+
+        await replica_set.dispose()
+        await engine.dispose()
+        log_pipeline.stop()
+
+    completed: list[float] = [latency for path_latencies in latencies.values() for latency in path_latencies]
+
+    return {
+        "environment": run_environment(),
+        "config": {
+            "target": base_url or "asgi",
+            "paths": paths,
+            "concurrency": concurrency,
+            "requests": requests,
+            "warmup": warmup,
+        },
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(completed) / duration, 1) if duration else 0.0,
+        "latency": summarize(completed, "ms"),
+        "by_path": {path: summarize(path_latencies, "ms") for path, path_latencies in latencies.items()},
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--token", default=None)
+    parser.add_argument("--path", action="append", help="маршрут с параметрами, можно несколько")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--warmup", type=int, default=500)
+    parser.add_argument("--output", type=Path, default=None)
+    args: argparse.Namespace = parser.parse_args()
+
+    write_report(
+        asyncio.run(
+            main(
+                args.base_url,
+                args.token,
+                args.path or list(DEFAULT_PATHS),
+                args.concurrency,
+                args.requests,
+                args.warmup,
+            )
+        ),
+        args.output,
+    )
@@ -0,0 +1,120 @@
+"""
+Бенчмарк задержки обработки запроса в зависимости от способа записи логов
+
+Сравниваются: логирование отключено, синхронная запись JSON в файлы из обработки запроса
+(как было до очереди логов) и запись через LogPipeline.
+
+Examples:
+    python -m benchmarks.logging_latency --requests 5000 --output logging_latency.json
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI, Request
+from loguru import logger
+
+from benchmarks.common import run_environment, summarize, write_report
+from logger import logging_middleware
+from logger.pipeline import LogPipeline, LogTarget, serialize_json
+
+
+def _create_app() -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    @app.middleware("http")
+    async def add_logging_middleware(request: Request, call_next):
+        return await logging_middleware(request, call_next)
+
+    @app.get("/ping")
+    async def ping() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+def _configure(mode: str, log_dir: Path) -> LogPipeline | None:
+    logger.remove()
+
+    match mode:
+        case "sync":
+            # Три файловых обработчика, как в production до очереди логов
+            for name in ("app.log", "error.log", "http.log"):
+                logger.add(log_dir / f"sync-{name}", serialize=True, level="INFO")
+        case "queued":
+            pipeline: LogPipeline = LogPipeline(maxsize=10000, batch_size=500, flush_interval=0.05)
+            pipeline.start(
+                [
+                    LogTarget(log_dir / "queued-app.log", "INFO", serialize_json),
+                    LogTarget(log_dir / "queued-error.log", "ERROR", serialize_json),
+                    LogTarget(
+                        log_dir / "queued-http.log",
+                        "INFO",
+                        serialize_json,
+                        filter=lambda record: "http" in record["extra"],
+                    ),
+                ]
+            )
+            logger.add(pipeline.write, format="{message}", level=pipeline.min_level)
+            return pipeline
+
+    return None
+
+
+async def _measure(app: FastAPI, requests: int) -> list[float]:
+    latencies: list[float] = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        for _ in range(requests // 10):
+            await client.get("/ping")
+
+        for _ in range(requests):
+            start: float = time.perf_counter()
+            await client.get("/ping")
+            latencies.append((time.perf_counter() - start) * 1_000_000)
+
+    return latencies
+
+
+async def main(requests: int) -> dict[str, Any]:
+    """
+    Замер задержки запросов для каждого способа записи логов
+
+    Args:
+        requests (int): количество запросов на способ
+
+    Returns:
+        dict[str, Any]: сведения о запуске и сводка задержек в микросекундах по способам,
+        для очереди логов - также количество отброшенных записей
+    """
+    app: FastAPI = _create_app()
+    report: dict[str, Any] = {"environment": run_environment(), "config": {"requests": requests}}
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        for mode in ("off", "sync", "queued"):
+            pipeline: LogPipeline | None = _configure(mode, Path(log_dir))
+            latencies: list[float] = await _measure(app, requests)
+            logger.remove()
+            report[mode] = summarize(latencies, "us")
+
+            if pipeline is not None:
+                pipeline.stop()
+                report[mode]["dropped"] = pipeline.dropped
+
+    return report
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--output", type=Path, default=None)
+    args: argparse.Namespace = parser.parse_args()
+
+    write_report(asyncio.run(main(args.requests)), args.output)
@@ -0,0 +1,252 @@
+"""
+Микро-бенчмарки: накладные расходы middleware, гидратация моделей ORM и вычисляемые атрибуты моделей
+
+Middleware замеряются на пустом маршруте через ASGI без сети, логи пишутся во временный каталог
+теми же назначениями, что в production. Гидратация замеряется на SQLite в памяти: результат
+показывает стоимость построения объектов ORM относительно чтения тех же строк через Core.
+
+Examples:
+    python -m benchmarks.micro --output micro.json
+    python -m benchmarks.micro --only orm --rows 5000
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import httpx
+from fastapi import FastAPI, Request
+from loguru import logger
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from benchmarks.common import run_environment, summarize, time_per_op, write_report
+from consts.mood_entry import MoodEntryPublishStatus
+from consts.user import UserGender
+from logger import logging_middleware
+from logger.pipeline import LogPipeline, LogTarget, serialize_json
+from metrics import metrics_middleware, metrics_registry
+from models import MoodEntryModel, MoodScoreRollupModel, UserModel
+from models.base import BaseModel
+from security import setup_cors
+
+# Группы бенчмарков
+GROUPS: tuple[str, ...] = ("middleware", "orm", "models")
+# Варианты приложения: набор middleware поверх пустого маршрута
+MIDDLEWARE_VARIANTS: tuple[str, ...] = ("bare", "cors", "logging", "metrics", "full")
+
+
+def _create_app(variant: str) -> FastAPI:
+    app: FastAPI = FastAPI()
+
+    # Порядок подключения как в main: CORS, затем логирование и метрики
+    if variant in ("cors", "full"):
+        setup_cors(app)
+
+    if variant in ("logging", "full"):
+
+        @app.middleware("http")
+        async def add_logging_middleware(request: Request, call_next):
+            return await logging_middleware(request, call_next)
+
+    if variant in ("metrics", "full"):
+
+        @app.middleware("http")
+        async def add_metrics_middleware(request: Request, call_next):
+            return await metrics_middleware(request, call_next)
+
+    @app.get("/ping")
+    async def ping() -> dict[str, bool]:
+        return {"ok": True}
+
+    return app
+
+
+async def bench_middleware(requests: int, work_dir: Path) -> dict[str, Any]:
+    """
+    Задержка обработки запроса с разными наборами middleware
+
+    Args:
+        requests (int): количество замеряемых запросов на вариант
+        work_dir (Path): каталог для логов и файла метрик
+
+    Returns:
+        dict[str, Any]: распределение задержки в микросекундах и прирост медианы относительно варианта без middleware
+    """
+    logger.remove()
+    pipeline: LogPipeline = LogPipeline(maxsize=10000, batch_size=500, flush_interval=0.05)
+    pipeline.start(
+        [
+            LogTarget(work_dir / "app.log", "INFO", serialize_json),
+            LogTarget(work_dir / "error.log", "ERROR", serialize_json),
+            LogTarget(
+                work_dir / "http.log", "INFO", serialize_json, filter=lambda record: "http" in record["extra"]
+            ),
+        ]
+    )
+    logger.add(pipeline.write, format="{message}", level=pipeline.min_level)
+    metrics_registry.storage.path = work_dir / "metrics.mmap"
+    results: dict[str, Any] = {}
+
+    for variant in MIDDLEWARE_VARIANTS:
+        app: FastAPI = _create_app(variant)
+        latencies: list[float] = []
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://bench",
+            headers={"Origin": "http://localhost:3000"},
+        ) as client:
+            for _ in range(requests // 10):
+                await client.get("/ping")
+
+            for _ in range(requests):
+                start: float = time.perf_counter()
+                await client.get("/ping")
+                latencies.append((time.perf_counter() - start) * 1_000_000)
+
+        results[variant] = summarize(latencies, "us")
+
+    for variant in MIDDLEWARE_VARIANTS[1:]:
+        results[variant]["overhead_p50_us"] = round(results[variant]["p50_us"] - results["bare"]["p50_us"], 3)
+
+    pipeline.stop()
+    results["log_records_dropped"] = pipeline.dropped
+    return results
+
+
+def bench_orm(rows: int) -> dict[str, Any]:
+    """
+    Гидратация строк MoodEntry и User в объекты ORM
+
+    Args:
+        rows (int): количество строк в выборке
+
+    Returns:
+        dict[str, Any]: время выборки через ORM и через Core в пересчете на строку в наносекундах
+    """
+    engine = create_engine("sqlite://")
+    BaseModel.metadata.create_all(engine, tables=[UserModel.__table__, MoodEntryModel.__table__])
+    now: datetime = datetime.now(timezone.utc)
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(UserModel),
+            [
+                {
+                    "id": index,
+                    "surname": f"Surname{index}",
+                    "name": f"Name{index}",
+                    "patronymic": f"Patronymic{index}" if index % 2 else None,
+                    "gender": UserGender.FEMALE if index % 2 else UserGender.MALE,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for index in range(1, rows + 1)
+            ],
+        )
+        connection.execute(
+            insert(MoodEntryModel),
+            [
+                {
+                    "id": index,
+                    "score": index % 10,
+                    "description": f"Entry {index}",
+                    "status": MoodEntryPublishStatus.FOR_ALL,
+                    "user_id": index,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for index in range(1, rows + 1)
+            ],
+        )
+
+    results: dict[str, Any] = {"rows": rows}
+
+    for name, model in (("mood_entry", MoodEntryModel), ("user", UserModel)):
+
+        def load_orm() -> None:
+            with Session(engine) as session:
+                session.scalars(select(model)).all()
+
+        def load_core() -> None:
+            with engine.connect() as connection:
+                connection.execute(select(model.__table__)).all()
+
+        orm: dict[str, float] = time_per_op(load_orm)
+        core: dict[str, float] = time_per_op(load_core)
+        results[name] = {
+            "orm_ns_per_row": round(orm["ns_per_op"] / rows, 1),
+            "core_ns_per_row": round(core["ns_per_op"] / rows, 1),
+            "orm_overhead_ns_per_row": round((orm["ns_per_op"] - core["ns_per_op"]) / rows, 1),
+        }
+
+    engine.dispose()
+    return results
+
+
+def bench_models() -> dict[str, Any]:
+    """
+    Вычисляемые атрибуты моделей
+
+    Returns:
+        dict[str, Any]: время одного вызова в наносекундах
+    """
+    tablename: Callable[[type], str] = BaseModel.__dict__["__tablename__"].fget
+    # Имя с аббревиатурой проходит обе замены регулярными выражениями
+    acronym_model: type = type("HTTPAccessLog", (), {})
+    user: UserModel = UserModel(surname="Ivanov", name="Ivan", patronymic="Ivanovich")
+    user_without_patronymic: UserModel = UserModel(surname="Ivanov", name="Ivan")
+
+    return {
+        "tablename_user": time_per_op(lambda: tablename(UserModel)),
+        "tablename_mood_score_rollup": time_per_op(lambda: tablename(MoodScoreRollupModel)),
+        "tablename_acronym": time_per_op(lambda: tablename(acronym_model)),
+        "user_full_name": time_per_op(lambda: user.full_name),
+        "user_full_name_without_patronymic": time_per_op(lambda: user_without_patronymic.full_name),
+        "user_short_full_name": time_per_op(lambda: user.short_full_name),
+    }
+
+
+async def main(groups: list[str], requests: int, rows: int) -> dict[str, Any]:
+    """
+    Запуск выбранных групп микро-бенчмарков
+
+    Args:
+        groups (list[str]): группы из GROUPS
+        requests (int): количество запросов на вариант middleware
+        rows (int): количество строк для гидратации
+
+    Returns:
+        dict[str, Any]: сведения о запуске и результаты по группам
+    """
+    report: dict[str, Any] = {"environment": run_environment(), "config": {"requests": requests, "rows": rows}}
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if "middleware" in groups:
+            report["middleware"] = await bench_middleware(requests, Path(work_dir))
+
+    if "orm" in groups:
+        report["orm"] = bench_orm(rows)
+
+    if "models" in groups:
+        report["models"] = bench_models()
+
+    return report
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--only", choices=GROUPS, action="append", help="группа бенчмарков, можно несколько")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--output", type=Path, default=None)
+    args: argparse.Namespace = parser.parse_args()
+
+    write_report(asyncio.run(main(args.only or list(GROUPS), args.requests, args.rows)), args.output)
@@ -0,0 +1,245 @@
+"""
+Масштабирование пропускной способности сервера от одного воркера до количества ядер
+
+Для каждого количества воркеров запускается сервер через commands.serve, на него подается нагрузка
+из нескольких процессов (один процесс asyncio упирается в одно ядро раньше сервера), затем сервер
+останавливается. Количество одновременных запросов и запросов в замере растет вместе с воркерами.
+Генератор нагрузки работает на той же машине и делит с сервером ядра: на машине с N ядрами
+ускорение на N воркерах ниже линейного и без накладных расходов сервера.
+
+Examples:
+    python -m benchmarks.scaling --token <токен сессии> --output scaling.json
+    python -m benchmarks.scaling --path / --workers 1 --workers 2 --workers 4 --clients 4
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import asyncio
+import signal
+import subprocess
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from benchmarks.common import run_environment, summarize, write_report
+from benchmarks.load import DEFAULT_PATHS, run_load
+from core.server import available_cpus
+
+# Время ожидания готовности сервера в секундах
+SERVER_START_TIMEOUT: float = 60.0
+# Время на запуск остальных воркеров после ответа первого в секундах: воркеры запускаются параллельно
+WORKER_START_GRACE: float = 3.0
+
+
+def _default_workers() -> list[int]:
+    cpus: int = available_cpus()
+    return sorted({1, cpus} | {2**power for power in range(cpus.bit_length()) if 2**power < cpus})
+
+
+def _client(
+    base_url: str, token: str | None, paths: list[str], concurrency: int, requests: int, warmup: int
+) -> tuple[float, dict[str, list[float]], Counter[str]]:
+    async def run() -> tuple[float, dict[str, list[float]], Counter[str]]:
+        headers: dict[str, str] = {"Authorization": f"Bearer {token}"} if token else {}
+        limits: httpx.Limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+        async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30.0) as client:
+            await run_load(client, paths, concurrency, warmup)
+            return await run_load(client, paths, concurrency, requests)
+
+    return asyncio.run(run())
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    """
+    Запуск сервера и ожидание готовности всех воркеров
+
+    Args:
+        workers (int): количество воркеров
+        port (int): порт сервера на 127.0.0.1
+
+    Returns:
+        subprocess.Popen: процесс сервера
+
+    Raises:
+        RuntimeError: сервер не ответил за SERVER_START_TIMEOUT
+    """
+    server: subprocess.Popen = subprocess.Popen(
+        [sys.executable, "-m", "commands.serve", "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline: float = time.monotonic() + SERVER_START_TIMEOUT
+
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/", timeout=1.0)
+            time.sleep(WORKER_START_GRACE)
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+
+    stop_server(server)
+    raise RuntimeError(f"Server with {workers} workers did not start in {SERVER_START_TIMEOUT} s")
+
+
+def stop_server(server: subprocess.Popen) -> None:
+    """
+    Остановка сервера с завершением начатых запросов
+
+    Args:
+        server (subprocess.Popen): процесс сервера
+    """
+    server.send_signal(signal.SIGTERM)
+
+    try:
+        server.wait(SERVER_START_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        server.kill()
+        server.wait()
+
+
+def measure(
+    workers: int,
+    port: int,
+    token: str | None,
+    paths: list[str],
+    clients: int,
+    concurrency: int,
+    requests: int,
+    warmup: int,
+) -> dict[str, Any]:
+    """
+    Замер пропускной способности сервера с заданным количеством воркеров
+
+    Args:
+        workers (int): количество воркеров
+        port (int): порт сервера
+        token (str | None): токен сессии для заголовка Authorization
+        paths (list[str]): маршруты, запрашиваемые по кругу
+        clients (int): количество процессов генератора нагрузки
+        concurrency (int): количество одновременных запросов на один воркер
+        requests (int): количество замеряемых запросов на один воркер
+        warmup (int): количество запросов прогрева на один воркер
+
+    Returns:
+        dict[str, Any]: пропускная способность, распределение задержек и коды ответов
+    """
+    server: subprocess.Popen = start_server(workers, port)
+
+    try:
+        with ProcessPoolExecutor(clients) as executor:
+            results: list[tuple[float, dict[str, list[float]], Counter[str]]] = list(
+                executor.map(
+                    _client,
+                    [f"http://127.0.0.1:{port}"] * clients,
+                    [token] * clients,
+                    [paths] * clients,
+                    [max(1, workers * concurrency // clients)] * clients,
+                    [workers * requests // clients] * clients,
+                    [workers * warmup // clients] * clients,
+                )
+            )
+    finally:
+        stop_server(server)
+
+    duration: float = max(result[0] for result in results)
+    latencies: list[float] = [
+        latency for result in results for path_latencies in result[1].values() for latency in path_latencies
+    ]
+    statuses: Counter[str] = sum((result[2] for result in results), Counter())
+
+    return {
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(latencies) / duration, 1) if duration else 0.0,
+        "latency": summarize(latencies, "ms"),
+        "statuses": dict(sorted(statuses.items())),
+    }
+
+
+def main(
+    workers: list[int],
+    port: int,
+    token: str | None,
+    paths: list[str],
+    clients: int,
+    concurrency: int,
+    requests: int,
+    warmup: int,
+) -> dict[str, Any]:
+    """
+    Замеры для каждого количества воркеров и ускорение относительно первого замера
+
+    Args:
+        workers (list[int]): количества воркеров по возрастанию
+        port (int): порт сервера
+        token (str | None): токен сессии для заголовка Authorization
+        paths (list[str]): маршруты, запрашиваемые по кругу
+        clients (int): количество процессов генератора нагрузки
+        concurrency (int): количество одновременных запросов на один воркер
+        requests (int): количество замеряемых запросов на один воркер
+        warmup (int): количество запросов прогрева на один воркер
+
+    Returns:
+        dict[str, Any]: сведения о запуске и результаты по количеству воркеров. efficiency - ускорение,
+        деленное на отношение количества воркеров
+    """
+    results: dict[str, dict[str, Any]] = {}
+
+    for count in workers:
+        results[str(count)] = measure(count, port, token, paths, clients, concurrency, requests, warmup)
+
+    baseline: dict[str, Any] = results[str(workers[0])]
+
+    for count in workers:
+        result: dict[str, Any] = results[str(count)]
+        speedup: float = result["throughput_rps"] / baseline["throughput_rps"] if baseline["throughput_rps"] else 0.0
+        result["speedup"] = round(speedup, 2)
+        result["efficiency"] = round(speedup * workers[0] / count, 2)
+
+    return {
+        "environment": {**run_environment(), "available_cpus": available_cpus()},
+        "config": {
+            "workers": workers,
+            "paths": paths,
+            "clients": clients,
+            "concurrency_per_worker": concurrency,
+            "requests_per_worker": requests,
+            "warmup_per_worker": warmup,
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, action="append", help="количество воркеров, можно несколько")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--token", default=None)
+    parser.add_argument("--path", action="append", help="маршрут с параметрами, можно несколько")
+    parser.add_argument("--clients", type=int, default=4, help="процессы генератора нагрузки")
+    parser.add_argument("--concurrency", type=int, default=16, help="одновременных запросов на воркер")
+    parser.add_argument("--requests", type=int, default=2000, help="запросов на воркер")
+    parser.add_argument("--warmup", type=int, default=200, help="запросов прогрева на воркер")
+    parser.add_argument("--output", type=Path, default=None)
+    args: argparse.Namespace = parser.parse_args()
+
+    write_report(
+        main(
+            sorted(args.workers or _default_workers()),
+            args.port,
+            args.token,
+            args.path or list(DEFAULT_PATHS),
+            args.clients,
+            args.concurrency,
+            args.requests,
+            args.warmup,
+        ),
+        args.output,
+    )
@@ -0,0 +1,3 @@
+"""Пакет консольных команд обслуживания приложения"""
+
+__author__: str = "Digital Horizons"
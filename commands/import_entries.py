@@ -0,0 +1,74 @@
+"""
+Команда импорта истории записей настроения из файла
+
+Examples:
+    Импорт CSV:
+        python -m commands.import_entries --user-id 1 entries.csv
+
+    Импорт NDJSON с публикацией для друзей:
+        python -m commands.import_entries --user-id 1 --format ndjson --status only_friends entries.ndjson
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import asyncio
+import time
+from pathlib import Path
+from typing import AsyncIterator
+
+from consts.mood_entry import MoodEntryPublishStatus
+from consts.mood_entry_import import ImportFormat
+from core.database import engine
+from logger import app_logger, setup_logger
+from mood_entries import import_entries
+
+# Размер читаемой из файла части
+_READ_CHUNK_SIZE: int = 1024 * 1024
+
+
+async def _read_file(path: Path) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := await asyncio.to_thread(file.read, _READ_CHUNK_SIZE):
+            yield chunk
+
+
+async def main(
+    path: Path, user_id: int, import_format: ImportFormat, default_status: MoodEntryPublishStatus
+) -> None:
+    """
+    Импорт файла с выводом прогресса в лог
+
+    Args:
+        path (Path): путь к файлу
+        user_id (int): идентификатор пользователя, которому принадлежат записи
+        import_format (ImportFormat): формат файла
+        default_status (MoodEntryPublishStatus): статус записей без явно указанного статуса
+    """
+    start_time: float = time.perf_counter()
+
+    async for progress in import_entries(_read_file(path), import_format, user_id, default_status):
+        for error in progress.errors:
+            app_logger.bind(line=error.line).warning(error.error)
+
+        app_logger.bind(
+            processed=progress.processed,
+            imported=progress.imported,
+            failed=progress.failed,
+            process_time=round(time.perf_counter() - start_time, 4),
+        ).info("Mood entries import finished" if progress.done else "Mood entries import progress")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    setup_logger()
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--format", dest="import_format", type=ImportFormat, default=ImportFormat.CSV)
+    parser.add_argument(
+        "--status", type=MoodEntryPublishStatus, default=MoodEntryPublishStatus.FOR_ME
+    )
+    args: argparse.Namespace = parser.parse_args()
+    asyncio.run(main(args.path, args.user_id, args.import_format, args.status))
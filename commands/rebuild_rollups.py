@@ -0,0 +1,46 @@
+"""
+Команда пересборки агрегатов оценок настроения
+
+Examples:
+    Пересборка всех пользователей:
+        python -m commands.rebuild_rollups
+
+    Пересборка отдельных пользователей:
+        python -m commands.rebuild_rollups --user-id 1 --user-id 2
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import asyncio
+import time
+
+from core.database import engine
+from logger import app_logger, setup_logger
+from mood_entries import rebuild_rollups
+
+
+async def main(user_ids: list[int] | None) -> None:
+    """
+    Пересборка агрегатов в одной транзакции
+
+    Args:
+        user_ids (list[int] | None): идентификаторы пользователей. None - все пользователи
+    """
+    start_time: float = time.perf_counter()
+
+    async with engine.begin() as connection:
+        await connection.run_sync(rebuild_rollups, user_ids)
+
+    await engine.dispose()
+
+    app_logger.bind(user_ids=user_ids, process_time=round(time.perf_counter() - start_time, 4)).info(
+        "Mood score rollups rebuilt"
+    )
+
+
+if __name__ == "__main__":
+    setup_logger()
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--user-id", dest="user_ids", type=int, action="append")
+    asyncio.run(main(parser.parse_args().user_ids))
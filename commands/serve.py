@@ -0,0 +1,152 @@
+"""
+Команда запуска сервера приложения с несколькими воркерами
+
+Воркеров по умолчанию столько, сколько ядер доступно процессу. Если установлены uvloop и httptools,
+используются они. Пул подключений воркера ограничивается общим бюджетом DB_CONNECTION_BUDGET.
+
+Examples:
+    Запуск с настройками из окружения:
+        python -m commands.serve
+
+    Запуск четырех воркеров с файлом идентификатора процесса:
+        python -m commands.serve --workers 4 --pid-file /run/mood-tracker.pid
+
+    Плавный перезапуск воркеров по одному, например после обновления кода:
+        kill -HUP $(cat /run/mood-tracker.pid)
+
+Notes:
+    При SIGHUP каждый воркер заменяется новым только после того, как новый начал принимать запросы,
+    а старый завершает начатые запросы в пределах SERVER_GRACEFUL_TIMEOUT. Новые воркеры заново
+    читают код и настройки.
+
+    Пул подключений воркера рассчитывается при запуске на заданное количество воркеров и один
+    воркер-замену. Каждый воркер, добавленный сигналом SIGTTIN, открывает подключения сверх
+    DB_CONNECTION_BUDGET, поэтому количество воркеров меняется перезапуском сервера с --workers
+
+    Родительский процесс не создает приложение и не подключается к БД: это делает каждый воркер
+"""
+
+__author__: str = "Digital Horizons"
+
+import argparse
+import os
+from pathlib import Path
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from consts.server import SERVER_APP
+from core.config import settings
+from core.server import (
+    available_cpus,
+    event_loop_implementation,
+    http_implementation,
+    max_backlog,
+    worker_pool_limits,
+)
+from logger import app_logger, log_pipeline, setup_logger
+from metrics import metrics_registry
+
+
+def configure_worker_pools(workers: int) -> tuple[int, int]:
+    """
+    Ограничение пула подключений воркеров бюджетом подключений к БД
+
+    Args:
+        workers (int): количество воркеров
+
+    Returns:
+        tuple[int, int]: размер пула и количество подключений сверх пула одного воркера
+
+    Notes:
+        Ограничения передаются воркерам через переменные окружения DB_POOL_SIZE и DB_POOL_MAX_OVERFLOW.
+        Они действуют и на пулы реплик: бюджет задается на один сервер БД
+    """
+    if not settings.DB_CONNECTION_BUDGET:
+        return settings.DB_POOL_SIZE, settings.DB_POOL_MAX_OVERFLOW
+
+    pool_size, max_overflow = worker_pool_limits(
+        settings.DB_CONNECTION_BUDGET, workers, settings.DB_POOL_SIZE, settings.DB_POOL_MAX_OVERFLOW
+    )
+    os.environ["DB_POOL_SIZE"] = str(pool_size)
+    os.environ["DB_POOL_MAX_OVERFLOW"] = str(max_overflow)
+    return pool_size, max_overflow
+
+
+def main(host: str, port: int, workers: int, pid_file: Path | None) -> None:
+    """
+    Запуск воркеров и наблюдение за ними до остановки сервера
+
+    Args:
+        host (str): адрес, на котором сервер принимает подключения
+        port (int): порт сервера
+        workers (int): количество воркеров
+        pid_file (Path | None): файл для идентификатора родительского процесса
+
+    Raises:
+        SystemExit: файл метрик занят воркерами другого сервера
+    """
+    pool_size, max_overflow = configure_worker_pools(workers)
+    backlog_limit: int | None = max_backlog()
+
+    if backlog_limit is not None and backlog_limit < settings.SERVER_BACKLOG:
+        app_logger.warning(
+            f"SERVER_BACKLOG {settings.SERVER_BACKLOG} is limited by net.core.somaxconn {backlog_limit}"
+        )
+
+    # Файл с живыми воркерами принадлежит другому серверу: его счетчики не сбрасываются
+    if metrics_registry.storage.in_use():
+        raise SystemExit(f"METRICS_FILE {settings.METRICS_FILE} is used by another server, set a different path")
+
+    # Значения метрик прошлого запуска сервера не переносятся. Воркеры создадут файл заново
+    settings.METRICS_FILE.unlink(missing_ok=True)
+
+    config: uvicorn.Config = uvicorn.Config(
+        SERVER_APP,
+        factory=True,
+        host=host,
+        port=port,
+        workers=workers,
+        loop=event_loop_implementation(),
+        http=http_implementation(),
+        lifespan="on",
+        # Запросы логирует middleware приложения с выборкой, журнал uvicorn дублировал бы каждый запрос
+        access_log=False,
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT,
+    )
+
+    app_logger.bind(
+        host=host,
+        port=port,
+        workers=workers,
+        loop=config.loop,
+        http=config.http,
+        db_pool_size=pool_size,
+        db_pool_max_overflow=max_overflow,
+    ).info("Starting server")
+
+    if pid_file:
+        pid_file.write_text(str(os.getpid()))
+
+    try:
+        Multiprocess(config, sockets=[config.bind_socket()]).run()
+    finally:
+        if pid_file:
+            pid_file.unlink(missing_ok=True)
+
+        app_logger.info("Server stopped")
+        log_pipeline.stop()
+
+
+if __name__ == "__main__":
+    setup_logger()
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default=settings.SERVER_HOST)
+    parser.add_argument("--port", type=int, default=settings.SERVER_PORT)
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS, help="0 - по количеству ядер")
+    parser.add_argument("--pid-file", type=Path, default=None)
+    args: argparse.Namespace = parser.parse_args()
+
+    main(args.host, args.port, args.workers or available_cpus(), args.pid_file)
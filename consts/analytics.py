@@ -0,0 +1,24 @@
+"""Константы аналитики истории оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+# Количество секунд в сутках: дни считаются в UTC, как в агрегатах оценок
+SECONDS_PER_DAY: int = 86400
+# Количество секунд в часе
+SECONDS_PER_HOUR: int = 3600
+# День недели 1 января 1970 года (понедельник - 0)
+EPOCH_WEEKDAY: int = 3
+# Окно скользящего среднего по умолчанию в днях
+DEFAULT_ROLLING_WINDOW: int = 7
+# Максимальное окно скользящего среднего в днях
+MAX_ROLLING_WINDOW: int = 365
+# Коэффициент сглаживания экспоненциального среднего по умолчанию
+DEFAULT_EWMA_ALPHA: float = 0.3
+# Количество последних дней в ответе по умолчанию
+DEFAULT_ANALYTICS_DAYS: int = 90
+# Максимальное количество последних дней в ответе
+MAX_ANALYTICS_DAYS: int = 3660
+# Наибольший десятичный порядок множителей в блоке расчета экспоненциального среднего
+EWMA_MAX_EXPONENT: int = 100
+# Количество знаков после запятой в средних значениях ответа
+ANALYTICS_PRECISION: int = 3
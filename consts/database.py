@@ -0,0 +1,28 @@
+"""Константы для работы с базой данных"""
+
+__author__: str = "Digital Horizons"
+
+# Границы корзин гистограммы ожидания подключения из пула (в миллисекундах)
+POOL_WAIT_BUCKETS_MS: tuple[float, ...] = (
+    1.0,
+    5.0,
+    10.0,
+    25.0,
+    50.0,
+    100.0,
+    250.0,
+    500.0,
+    1000.0,
+    2500.0,
+    5000.0,
+)
+# Максимальная длина текста самого медленного запроса в логе запроса
+SLOWEST_STATEMENT_MAX_LENGTH: int = 500
+# Количество нормализованных SQL выражений в кэше нормализации
+SQL_FINGERPRINT_CACHE_SIZE: int = 2048
+# Максимальное количество кадров стека в месте вызова повторяющегося выражения
+CALL_SITE_MAX_FRAMES: int = 15
+# Параметр выполнения запроса ORM, отключающий исключение мягко удаленных записей
+INCLUDE_DELETED_OPTION: str = "include_deleted"
+# Количество отметок недавних изменений, после которого истекшие удаляются
+RECENT_CHANGES_COMPACT_SIZE: int = 1024
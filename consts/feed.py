@@ -0,0 +1,22 @@
+"""Константы для работы с лентой записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from consts.mood_entry import MoodEntryPublishStatus
+
+# Размер страницы ленты по умолчанию
+FEED_PAGE_SIZE: int = 20
+# Максимальный размер страницы ленты
+MAX_FEED_PAGE_SIZE: int = 100
+
+# Статусы, при которых запись видна всем друзьям автора
+FRIENDS_STATUSES: frozenset[MoodEntryPublishStatus] = frozenset(
+    {MoodEntryPublishStatus.ONLY_FRIENDS, MoodEntryPublishStatus.FOR_ALL}
+)
+# Статусы, при которых запись видна друзьям автора, кроме перечисленных в видимости пользователей
+FRIENDS_EXCLUDED_STATUSES: frozenset[MoodEntryPublishStatus] = frozenset(
+    {
+        MoodEntryPublishStatus.ONLY_FRIEND_EXCLUDED_USER,
+        MoodEntryPublishStatus.FOR_ALL_EXCLUDED_USER,
+    }
+)
@@ -4,6 +4,11 @@ __author__: str = "Digital Horizons"
 
 from enum import StrEnum
 
+# Количество рекомендаций друзей по умолчанию
+FRIEND_SUGGESTIONS_LIMIT: int = 20
+# Максимальное количество рекомендаций друзей
+MAX_FRIEND_SUGGESTIONS_LIMIT: int = 100
+
 
 class FriendshipStatus(StrEnum):
     """
@@ -0,0 +1,8 @@
+"""Константы для условных GET запросов и кэша ответов"""
+
+__author__: str = "Digital Horizons"
+
+# Ответ хранится только на клиенте и перед использованием проверяется на сервере по ETag
+CONDITIONAL_CACHE_CONTROL: str = "private, no-cache"
+# Размер хэша в ETag в байтах
+ETAG_DIGEST_SIZE: int = 12
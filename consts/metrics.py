@@ -0,0 +1,36 @@
+"""Константы для метрик приложения"""
+
+__author__: str = "Digital Horizons"
+
+# Границы корзин гистограммы времени обработки HTTP запроса (в секундах)
+HTTP_DURATION_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# Границы корзин гистограммы времени выполнения SQL выражения (в секундах)
+DB_QUERY_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+# Значение метки route для запросов, не попавших ни в один маршрут
+UNMATCHED_ROUTE: str = "<unmatched>"
+# Тип содержимого текстового формата Prometheus
+PROMETHEUS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
@@ -1,5 +1,10 @@
 from enum import StrEnum
 
+# Размер страницы истории записей по умолчанию
+PAGE_SIZE: int = 20
+# Максимальный размер страницы истории записей
+MAX_PAGE_SIZE: int = 100
+
 
 class MoodEntryPublishStatus(StrEnum):
     """
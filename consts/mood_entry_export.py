@@ -0,0 +1,43 @@
+"""Константы для выгрузки записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from enum import StrEnum
+
+# Количество записей, читаемых одним серверным курсором. Между окнами подключение возвращается в пул
+EXPORT_WINDOW_SIZE: int = 5000
+# Количество строк, получаемых из курсора за одно обращение и отправляемых клиенту одной частью
+EXPORT_FETCH_SIZE: int = 500
+# Колонки CSV выгрузки. Совпадают с колонками импорта, чтобы выгрузку можно было загрузить обратно
+EXPORT_CSV_COLUMNS: list[str] = [
+    "id",
+    "created_at",
+    "updated_at",
+    "score",
+    "description",
+    "status",
+    "tags",
+    "visible_user_ids",
+]
+
+
+class ExportFormat(StrEnum):
+    """
+    Форматы выгрузки записей настроения
+
+    Attributes:
+        CSV (str): CSV с заголовком, теги и пользователи видимости перечислены через разделитель
+        NDJSON (str): по одному JSON объекту на строку
+
+    Examples:
+        >>> export_format: ExportFormat = ExportFormat("ndjson")
+        >>> print(export_format.media_type) # application/x-ndjson
+    """
+
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        """MIME тип выгрузки"""
+        return "text/csv" if self == ExportFormat.CSV else "application/x-ndjson"
@@ -0,0 +1,36 @@
+"""Константы для импорта записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from enum import StrEnum
+
+# Количество строк, загружаемых в БД одной транзакцией
+IMPORT_BATCH_SIZE: int = 5000
+# Максимальное количество ошибок строк в отчете импорта
+MAX_IMPORT_ERRORS: int = 1000
+# Размер тела запроса импорта в байтах, до которого оно хранится в памяти, а не во временном файле
+IMPORT_SPOOL_MAX_MEMORY: int = 8 * 1024 * 1024
+# Размер части тела запроса импорта в байтах, читаемой из временного файла
+IMPORT_READ_CHUNK_SIZE: int = 64 * 1024
+# Разделитель тегов в колонке tags CSV файла
+CSV_TAGS_SEPARATOR: str = ";"
+# Минимальное и максимальное значения оценки (диапазон SmallInteger)
+MIN_SCORE: int = -32768
+MAX_SCORE: int = 32767
+
+
+class ImportFormat(StrEnum):
+    """
+    Форматы файлов импорта записей настроения
+
+    Attributes:
+        CSV (str): CSV с заголовком created_at,score,description,status,tags
+        NDJSON (str): по одному JSON объекту с теми же полями на строку, tags - список строк
+
+    Examples:
+        >>> import_format: ImportFormat = ImportFormat("csv")
+        >>> print(import_format == ImportFormat.CSV) # True
+    """
+
+    CSV = "csv"
+    NDJSON = "ndjson"
@@ -0,0 +1,30 @@
+"""Константы для работы с агрегатами оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+from enum import StrEnum
+
+
+class RollupPeriod(StrEnum):
+    """
+    Периоды агрегации оценок настроения
+
+    Attributes:
+        DAY (str): календарный день
+        WEEK (str): ISO неделя, начинается с понедельника
+        MONTH (str): календарный месяц
+
+    Examples:
+        >>> from datetime import date
+        >>> from mood_entries.rollups import period_start
+        >>>
+        >>> period_start(RollupPeriod.WEEK, date(2025, 11, 6)) # date(2025, 11, 3)
+    """
+
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+# Максимальное количество периодов в одном ответе статистики
+MAX_STATS_PERIODS: int = 1000
@@ -0,0 +1,14 @@
+"""Константы для запуска сервера приложения"""
+
+__author__: str = "Digital Horizons"
+
+from pathlib import Path
+
+# Приложение, которое uvicorn создает в каждом воркере
+SERVER_APP: str = "main:create_app"
+# Квота процессора контейнера (cgroup v2): "<квота> <период>" или "max <период>"
+CGROUP_CPU_MAX_PATH: Path = Path("/sys/fs/cgroup/cpu.max")
+# Верхний предел очереди ожидающих подключений сокета в ядре Linux
+SOMAXCONN_PATH: Path = Path("/proc/sys/net/core/somaxconn")
+# Воркеры-замены, одновременно работающие со старыми при плавном перезапуске
+ROLLING_RESTART_SPARE_WORKERS: int = 1
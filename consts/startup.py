@@ -0,0 +1,6 @@
+"""Константы для профиля запуска приложения"""
+
+__author__: str = "Digital Horizons"
+
+# Количество самых долгих импортов в профиле запуска
+STARTUP_PROFILE_TOP_MODULES: int = 30
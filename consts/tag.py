@@ -2,7 +2,37 @@
 
 __author__: str = "Digital Horizons"
 
+from enum import StrEnum
+
 # Максимальная длина названия тега
 MAX_TAG_NAME_LENGTH: int = 50
 # Максимальная длинна для строки с цветом
-MAX_COLOR_LENGTH: int = 25
\ No newline at end of file
+MAX_COLOR_LENGTH: int = 25
+# Цвет тегов, созданных без явного указания цвета
+DEFAULT_TAG_COLOR: str = "gray"
+# Количество подсказок автодополнения тегов по умолчанию
+TAG_AUTOCOMPLETE_LIMIT: int = 10
+# Максимальное количество подсказок автодополнения тегов
+MAX_TAG_AUTOCOMPLETE_LIMIT: int = 50
+# Максимальное количество тегов пользователя в индексе воркера. Больше - поиск идет в БД
+TAG_INDEX_MAX_TAGS: int = 5000
+# Максимальное количество тегов в фильтре записей
+MAX_FILTER_TAGS: int = 20
+
+
+class TagMatch(StrEnum):
+    """
+    Способы отбора записей по нескольким тегам
+
+    Attributes:
+        ANY (str): запись отмечена хотя бы одним из тегов
+        ALL (str): запись отмечена всеми тегами
+
+    Examples:
+        >>> from mood_entries import tagged_entries_clause
+        >>>
+        >>> clause = tagged_entries_clause([1, 2], TagMatch.ALL)
+    """
+
+    ANY = "any"
+    ALL = "all"
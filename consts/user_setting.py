@@ -3,6 +3,8 @@ from enum import StrEnum
 MAX_LENGTH_NAME_AND_VALUE: int = 50
 MAX_TYPE_LENGTH: int = 10
 DEFAULT_TYPE: str = "str"
+# Количество пользователей в одном запросе пакетной загрузки настроек
+SETTINGS_LOAD_CHUNK_SIZE: int = 1000
 
 
 class UserSettingType(StrEnum):
@@ -0,0 +1,139 @@
+"""Модуль внутрипроцессного кэша"""
+
+__author__: str = "Digital Horizons"
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, TypeVar
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+ValueType = TypeVar("ValueType")
+
+
+class TTLCache(Generic[KeyType, ValueType]):
+    """
+    LRU кэш с ограничением времени жизни записей
+
+    Attributes:
+        maxsize (int): максимальное количество записей. При превышении вытесняются давно не используемые
+        ttl (float): время жизни записи в секундах
+        hits (int): количество попаданий в кэш
+        misses (int): количество промахов кэша
+
+    Examples:
+        >>> cache: TTLCache[str, int] = TTLCache(maxsize=1000, ttl=60)
+        >>> cache.set("answer", 42)
+        >>> print(cache.get("answer")) # 42
+        >>> cache.pop("answer")
+        >>> print(cache.get("answer")) # None
+
+    Notes:
+        Кэш не потокобезопасен и рассчитан на работу из одного event loop воркера
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.hits: int = 0
+        self.misses: int = 0
+        self._data: OrderedDict[KeyType, tuple[float, ValueType]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: KeyType) -> bool:
+        return self.get(key) is not None
+
+    def get(self, key: KeyType) -> ValueType | None:
+        """
+        Получение значения из кэша
+
+        Args:
+            key (KeyType): ключ записи
+
+        Returns:
+            ValueType | None: значение или None, если записи нет или она устарела
+        """
+        item: tuple[float, ValueType] | None = self._data.get(key)
+
+        if item is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = item
+
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def peek(self, key: KeyType) -> ValueType | None:
+        """
+        Получение значения без учета в статистике и без изменения порядка вытеснения
+
+        Args:
+            key (KeyType): ключ записи
+
+        Returns:
+            ValueType | None: значение или None, если записи нет или она устарела
+        """
+        item: tuple[float, ValueType] | None = self._data.get(key)
+
+        if item is None or item[0] <= time.monotonic():
+            return None
+
+        return item[1]
+
+    def set(self, key: KeyType, value: ValueType, ttl: float | None = None) -> None:
+        """
+        Сохранение значения в кэш
+
+        Args:
+            key (KeyType): ключ записи
+            value (ValueType): значение
+            ttl (float | None): время жизни записи в секундах. По умолчанию - время жизни кэша
+        """
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: KeyType) -> ValueType | None:
+        """
+        Удаление записи из кэша
+
+        Args:
+            key (KeyType): ключ записи
+
+        Returns:
+            ValueType | None: удаленное значение или None, если записи не было
+        """
+        item: tuple[float, ValueType] | None = self._data.pop(key, None)
+        return item[1] if item else None
+
+    def items(self) -> list[tuple[KeyType, ValueType]]:
+        """
+        Все записи кэша без учета времени жизни и без изменения порядка вытеснения
+
+        Returns:
+            list[tuple[KeyType, ValueType]]: пары ключ-значение
+        """
+        return [(key, value) for key, (_, value) in self._data.items()]
+
+    def clear(self) -> None:
+        """Очистка кэша"""
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика использования кэша
+
+        Returns:
+            dict[str, int]: размер кэша, количество попаданий и промахов
+        """
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
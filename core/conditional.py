@@ -0,0 +1,207 @@
+"""Модуль условных GET запросов: ETag и Last-Modified по updated_at записей, ответы 304 и кэш ответов воркера"""
+
+__author__: str = "Digital Horizons"
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Hashable
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from consts.http_cache import CONDITIONAL_CACHE_CONTROL, ETAG_DIGEST_SIZE
+from core.cache import TTLCache
+from core.config import settings
+from models.mixins import TimestampMixin
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceVersion:
+    """
+    Версия набора записей, из которых собирается ответ
+
+    Attributes:
+        last_modified (datetime | None): наибольшее updated_at записей. None - записей нет
+        count (int): количество записей. Меняется при удалении записи, которое не меняет updated_at остальных
+        checksum (Decimal | None): сумма updated_at записей в секундах от начала эпохи. None - записей нет
+
+    Notes:
+        updated_at заполняется временем начала транзакции, поэтому изменение в транзакции, начатой раньше
+        последнего видимого изменения, не увеличивает наибольшее значение. Такое изменение все равно меняет
+        сумму updated_at: она сравнивается точно и не зависит от порядка фиксации транзакций
+    """
+
+    last_modified: datetime | None
+    count: int
+    checksum: Decimal | None
+
+
+async def get_resource_version(
+    session_db: AsyncSession, model: type[TimestampMixin], *where: ColumnElement[bool]
+) -> ResourceVersion:
+    """
+    Версия записей модели одним агрегирующим запросом без загрузки самих записей
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        model (type[TimestampMixin]): модель с метками времени
+        *where (ColumnElement[bool]): условия выборки записей ответа
+
+    Returns:
+        ResourceVersion: наибольшее updated_at, количество записей и сумма updated_at
+
+    Examples:
+        >>> version: ResourceVersion = await get_resource_version(
+        ...     session_db, MoodEntryModel, MoodEntryModel.user_id == user_id
+        ... )
+    """
+    # Агрегаты только по updated_at: запрос остается index-only по индексам с updated_at
+    last_modified, count, checksum = (
+        await session_db.execute(
+            select(
+                func.max(model.updated_at), func.count(), func.sum(func.extract("epoch", model.updated_at))
+            )
+            .select_from(model)
+            .where(*where)
+        )
+    ).one()
+    return ResourceVersion(last_modified, count, checksum)
+
+
+class ResponseCache:
+    """
+    Кэш тел ответов воркера по ETag
+
+    Attributes:
+        enabled (bool): кэш включен. Размер 0 в настройках отключает кэш
+        cache (TTLCache[str, bytes]): тела ответов по ETag
+
+    Examples:
+        >>> body: bytes | None = response_cache.get(etag)
+
+    Notes:
+        ETag включает адрес запроса, пользователя и версию записей, поэтому изменение данных не требует
+        инвалидации: ответ с устаревшей версией больше не запрашивается и вытесняется
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.enabled: bool = maxsize > 0
+        self.cache: TTLCache[str, bytes] = TTLCache(maxsize, ttl)
+
+    def get(self, etag: str) -> bytes | None:
+        """
+        Тело ответа из кэша
+
+        Args:
+            etag (str): ETag ответа
+
+        Returns:
+            bytes | None: тело ответа или None, если его нет в кэше или кэш отключен
+        """
+        return self.cache.get(etag) if self.enabled else None
+
+    def set(self, etag: str, body: bytes) -> None:
+        """
+        Сохранение тела ответа
+
+        Args:
+            etag (str): ETag ответа
+            body (bytes): тело ответа
+        """
+        if self.enabled:
+            self.cache.set(etag, body)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика использования кэша
+
+        Returns:
+            dict[str, int]: размер кэша, количество попаданий и промахов
+        """
+        return self.cache.stats()
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    if_none_match: str | None = request.headers.get("if-none-match")
+
+    # При наличии If-None-Match заголовок If-Modified-Since не проверяется (RFC 9110, 13.2.2)
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+
+        # Слабое сравнение: префикс W/ не учитывается
+        return etag.removeprefix("W/") in {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+
+    if_modified_since: str | None = request.headers.get("if-modified-since")
+
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since: datetime = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    return last_modified.replace(microsecond=0) <= since
+
+
+async def conditional_response(
+    request: Request,
+    version: ResourceVersion,
+    render: Callable[[], Awaitable[BaseModel]],
+    *scope: Hashable,
+) -> Response:
+    """
+    Ответ на GET запрос с проверкой валидаторов клиента
+
+    Args:
+        request (Request): запрос
+        version (ResourceVersion): версия записей, из которых собирается ответ
+        render (Callable[[], Awaitable[BaseModel]]): получение тела ответа. Вызывается, только если у клиента
+            нет актуальной версии и ее нет в кэше ответов
+        *scope (Hashable): все, кроме адреса запроса и версии записей, от чего зависит ответ, например пользователь
+
+    Returns:
+        Response: 304 без тела, если версия клиента актуальна, иначе JSON ответ с ETag и Last-Modified
+
+    Examples:
+        >>> version: ResourceVersion = await get_user_entries_version(session_db, identity.user_id)
+        >>>
+        >>> async def render() -> MoodEntryPageSchema:
+        ...     ...
+        >>>
+        >>> return await conditional_response(request, version, render, identity.user_id)
+
+    Notes:
+        ETag слабый: ответ совпадает по смыслу, а не побайтно. Last-Modified имеет точность в секунду и не
+        отражает удаление записей, поэтому If-Modified-Since проверяется, только если клиент не прислал ETag
+    """
+    key: tuple = (request.url.path, request.url.query, version.last_modified, version.count, version.checksum, scope)
+    etag: str = 'W/"{}"'.format(hashlib.blake2b(repr(key).encode(), digest_size=ETAG_DIGEST_SIZE).hexdigest())
+    headers: dict[str, str] = {"ETag": etag, "Cache-Control": CONDITIONAL_CACHE_CONTROL, "Vary": "Authorization"}
+
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(version.last_modified.astimezone(timezone.utc), usegmt=True)
+
+    if _is_not_modified(request, etag, version.last_modified):
+        return Response(status_code=304, headers=headers)
+
+    body: bytes | None = response_cache.get(etag)
+
+    if body is None:
+        body = (await render()).model_dump_json().encode()
+        response_cache.set(etag, body)
+
+    return Response(body, media_type="application/json", headers=headers)
+
+
+# Глобальный кэш ответов воркера
+response_cache: ResponseCache = ResponseCache(settings.RESPONSE_CACHE_SIZE, settings.RESPONSE_CACHE_TTL)
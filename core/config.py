@@ -2,6 +2,8 @@
 
 __author__: str = "Digital Horizons"
 
+from pathlib import Path
+from tempfile import gettempdir
 from typing import Literal
 
 from pydantic import PostgresDsn
@@ -15,10 +17,65 @@ class Settings(BaseSettings):
     Attributes:
         APP_NAME (str): название приложения
         DEBUG (bool): режим отладки приложения
+        STARTUP_PROFILE (bool): запись в лог времени импорта модулей и шагов инициализации при запуске воркера
         LOG_LEVEL (str): порог логирования сообщений
         LOG_FILE_FORMAT (str): формат логов
+        LOG_QUEUE_SIZE (int): максимальное количество записей в очереди логов. При переполнении записи отбрасываются
+        LOG_BATCH_SIZE (int): максимальное количество записей, записываемых фоновым писателем за раз
+        LOG_FLUSH_INTERVAL (float): максимальное время накопления пачки логов перед записью в секундах
+        HTTP_LOG_SAMPLE_RATE (float): доля запросов, попадающих в журнал HTTP запросов, по умолчанию
+        HTTP_LOG_ROUTE_SAMPLE_RATES (dict[str, float]): доли запросов по путям. Путь с "*" на конце - префикс
+        HTTP_LOG_EXCLUDE_PATHS (list[str]): пути запросов, которые не логируются. Путь с "*" на конце - префикс
+        HTTP_LOG_SLOW_REQUEST_MS (float): время обработки, после которого запрос логируется всегда
+        HTTP_LOG_ERROR_STATUS (int): код ответа, начиная с которого запрос логируется всегда
+        HTTP_LOG_COMBINED (bool): одна запись на запрос вместо записей о начале и завершении
+        SERVER_HOST (str): адрес, на котором сервер принимает подключения
+        SERVER_PORT (int): порт сервера
+        SERVER_WORKERS (int): количество воркеров сервера. 0 - по количеству доступных ядер
+        SERVER_BACKLOG (int): длина очереди ожидающих подключений сокета. Ограничена net.core.somaxconn
+        SERVER_KEEP_ALIVE (int): время удержания простаивающего keep-alive подключения в секундах. Больше таймаута балансировщика
+        SERVER_GRACEFUL_TIMEOUT (int): время завершения обрабатываемых запросов при остановке воркера в секундах
         DB_URL (PostgresDsn): адрес для подключения к БД
+        DB_CONNECTION_BUDGET (int): общее количество подключений к БД всех воркеров сервера. 0 - без ограничения
+        DB_POOL_SIZE (int): количество постоянных подключений в пуле одного воркера
+        DB_POOL_MAX_OVERFLOW (int): количество подключений сверх размера пула
+        DB_POOL_TIMEOUT (float): время ожидания свободного подключения в секундах
+        DB_POOL_RECYCLE (int): время жизни подключения в секундах до его пересоздания
+        DB_POOL_PRE_PING (bool): проверка подключения перед выдачей из пула
+        DB_STATEMENT_CACHE_SIZE (int): размер кэша подготовленных выражений asyncpg
+        DB_POOL_SLOW_CHECKOUT_MS (float): порог ожидания подключения для записи предупреждения в лог
+        DB_POOL_STATS_LOG_INTERVAL (int): период записи статистики пула в лог в секундах. 0 - отключено
+        DB_REPLICA_URLS (list[PostgresDsn]): адреса реплик БД для запросов только на чтение
+        DB_REPLICA_HEALTH_CHECK_INTERVAL (int): период проверки доступности реплик в секундах
+        DB_REPLICA_HEALTH_CHECK_TIMEOUT (float): время ожидания ответа реплики при проверке в секундах
+        DB_READ_YOUR_WRITES_WINDOW (float): время после записи, в течение которого чтение идет с основной БД
+        DB_SLOW_QUERY_MS (float): время выполнения, после которого выражение пишется в журнал медленных. 0 - отключено
+        DB_N_PLUS_ONE_DETECTION (bool): поиск повторяющихся выражений в запросе (N+1) вне режима отладки, например на staging
+        DB_N_PLUS_ONE_THRESHOLD (int): количество одинаковых выражений в запросе, после которого пишется предупреждение
+        METRICS_FILE (Path): файл метрик, общий для воркеров одного сервера
+        METRICS_WORKER_SLOTS (int): максимальное количество воркеров, пишущих метрики в файл
+        METRICS_SLOT_SIZE (int): размер области файла метрик одного воркера в байтах
+        METRICS_COLLECT_INTERVAL (int): период обновления метрик пула подключений и очереди логов в секундах
         SECRET_KEY (str): секретный ключ приложения для генерации защищенных данных
+        INTERNAL_TOKEN (str | None): токен маршрутов /internal и /metrics в заголовке Authorization. None - маршруты отключены
+        AUTH_CACHE_SIZE (int): максимальное количество сессий в кэше аутентификации воркера
+        AUTH_CACHE_TTL (float): время жизни сессии в кэше аутентификации в секундах, в том числе деактивированной в другом воркере
+        FEED_FANOUT_MAX_AUDIENCE (int): количество друзей, после которого записи автора не раскладываются по лентам
+        FEED_BACKFILL_LIMIT (int): количество последних записей друга, добавляемых в ленту при начале дружбы
+        TAG_INDEX_CACHE_SIZE (int): максимальное количество пользователей в кэше автодополнения тегов воркера
+        TAG_INDEX_TTL (float): время жизни индекса тегов пользователя в кэше в секундах
+        FRIEND_GRAPH_CACHE_SIZE (int): максимальное количество пользователей в графе дружбы воркера
+        FRIEND_GRAPH_TTL (float): время жизни списка друзей пользователя в графе в секундах
+        USER_SETTINGS_CACHE_SIZE (int): максимальное количество снимков настроек пользователей в кэше воркера
+        USER_SETTINGS_TTL (float): время жизни снимка настроек пользователя в кэше в секундах
+        RESPONSE_CACHE_SIZE (int): максимальное количество тел ответов условных GET запросов в кэше воркера. 0 - отключено
+        RESPONSE_CACHE_TTL (float): время жизни тела ответа в кэше в секундах
+        ANALYTICS_CACHE_SIZE (int): максимальное количество рядов оценок пользователей в кэше аналитики воркера
+        ANALYTICS_TTL (float): время жизни ряда оценок пользователя в кэше в секундах
+        ENTRY_WRITE_BUFFER (bool): создание записей настроения через буфер групповой записи воркера
+        ENTRY_WRITE_BUFFER_SIZE (int): максимальное количество записей в очереди буфера групповой записи
+        ENTRY_WRITE_BATCH_SIZE (int): максимальное количество записей в одной транзакции буфера
+        ENTRY_WRITE_FLUSH_INTERVAL (float): время накопления пачки буфера в секундах после первой записи
 
     Examples:
         >>> from core.config import settings
@@ -29,11 +86,76 @@ class Settings(BaseSettings):
     APP_NAME: str = "mood-tracker"
 
     DEBUG: bool = False
+    STARTUP_PROFILE: bool = False
     LOG_LEVEL: str = "INFO"
     LOG_FILE_FORMAT: Literal["json", "text"] = "json"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_BATCH_SIZE: int = 500
+    LOG_FLUSH_INTERVAL: float = 0.05
+    HTTP_LOG_SAMPLE_RATE: float = 1.0
+    HTTP_LOG_ROUTE_SAMPLE_RATES: dict[str, float] = {}
+    HTTP_LOG_EXCLUDE_PATHS: list[str] = ["/", "/docs", "/docs/oauth2-redirect", "/redoc", "/openapi.json", "/metrics"]
+    HTTP_LOG_SLOW_REQUEST_MS: float = 1000.0
+    HTTP_LOG_ERROR_STATUS: int = 500
+    HTTP_LOG_COMBINED: bool = True
+
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEP_ALIVE: int = 75
+    SERVER_GRACEFUL_TIMEOUT: int = 30
 
     DB_URL: PostgresDsn
+    DB_CONNECTION_BUDGET: int = 0
+    DB_POOL_SIZE: int = 5
+    DB_POOL_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_POOL_SLOW_CHECKOUT_MS: float = 100.0
+    DB_POOL_STATS_LOG_INTERVAL: int = 60
+    DB_REPLICA_URLS: list[PostgresDsn] = []
+    DB_REPLICA_HEALTH_CHECK_INTERVAL: int = 10
+    DB_REPLICA_HEALTH_CHECK_TIMEOUT: float = 2.0
+    DB_READ_YOUR_WRITES_WINDOW: float = 5.0
+    DB_SLOW_QUERY_MS: float = 500.0
+    DB_N_PLUS_ONE_DETECTION: bool = False
+    DB_N_PLUS_ONE_THRESHOLD: int = 5
+
+    METRICS_FILE: Path = Path(gettempdir()) / "mood_tracker_metrics.mmap"
+    METRICS_WORKER_SLOTS: int = 32
+    METRICS_SLOT_SIZE: int = 1024 * 1024
+    METRICS_COLLECT_INTERVAL: int = 5
+
     SECRET_KEY: str
+    INTERNAL_TOKEN: str | None = None
+    AUTH_CACHE_SIZE: int = 10000
+    AUTH_CACHE_TTL: float = 60.0
+
+    FEED_FANOUT_MAX_AUDIENCE: int = 5000
+    FEED_BACKFILL_LIMIT: int = 100
+
+    TAG_INDEX_CACHE_SIZE: int = 10000
+    TAG_INDEX_TTL: float = 60.0
+
+    FRIEND_GRAPH_CACHE_SIZE: int = 100000
+    FRIEND_GRAPH_TTL: float = 300.0
+
+    USER_SETTINGS_CACHE_SIZE: int = 10000
+    USER_SETTINGS_TTL: float = 300.0
+
+    RESPONSE_CACHE_SIZE: int = 0
+    RESPONSE_CACHE_TTL: float = 60.0
+
+    ANALYTICS_CACHE_SIZE: int = 1000
+    ANALYTICS_TTL: float = 600.0
+
+    ENTRY_WRITE_BUFFER: bool = False
+    ENTRY_WRITE_BUFFER_SIZE: int = 10000
+    ENTRY_WRITE_BATCH_SIZE: int = 500
+    ENTRY_WRITE_FLUSH_INTERVAL: float = 0.005
 
     @property
     def environment(self) -> str:
@@ -2,19 +2,146 @@
 
 __author__: str = "Digital Horizons"
 
+import time
+from typing import Any
+
+from sqlalchemy import Engine, event
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
     async_sessionmaker,
     AsyncEngine,
 )
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, ORMExecuteState, SessionTransaction
+from sqlalchemy.sql.dml import UpdateBase
 
 from core.config import settings
+from core.db_timing import instrument_engine
+from core.pool import ObservedAsyncPool
+from core.replicas import ReplicaSet, mark_write, read_your_writes_active
+
+
+def create_db_engine(url: str) -> AsyncEngine:
+    """
+    Создание движка БД с настройками пула из конфигурации приложения
+
+    Args:
+        url (str): адрес подключения к БД
+
+    Returns:
+        AsyncEngine: асинхронный движок БД
+
+    Examples:
+        >>> from core.config import settings
+        >>>
+        >>> replica_engine: AsyncEngine = create_db_engine(str(settings.DB_REPLICA_URLS[0]))
+    """
+    db_engine: AsyncEngine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        poolclass=ObservedAsyncPool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+    )
+    instrument_engine(db_engine)
+    return db_engine
+
 
 # Экземпляр подключения к БД
-engine: AsyncEngine = create_async_engine(str(settings.DB_URL), echo=settings.DEBUG)
+engine: AsyncEngine = create_db_engine(str(settings.DB_URL))
+
+# Реплики БД для запросов только на чтение
+replica_set: ReplicaSet = ReplicaSet(
+    [create_db_engine(str(url)) for url in settings.DB_REPLICA_URLS]
+)
+
+
+class RoutingSession(Session):
+    """
+    Сессия, направляющая запросы только на чтение в реплики, а запись - в основную БД
+
+    Examples:
+        >>> from core.database import ReadOnlySessionLocal
+        >>>
+        >>> async with ReadOnlySessionLocal() as session:
+        ...     # Запрос уйдет в одну из доступных реплик
+        ...     await session.execute(...)
+
+    Notes:
+        Реплика выбирается один раз на сессию, чтобы все чтения шли в одной транзакции.
+        Запись, сброс изменений и чтение в окне "read your own writes" всегда идут в основную БД.
+        Отдельный запрос направляется в основную БД через bind_arguments=PRIMARY_BIND_ARGUMENTS
+    """
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, bind: Any = None, **kwargs: Any) -> Engine:
+        if bind is not None:
+            return bind
+
+        if (
+            not self.info.get("read_only")
+            or self._flushing
+            or isinstance(clause, UpdateBase)
+            or read_your_writes_active()
+        ):
+            return engine.sync_engine
+
+        if "replica" not in self.info:
+            replica: AsyncEngine | None = replica_set.choose()
+            self.info["replica"] = replica.sync_engine if replica else engine.sync_engine
+
+        return self.info["replica"]
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def _mark_session_flush(session: Session, _: Any) -> None:
+    session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _mark_session_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def _start_read_your_writes_window(session: Session) -> None:
+    if session.info.pop("has_writes", False):
+        mark_write(settings.DB_READ_YOUR_WRITES_WINDOW)
+
+
+@event.listens_for(RoutingSession, "after_begin")
+def _start_connection_hold(session: Session, _: SessionTransaction, __: Connection) -> None:
+    session.info.setdefault("connection_acquired_at", time.perf_counter())
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _stop_connection_hold(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None and "connection_acquired_at" in session.info:
+        hold_time: float = time.perf_counter() - session.info.pop("connection_acquired_at")
+        session.info["connection_hold_time"] = session.info.get("connection_hold_time", 0.0) + hold_time
+
 
 # Мейкер сессий для подключения к БД
 AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
 )
+
+# Мейкер сессий только для чтения. При наличии реплик запросы идут в них
+ReadOnlySessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    expire_on_commit=False,
+    info={"read_only": True},
+)
+
+# Аргументы выполнения, направляющие запрос сессии только для чтения в основную БД
+PRIMARY_BIND_ARGUMENTS: dict[str, Engine] = {"bind": engine.sync_engine}
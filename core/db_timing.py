@@ -0,0 +1,218 @@
+"""Модуль замера времени работы с БД в рамках HTTP запроса"""
+
+__author__: str = "Digital Horizons"
+
+import time
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from consts.database import SLOWEST_STATEMENT_MAX_LENGTH
+from core.config import settings
+from core.query_log import call_site, log_slow_query, normalize_sql
+from metrics import db_query_duration_seconds
+
+
+@dataclass(slots=True)
+class DbTiming:
+    """
+    Накопленное время работы с БД одного запроса
+
+    Attributes:
+        queries (int): количество выполненных SQL выражений
+        query_time (float): суммарное время выполнения выражений в секундах
+        pool_wait (float): суммарное время ожидания подключения из пула в секундах
+        slowest_time (float): время самого медленного выражения в секундах
+        slowest_statement (str | None): текст самого медленного выражения
+        request_id (str | None): идентификатор HTTP запроса
+        repeat_threshold (int): количество одинаковых выражений, после которого они считаются N+1. 0 - не отслеживаются
+        statement_counts (Counter[str]): количество выполнений по нормализованным выражениям
+        repeated_call_sites (dict[str, list[str]]): место вызова выражений, достигших repeat_threshold
+    """
+
+    queries: int = 0
+    query_time: float = 0.0
+    pool_wait: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: str | None = None
+    request_id: str | None = None
+    repeat_threshold: int = 0
+    statement_counts: Counter[str] = field(default_factory=Counter)
+    repeated_call_sites: dict[str, list[str]] = field(default_factory=dict)
+
+    def add_query(self, statement: str, elapsed: float) -> None:
+        """
+        Учет выполненного выражения
+
+        Args:
+            statement (str): текст выражения
+            elapsed (float): время выполнения в секундах
+        """
+        self.queries += 1
+        self.query_time += elapsed
+
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+        if self.repeat_threshold > 0:
+            fingerprint: str = normalize_sql(statement)
+            self.statement_counts[fingerprint] += 1
+
+            # Стек снимается один раз, при достижении порога: последующие повторы его не меняют
+            if self.statement_counts[fingerprint] == self.repeat_threshold:
+                self.repeated_call_sites[fingerprint] = call_site()
+
+    def repeated_statements(self) -> list[dict[str, Any]]:
+        """
+        Выражения, выполненные repeat_threshold и более раз
+
+        Returns:
+            list[dict[str, Any]]: нормализованное выражение, количество выполнений и место вызова
+
+        Examples:
+            >>> for pattern in timing.repeated_statements():
+            ...     app_logger.bind(**pattern).warning("N+1 query pattern detected")
+        """
+        return [
+            {"statement": fingerprint, "count": self.statement_counts[fingerprint], "call_site": stack}
+            for fingerprint, stack in self.repeated_call_sites.items()
+        ]
+
+    def server_timing(self) -> str:
+        """
+        Значение заголовка Server-Timing
+
+        Returns:
+            str: метрики db (выполнение выражений) и db-pool (ожидание подключения) в миллисекундах
+
+        Examples:
+            >>> DbTiming(queries=2, query_time=0.0125).server_timing() # 'db;dur=12.5;desc="2 queries", db-pool;dur=0.0'
+        """
+        return (
+            f'db;dur={round(self.query_time * 1000, 3)};desc="{self.queries} queries", '
+            f"db-pool;dur={round(self.pool_wait * 1000, 3)}"
+        )
+
+    def log_fields(self) -> dict[str, Any]:
+        """
+        Поля для записи лога о завершении запроса
+
+        Returns:
+            dict[str, Any]: количество выражений, время в секундах и самое медленное выражение
+        """
+        return {
+            "db_queries": self.queries,
+            "db_time": round(self.query_time, 4),
+            "db_pool_wait": round(self.pool_wait, 4),
+            "db_slowest_time": round(self.slowest_time, 4),
+            "db_slowest_statement": (
+                self.slowest_statement[:SLOWEST_STATEMENT_MAX_LENGTH] if self.slowest_statement else None
+            ),
+        }
+
+
+# Замер текущего HTTP запроса. Объект изменяемый, поэтому виден и в задачах, созданных внутри запроса
+_db_timing: ContextVar[DbTiming | None] = ContextVar("db_timing", default=None)
+
+
+def start_db_timing(request_id: str | None = None, repeat_threshold: int = 0) -> tuple[DbTiming, Token]:
+    """
+    Начало замера для текущего контекста
+
+    Args:
+        request_id (str | None): идентификатор HTTP запроса для журнала медленных выражений
+        repeat_threshold (int): порог одинаковых выражений для поиска N+1. 0 - поиск отключен
+
+    Returns:
+        tuple[DbTiming, Token]: замер и токен для stop_db_timing
+
+    Examples:
+        >>> timing, token = start_db_timing(request_id, settings.DB_N_PLUS_ONE_THRESHOLD)
+        >>> try:
+        ...     response = await call_next(request)
+        ... finally:
+        ...     stop_db_timing(token)
+        >>> response.headers["Server-Timing"] = timing.server_timing()
+    """
+    timing: DbTiming = DbTiming(request_id=request_id, repeat_threshold=repeat_threshold)
+    return timing, _db_timing.set(timing)
+
+
+def stop_db_timing(token: Token) -> None:
+    """
+    Завершение замера текущего контекста
+
+    Args:
+        token (Token): токен из start_db_timing
+    """
+    _db_timing.reset(token)
+
+
+def add_pool_wait(seconds: float) -> None:
+    """
+    Учет ожидания подключения из пула в замере текущего запроса
+
+    Args:
+        seconds (float): время ожидания в секундах
+    """
+    timing: DbTiming | None = _db_timing.get()
+
+    if timing is not None:
+        timing.pool_wait += seconds
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подписка на события движка для замера выражений
+
+    Args:
+        engine (AsyncEngine): асинхронный движок БД
+
+    Notes:
+        События выполняются в гринлете SQLAlchemy, который наследует контекст задачи, поэтому
+        выражения попадают в замер запроса, из которого они выполнены. Выражения дольше
+        DB_SLOW_QUERY_MS пишутся в журнал медленных выражений, в том числе вне HTTP запросов
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(
+    _connection: Connection,
+    _cursor: Any,
+    _statement: str,
+    _parameters: Any,
+    context: ExecutionContext,
+    _executemany: bool,
+) -> None:
+    context._db_timing_start = time.perf_counter()
+
+
+def _after_cursor_execute(
+    _connection: Connection,
+    _cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: ExecutionContext,
+    _executemany: bool,
+) -> None:
+    start_time: float | None = getattr(context, "_db_timing_start", None)
+
+    if start_time is None:
+        return
+
+    elapsed: float = time.perf_counter() - start_time
+    timing: DbTiming | None = _db_timing.get()
+    db_query_duration_seconds.observe(elapsed)
+
+    if timing is not None:
+        timing.add_query(statement, elapsed)
+
+    if 0 < settings.DB_SLOW_QUERY_MS <= elapsed * 1000:
+        log_slow_query(statement, parameters, elapsed, timing.request_id if timing is not None else None)
@@ -0,0 +1,82 @@
+"""Модуль ленивой сессии подключения к БД"""
+
+__author__: str = "Digital Horizons"
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+class LazySession:
+    """
+    Обертка над AsyncSession, создающая сессию только при первом обращении
+
+    Attributes:
+        session_maker (async_sessionmaker[AsyncSession]): мейкер, которым будет создана сессия
+
+    Examples:
+        >>> from core.database import AsyncSessionLocal
+        >>>
+        >>> session: LazySession = LazySession(AsyncSessionLocal)
+        >>> print(session.started) # False - ни сессии, ни подключения еще нет
+        >>> await session.execute(...) # сессия создается, подключение берется из пула
+        >>> await session.close()
+        >>> print(session.connection_hold_time) # сколько секунд подключение было занято
+
+    Notes:
+        Подключение из пула берется AsyncSession только при выполнении первого выражения
+        и возвращается при завершении транзакции (commit, rollback или close)
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]):
+        self.session_maker: async_sessionmaker[AsyncSession] = session_maker
+        self._session: AsyncSession | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.session, name)
+
+    @property
+    def session(self) -> AsyncSession:
+        """
+        Сессия подключения к БД. Создается при первом обращении
+
+        Returns:
+            AsyncSession: сессия для асинхронной работы с БД
+        """
+        if self._session is None:
+            self._session = self.session_maker()
+
+        return self._session
+
+    @property
+    def started(self) -> bool:
+        """
+        Признак того, что сессия уже создана
+
+        Returns:
+            bool: True - к сессии уже обращались
+        """
+        return self._session is not None
+
+    @property
+    def connection_hold_time(self) -> float:
+        """
+        Суммарное время удержания подключений из пула сессией
+
+        Returns:
+            float: время в секундах. 0 - если подключение не бралось
+        """
+        if self._session is None:
+            return 0.0
+
+        return self._session.info.get("connection_hold_time", 0.0)
+
+    async def rollback(self) -> None:
+        """Откат транзакции, если сессия была создана"""
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        """Закрытие сессии и возврат подключения в пул, если сессия была создана"""
+        if self._session is not None:
+            await self._session.close()
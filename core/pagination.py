@@ -0,0 +1,53 @@
+"""Модуль курсорной пагинации"""
+
+__author__: str = "Digital Horizons"
+
+import base64
+from datetime import datetime
+
+# Разделитель частей курсора
+_CURSOR_SEPARATOR: str = "|"
+
+
+def encode_cursor(created_at: datetime, entity_id: int) -> str:
+    """
+    Кодирование позиции последней записи страницы в непрозрачный курсор
+
+    Args:
+        created_at (datetime): время создания последней записи страницы
+        entity_id (int): идентификатор последней записи страницы
+
+    Returns:
+        str: курсор для запроса следующей страницы
+
+    Examples:
+        >>> cursor: str = encode_cursor(entry.created_at, entry.id)
+        >>> print(decode_cursor(cursor) == (entry.created_at, entry.id)) # True
+
+    Notes:
+        Курсор указывает на позицию в порядке (created_at DESC, id DESC), а не на номер страницы,
+        поэтому новые записи не сдвигают уже выданные страницы
+    """
+    raw: str = f"{created_at.isoformat()}{_CURSOR_SEPARATOR}{entity_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    Декодирование курсора в позицию последней записи страницы
+
+    Args:
+        cursor (str): курсор, полученный от encode_cursor
+
+    Returns:
+        tuple[datetime, int]: время создания и идентификатор последней записи
+
+    Raises:
+        ValueError: курсор поврежден или сформирован не приложением
+    """
+    try:
+        raw: str = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, entity_id = raw.split(_CURSOR_SEPARATOR)
+        return datetime.fromisoformat(created_at), int(entity_id)
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
@@ -0,0 +1,184 @@
+"""Модуль наблюдаемого пула подключений к БД"""
+
+__author__: str = "Digital Horizons"
+
+import asyncio
+import time
+from bisect import bisect_left
+from typing import Any
+
+from sqlalchemy import exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from consts.database import POOL_WAIT_BUCKETS_MS
+from core.config import settings
+from core.db_timing import add_pool_wait
+from logger import app_logger
+
+
+class PoolWaitHistogram:
+    """
+    Гистограмма времени ожидания подключения из пула с фиксированными корзинами
+
+    Attributes:
+        buckets (tuple[float, ...]): верхние границы корзин в миллисекундах
+        counts (list[int]): количество ожиданий в каждой корзине. Последняя - "+Inf"
+        total (int): общее количество ожиданий
+        sum_ms (float): суммарное время ожидания в миллисекундах
+        max_ms (float): максимальное время ожидания в миллисекундах
+
+    Examples:
+        >>> histogram: PoolWaitHistogram = PoolWaitHistogram()
+        >>> histogram.observe(3.5)
+        >>> print(histogram.as_dict()["buckets"]["5.0"]) # 1
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = POOL_WAIT_BUCKETS_MS):
+        self.buckets: tuple[float, ...] = buckets
+        self.counts: list[int] = [0] * (len(buckets) + 1)
+        self.total: int = 0
+        self.sum_ms: float = 0.0
+        self.max_ms: float = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """
+        Учет очередного значения ожидания
+
+        Args:
+            value_ms (float): время ожидания в миллисекундах
+        """
+        self.counts[bisect_left(self.buckets, value_ms)] += 1
+        self.total += 1
+        self.sum_ms += value_ms
+
+        if value_ms > self.max_ms:
+            self.max_ms = value_ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Представление гистограммы в виде словаря с накопительными значениями корзин
+
+        Returns:
+            dict[str, Any]: данные гистограммы
+        """
+        cumulative: int = 0
+        buckets: dict[str, int] = {}
+
+        for bound, count in zip((*map(str, self.buckets), "+Inf"), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+
+        return {
+            "buckets": buckets,
+            "count": self.total,
+            "sum_ms": round(self.sum_ms, 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class ObservedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Пул подключений, замеряющий время ожидания свободного подключения
+
+    Attributes:
+        wait_histogram (PoolWaitHistogram): гистограмма времени ожидания подключения
+        timeouts (int): количество отказов в выдаче подключения по таймауту
+
+    Examples:
+        >>> from sqlalchemy.ext.asyncio import create_async_engine
+        >>>
+        >>> engine = create_async_engine(str(settings.DB_URL), poolclass=ObservedAsyncPool)
+
+    Notes:
+        Пул пересоздается SQLAlchemy через recreate() при инвалидации, поэтому статистика
+        хранится на экземпляре и начинается заново вместе с новым пулом
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_histogram: PoolWaitHistogram = PoolWaitHistogram()
+        self.timeouts: int = 0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start_time: float = time.perf_counter()
+
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            app_logger.bind(pool=self.stats()).error("DB pool checkout timed out")
+            raise
+        finally:
+            wait: float = time.perf_counter() - start_time
+            wait_ms: float = wait * 1000
+            self.wait_histogram.observe(wait_ms)
+            add_pool_wait(wait)
+
+            if wait_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS:
+                app_logger.bind(wait_ms=round(wait_ms, 3)).warning("Slow DB pool checkout")
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Текущее состояние пула
+
+        Returns:
+            dict[str, Any]: размер пула, занятые и свободные подключения, переполнение и гистограмма ожидания
+
+        Examples:
+            >>> from core.database import engine
+            >>>
+            >>> print(engine.pool.stats()["checked_out"])
+        """
+        return {
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": self.overflow(),
+            "max_overflow": self._max_overflow,
+            "timeouts": self.timeouts,
+            "wait_ms": self.wait_histogram.as_dict(),
+        }
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """
+    Получение статистики пула подключений движка
+
+    Args:
+        engine (AsyncEngine): асинхронный движок БД
+
+    Returns:
+        dict[str, Any]: статистика пула. Для пулов без наблюдения - только текстовый статус
+
+    Examples:
+        >>> from core.database import engine
+        >>> from core.pool import get_pool_stats
+        >>>
+        >>> print(get_pool_stats(engine))
+    """
+    pool = engine.pool
+
+    if isinstance(pool, ObservedAsyncPool):
+        return pool.stats()
+
+    return {"status": pool.status()}
+
+
+async def log_pool_stats(engine: AsyncEngine, interval: int) -> None:
+    """
+    Периодическая запись статистики пула в лог
+
+    Args:
+        engine (AsyncEngine): асинхронный движок БД
+        interval (int): период записи в секундах
+
+    Examples:
+        >>> import asyncio
+        >>> from core.database import engine
+        >>>
+        >>> task: asyncio.Task = asyncio.create_task(log_pool_stats(engine, 60))
+    """
+    while True:
+        await asyncio.sleep(interval)
+        app_logger.bind(pool=get_pool_stats(engine)).info("DB pool stats")
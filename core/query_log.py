@@ -0,0 +1,128 @@
+"""Модуль нормализации SQL, журнала медленных выражений и поиска N+1"""
+
+__author__: str = "Digital Horizons"
+
+import re
+import traceback
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+from greenlet import getcurrent
+from loguru import logger
+
+from consts.database import CALL_SITE_MAX_FRAMES, SQL_FINGERPRINT_CACHE_SIZE
+
+# Корень проекта: в месте вызова остаются только кадры кода приложения
+_PROJECT_ROOT: Path = Path(__file__).resolve().parents[1]
+
+# Тип в приведении: многословные типы, длина и точность, массивы. Числа в нем не заменяются на "?"
+_TYPE: str = (
+    r"\w+(?:\s+(?:PRECISION|VARYING))?(?:\s*\(\s*\d+(?:\s*,\s*\d+)?\s*\))?"
+    r"(?:\s+WITH(?:OUT)?\s+TIME\s+ZONE)?(?:\[\])*"
+)
+# Строковые и числовые литералы, позиционные и именованные параметры вместе с приведением типа.
+# Приведение типа выражения (группа cast: ::тип и AS тип в CAST) остается без изменений
+_LITERALS_PATTERN: re.Pattern = re.compile(
+    rf"(?:'(?:[^']|'')*'|\$\d+)(?:::\s*{_TYPE})?|%\(\w+\)s|%s|(?<![:\w]):\w+|\?"
+    rf"|(?P<cast>::\s*{_TYPE}|\bAS\s+{_TYPE})|\b\d+(?:\.\d+)?\b",
+    re.IGNORECASE,
+)
+# Списки параметров IN (?, ?, ...) любой длины
+_IN_LIST_PATTERN: re.Pattern = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+# Повторяющиеся одинаковые группы в скобках: строки многострочного VALUES (?), (?), ...
+_REPEATED_GROUPS_PATTERN: re.Pattern = re.compile(r"(\([^()]*\))(?:\s*,\s*\1)+")
+_WHITESPACE_PATTERN: re.Pattern = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=SQL_FINGERPRINT_CACHE_SIZE)
+def normalize_sql(statement: str) -> str:
+    """
+    Нормализация SQL выражения до формы без значений
+
+    Args:
+        statement (str): текст выражения
+
+    Returns:
+        str: выражение, в котором литералы и параметры заменены на "?", списки IN и строки VALUES свернуты
+
+    Examples:
+        >>> normalize_sql("SELECT * FROM tag WHERE id IN ($1::INTEGER, $2::INTEGER) AND name = 'x'")
+        'SELECT * FROM tag WHERE id IN (?) AND name = ?'
+        >>> normalize_sql("SELECT CAST(name AS VARCHAR(20)), $1::TIMESTAMP WITH TIME ZONE, note::VARCHAR(20)")
+        'SELECT CAST(name AS VARCHAR(20)), ?, note::VARCHAR(20)'
+        >>> normalize_sql("INSERT INTO tag (name, color) VALUES ($1, $2), ($3, $4), ($5, $6)")
+        'INSERT INTO tag (name, color) VALUES (?)'
+    """
+    normalized: str = _WHITESPACE_PATTERN.sub(" ", statement).strip()
+    normalized = _LITERALS_PATTERN.sub(lambda match: match.group() if match.group("cast") else "?", normalized)
+    normalized = _IN_LIST_PATTERN.sub("(?)", normalized)
+    return _REPEATED_GROUPS_PATTERN.sub(r"\1", normalized)
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """
+    Параметры выражения без значений
+
+    Args:
+        parameters (Any): параметры, переданные драйверу
+
+    Returns:
+        Any: имена именованных параметров, количество позиционных или строк пакетного выполнения
+    """
+    if isinstance(parameters, dict):
+        return sorted(parameters)
+
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return {"rows": len(parameters)}
+
+        return {"count": len(parameters)}
+
+    return None
+
+
+def call_site() -> list[str]:
+    """
+    Место вызова выражения в коде приложения
+
+    Returns:
+        list[str]: кадры "файл:строка in функция" от внешнего к внутреннему
+
+    Notes:
+        Выражения асинхронного движка выполняются в дочернем гринлете, стек которого не содержит
+        кода приложения, поэтому стек берется из ожидающего родительского гринлета
+    """
+    current = getcurrent()
+    frame: FrameType | None = current.parent.gr_frame if current.parent is not None else None
+    stack: traceback.StackSummary = traceback.extract_stack(frame)
+    frames: list[str] = []
+
+    for summary in stack:
+        path: Path = Path(summary.filename)
+
+        if path.is_relative_to(_PROJECT_ROOT) and "site-packages" not in path.parts:
+            frames.append(f"{path.relative_to(_PROJECT_ROOT)}:{summary.lineno} in {summary.name}")
+
+    return frames[-CALL_SITE_MAX_FRAMES:]
+
+
+def log_slow_query(statement: str, parameters: Any, elapsed: float, request_id: str | None) -> None:
+    """
+    Запись медленного выражения в журнал медленных выражений
+
+    Args:
+        statement (str): текст выражения
+        parameters (Any): параметры выражения, в журнал попадают без значений
+        elapsed (float): время выполнения в секундах
+        request_id (str | None): идентификатор HTTP запроса, в котором выполнено выражение
+    """
+    # Глобальный логгер loguru вместо app_logger: модуль импортируется движком БД раньше пакета logger
+    logger.bind(
+        slow_query=True,
+        request_id=request_id,
+        duration_ms=round(elapsed * 1000, 3),
+        statement=normalize_sql(statement),
+        parameters=redact_parameters(parameters),
+    ).warning("Slow SQL statement")
@@ -0,0 +1,198 @@
+"""Модуль для работы с репликами БД"""
+
+__author__: str = "Digital Horizons"
+
+import asyncio
+import time
+from contextvars import ContextVar
+from itertools import count
+from typing import Generic, Hashable, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from consts.database import RECENT_CHANGES_COMPACT_SIZE
+from logger import app_logger
+
+# Момент (по time.monotonic), до которого чтение в рамках запроса идет с основной БД
+_read_primary_until: ContextVar[float] = ContextVar("read_primary_until", default=0.0)
+
+KeyType = TypeVar("KeyType", bound=Hashable)
+
+
+def mark_write(window: float) -> None:
+    """
+    Фиксация записи в основную БД в рамках текущего запроса
+
+    Args:
+        window (float): время в секундах, в течение которого чтение пойдет с основной БД
+
+    Examples:
+        >>> from core.config import settings
+        >>>
+        >>> # После коммита изменений последующие чтения запроса увидят свои же записи
+        >>> mark_write(settings.DB_READ_YOUR_WRITES_WINDOW)
+    """
+    _read_primary_until.set(time.monotonic() + window)
+
+
+def read_your_writes_active() -> bool:
+    """
+    Признак того, что текущий запрос недавно писал в основную БД
+
+    Returns:
+        bool: True - чтение должно идти с основной БД
+    """
+    return time.monotonic() < _read_primary_until.get()
+
+
+class RecentChanges(Generic[KeyType]):
+    """
+    Ключи кэша воркера, данные которых недавно изменены в основной БД
+
+    Attributes:
+        window (float): время в секундах после изменения, в течение которого реплика может вернуть старые данные
+
+    Examples:
+        >>> from core.config import settings
+        >>>
+        >>> recent: RecentChanges[int] = RecentChanges(settings.DB_READ_YOUR_WRITES_WINDOW)
+        >>> recent.mark(user_id) # После коммита изменения
+        >>> print(recent.active(user_id)) # True - промах кэша нужно читать с основной БД
+
+    Notes:
+        В отличие от mark_write действует для всех запросов воркера, а не только для записавшего
+    """
+
+    def __init__(self, window: float):
+        self.window: float = window
+        self._until: dict[KeyType, float] = {}
+
+    def mark(self, key: KeyType) -> None:
+        """
+        Фиксация изменения данных ключа
+
+        Args:
+            key (KeyType): ключ кэша
+        """
+        now: float = time.monotonic()
+
+        # Истекшие отметки удаляются при росте словаря, чтобы он не рос бесконечно
+        if len(self._until) > RECENT_CHANGES_COMPACT_SIZE:
+            self._until = {changed: until for changed, until in self._until.items() if until > now}
+
+        self._until[key] = now + self.window
+
+    def active(self, key: KeyType) -> bool:
+        """
+        Признак недавнего изменения данных ключа
+
+        Args:
+            key (KeyType): ключ кэша
+
+        Returns:
+            bool: True - изменение могло еще не дойти до реплик
+        """
+        return time.monotonic() < self._until.get(key, 0.0)
+
+    def clear(self) -> None:
+        """Сброс всех отметок"""
+        self._until.clear()
+
+
+class ReplicaSet:
+    """
+    Набор реплик БД с выбором по кругу среди доступных
+
+    Attributes:
+        engines (list[AsyncEngine]): движки подключения к репликам
+        healthy (list[bool]): признаки доступности реплик по результатам последней проверки
+
+    Examples:
+        >>> from core.database import create_db_engine
+        >>>
+        >>> replica_set: ReplicaSet = ReplicaSet([create_db_engine("postgresql+asyncpg://...")])
+        >>> # None - реплик нет или все недоступны, нужно читать с основной БД
+        >>> replica: AsyncEngine | None = replica_set.choose()
+
+    Notes:
+        До первой проверки реплики считаются доступными
+    """
+
+    def __init__(self, engines: list[AsyncEngine]):
+        self.engines: list[AsyncEngine] = engines
+        self.healthy: list[bool] = [True] * len(engines)
+        self._counter = count()
+
+    def __bool__(self) -> bool:
+        return bool(self.engines)
+
+    def choose(self) -> AsyncEngine | None:
+        """
+        Выбор следующей доступной реплики по кругу
+
+        Returns:
+            AsyncEngine | None: движок реплики или None, если доступных реплик нет
+        """
+        replicas_count: int = len(self.engines)
+
+        for _ in range(replicas_count):
+            index: int = next(self._counter) % replicas_count
+
+            if self.healthy[index]:
+                return self.engines[index]
+
+        return None
+
+    async def check(self, timeout: float) -> None:
+        """
+        Проверка доступности всех реплик
+
+        Args:
+            timeout (float): время ожидания ответа реплики в секундах
+        """
+        results: list[bool] = await asyncio.gather(
+            *(self._ping(engine, timeout) for engine in self.engines)
+        )
+
+        for index, (engine, healthy) in enumerate(zip(self.engines, results)):
+            if healthy != self.healthy[index]:
+                app_logger.bind(replica=engine.url.render_as_string(hide_password=True)).warning(
+                    "DB replica is back online" if healthy else "DB replica is unavailable"
+                )
+
+            self.healthy[index] = healthy
+
+    async def run_health_checks(self, interval: int, timeout: float) -> None:
+        """
+        Периодическая проверка доступности реплик
+
+        Args:
+            interval (int): период проверки в секундах
+            timeout (float): время ожидания ответа реплики в секундах
+
+        Examples:
+            >>> import asyncio
+            >>> from core.database import replica_set
+            >>>
+            >>> task: asyncio.Task = asyncio.create_task(replica_set.run_health_checks(10, 2.0))
+        """
+        while True:
+            await self.check(timeout)
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        """Закрытие подключений ко всем репликам"""
+        for engine in self.engines:
+            await engine.dispose()
+
+    @staticmethod
+    async def _ping(engine: AsyncEngine, timeout: float) -> bool:
+        try:
+            async with asyncio.timeout(timeout):
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+        except Exception:
+            return False
+
+        return True
@@ -0,0 +1,105 @@
+"""Модуль параметров сервера приложения: количество воркеров, пулы подключений и реализации uvicorn"""
+
+__author__: str = "Digital Horizons"
+
+import math
+import os
+from importlib.util import find_spec
+
+from consts.server import CGROUP_CPU_MAX_PATH, ROLLING_RESTART_SPARE_WORKERS, SOMAXCONN_PATH
+
+
+def available_cpus() -> int:
+    """
+    Количество ядер, доступных процессу
+
+    Returns:
+        int: ядра с учетом привязки процесса к процессорам и квоты процессора контейнера
+
+    Examples:
+        >>> workers: int = settings.SERVER_WORKERS or available_cpus()
+
+    Notes:
+        os.cpu_count() возвращает ядра машины, а не контейнера: при квоте в 2 ядра на машине с 64
+        ядрами воркеры по числу ядер машины только делили бы квоту между собой
+    """
+    cpus: int = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+
+    try:
+        quota, period = CGROUP_CPU_MAX_PATH.read_text().split()
+    except (OSError, ValueError):
+        return cpus
+
+    if quota == "max":
+        return cpus
+
+    return max(1, min(cpus, math.ceil(int(quota) / int(period))))
+
+
+def worker_pool_limits(budget: int, workers: int, pool_size: int, max_overflow: int) -> tuple[int, int]:
+    """
+    Размер пула и количество подключений сверх пула одного воркера из общего бюджета подключений к БД
+
+    Args:
+        budget (int): общее количество подключений к БД всех воркеров сервера
+        workers (int): количество воркеров
+        pool_size (int): размер пула воркера из настроек
+        max_overflow (int): количество подключений сверх пула из настроек
+
+    Returns:
+        tuple[int, int]: размер пула и количество подключений сверх пула
+
+    Raises:
+        ValueError: бюджета не хватает хотя бы на одно подключение на воркер
+
+    Examples:
+        >>> worker_pool_limits(100, 8, 5, 10) # (5, 6)
+
+    Notes:
+        Бюджет делится с запасом на воркер-замену: при плавном перезапуске новый воркер открывает
+        подключения до остановки старого. Воркеры, добавленные после запуска сигналом SIGTTIN, в бюджет
+        не входят. Бюджет ограничивает настройки сверху и не увеличивает их
+    """
+    per_worker: int = budget // (workers + ROLLING_RESTART_SPARE_WORKERS)
+
+    if per_worker < 1:
+        raise ValueError(
+            f"DB connection budget {budget} is too small for {workers} workers "
+            f"and {ROLLING_RESTART_SPARE_WORKERS} spare worker"
+        )
+
+    worker_pool_size: int = min(pool_size, per_worker)
+    return worker_pool_size, min(max_overflow, per_worker - worker_pool_size)
+
+
+def event_loop_implementation() -> str:
+    """
+    Реализация цикла событий для uvicorn
+
+    Returns:
+        str: "uvloop", если пакет установлен, иначе "asyncio"
+    """
+    return "uvloop" if find_spec("uvloop") else "asyncio"
+
+
+def http_implementation() -> str:
+    """
+    Реализация разбора HTTP для uvicorn
+
+    Returns:
+        str: "httptools", если пакет установлен, иначе "h11"
+    """
+    return "httptools" if find_spec("httptools") else "h11"
+
+
+def max_backlog() -> int | None:
+    """
+    Предел очереди ожидающих подключений сокета в ядре
+
+    Returns:
+        int | None: значение net.core.somaxconn или None, если оно недоступно
+    """
+    try:
+        return int(SOMAXCONN_PATH.read_text())
+    except (OSError, ValueError):
+        return None
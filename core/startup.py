@@ -0,0 +1,150 @@
+"""Модуль профиля запуска приложения: время импорта модулей и шагов инициализации"""
+
+__author__: str = "Digital Horizons"
+
+import sys
+import time
+from contextlib import contextmanager
+from importlib.abc import Loader, MetaPathFinder
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Any, Iterator, Sequence
+
+
+class _TimedLoader(Loader):
+    def __init__(self, loader: Loader, profile: "StartupProfile"):
+        self._loader: Loader = loader
+        self._profile: StartupProfile = profile
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profile._enter_module()
+        start_time: float = time.perf_counter()
+
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profile._exit_module(module.__name__, time.perf_counter() - start_time)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
+
+
+class _TimingFinder(MetaPathFinder):
+    def __init__(self, profile: "StartupProfile"):
+        self._profile: StartupProfile = profile
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec: ModuleSpec | None = finder.find_spec(fullname, path, target)
+
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._profile)
+
+                return spec
+
+        return None
+
+
+class StartupProfile:
+    """
+    Профиль запуска: собственное время импорта каждого модуля и длительность шагов инициализации
+
+    Attributes:
+        enabled (bool): профиль собирается. При False шаги и импорт не замеряются
+        imports (dict[str, float]): собственное время импорта модулей в секундах, без вложенных импортов
+        steps (dict[str, float]): длительность шагов инициализации в секундах
+
+    Examples:
+        >>> profile: StartupProfile = StartupProfile(settings.STARTUP_PROFILE)
+        >>> with profile.imports_timed():
+        ...     with profile.step("routers"):
+        ...         from routers import feed_router
+        >>> app_logger.bind(startup_profile=profile.report()).info("Startup profile")
+
+    Notes:
+        Замеряются только модули, впервые импортированные внутри imports_timed. Время процесса до
+        создания профиля (запуск интерпретатора и импорт модуля приложения) попадает в process_time
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled: bool = enabled
+        self.imports: dict[str, float] = {}
+        self.steps: dict[str, float] = {}
+        self._created_at: float = time.perf_counter()
+        self._process_time_at_start: float = time.process_time()
+        self._children_time: list[float] = []
+
+    @contextmanager
+    def imports_timed(self) -> Iterator[None]:
+        """Замер импорта модулей внутри блока"""
+        if not self.enabled:
+            yield
+            return
+
+        finder: _TimingFinder = _TimingFinder(self)
+        sys.meta_path.insert(0, finder)
+
+        try:
+            yield
+        finally:
+            sys.meta_path.remove(finder)
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """
+        Замер шага инициализации
+
+        Args:
+            name (str): название шага
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start_time: float = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.steps[name] = self.steps.get(name, 0.0) + time.perf_counter() - start_time
+
+    def report(self, top: int) -> dict[str, Any]:
+        """
+        Результаты профиля
+
+        Args:
+            top (int): количество самых долгих модулей в отчете
+
+        Returns:
+            dict[str, Any]: шаги и самые долгие модули в миллисекундах, общее время импорта,
+            процессорное время процесса до создания профиля и время с создания профиля
+        """
+        slowest: list[tuple[str, float]] = sorted(self.imports.items(), key=lambda item: item[1], reverse=True)
+
+        return {
+            "process_time_before_ms": round(self._process_time_at_start * 1000, 1),
+            "elapsed_ms": round((time.perf_counter() - self._created_at) * 1000, 1),
+            "steps_ms": {name: round(duration * 1000, 1) for name, duration in self.steps.items()},
+            "imported_modules": len(self.imports),
+            "imports_ms": round(sum(self.imports.values()) * 1000, 1),
+            "slowest_imports_ms": {name: round(duration * 1000, 1) for name, duration in slowest[:top]},
+        }
+
+    def _enter_module(self) -> None:
+        self._children_time.append(0.0)
+
+    def _exit_module(self, name: str, duration: float) -> None:
+        children: float = self._children_time.pop()
+        self.imports[name] = duration - children
+
+        if self._children_time:
+            self._children_time[-1] += duration
@@ -0,0 +1,50 @@
+"""Модуль зависимости аутентификации пользователя"""
+
+__author__: str = "Digital Horizons"
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from dependencies.database import SessionDB
+from security import AuthIdentity, auth_resolver
+
+# Схема получения токена сессии из заголовка Authorization
+bearer_scheme: HTTPBearer = HTTPBearer(auto_error=False)
+
+
+async def get_current_identity(
+    session_db: SessionDB,
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> AuthIdentity:
+    """
+    Зависимость для получения аутентифицированного пользователя по токену сессии
+
+    Returns:
+        AuthIdentity: данные пользователя активной сессии
+
+    Raises:
+        HTTPException: 401, если токен не передан или сессия не активна
+
+    Examples:
+        >>> from fastapi import Depends
+        >>>
+        >>> def get_profile(identity: AuthIdentity = Depends(get_current_identity)):
+        ...     return identity.user_id
+
+    Notes:
+        Сессия, не найденная в кэше, читается с основной БД: реплика с отставанием вернула бы только что
+        деактивированную сессию как активную, и она попала бы в кэш на AUTH_CACHE_TTL
+    """
+    identity: AuthIdentity | None = None
+
+    if credentials is not None:
+        identity = await auth_resolver.resolve(session_db, credentials.credentials)
+
+    if identity is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return identity
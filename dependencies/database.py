@@ -2,12 +2,40 @@
 
 __author__: str = "Digital Horizons"
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator
 
-from core.database import AsyncSessionLocal
+from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from core.database import AsyncSessionLocal, ReadOnlySessionLocal
+from core.lazy_session import LazySession
+from logger import app_logger
 
-async def get_session_db() -> AsyncSession:
+
+@asynccontextmanager
+async def _session_scope(
+    request: Request,
+    session_maker: async_sessionmaker[AsyncSession],
+) -> AsyncIterator[LazySession]:
+    session: LazySession = LazySession(session_maker)
+
+    try:
+        yield session
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+        if session.started:
+            app_logger.bind(
+                request_id=getattr(request.state, "request_id", None),
+                db_hold_time=round(session.connection_hold_time, 4),
+            ).debug("DB session released")
+
+
+async def get_session_db(request: Request) -> AsyncSession:
     """
     Зависимость для получения сессии подключения к БД
 
@@ -24,12 +52,36 @@ async def get_session_db() -> AsyncSession:
 
     Note:
         В конце каждого запроса сессия закрывается. В случае ошибки при выполнении запроса
-        сессия откатывается автоматически
+        сессия откатывается автоматически, а ошибка пробрасывается дальше.
+        Сессия создается и берет подключение из пула только при первом обращении
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        except Exception:
-            await session.rollback()
-        finally:
-            await session.close()
+    async with _session_scope(request, AsyncSessionLocal) as session:
+        yield session
+
+
+async def get_read_only_session_db(request: Request) -> AsyncSession:
+    """
+    Зависимость для получения сессии подключения к БД только для чтения
+
+    Returns:
+        AsyncSession: сессия, запросы которой идут в реплики БД
+
+    Examples:
+        >>> from fastapi import Depends
+        >>>
+        >>> def get_feed(session_db: AsyncSession = Depends(get_read_only_session_db)):
+        ...     ...
+
+    Note:
+        Если реплики не настроены, недоступны или запрос недавно записывал данные,
+        чтение идет с основной БД
+    """
+    async with _session_scope(request, ReadOnlySessionLocal) as session:
+        yield session
+
+
+# Сессия, закрываемая сразу после выполнения обработчика - до отправки тела ответа
+SessionDB = Annotated[AsyncSession, Depends(get_session_db, scope="function")]
+
+# Сессия только для чтения, закрываемая сразу после выполнения обработчика
+ReadOnlySessionDB = Annotated[AsyncSession, Depends(get_read_only_session_db, scope="function")]
@@ -0,0 +1,38 @@
+"""Модуль зависимости доступа к служебным маршрутам"""
+
+__author__: str = "Digital Horizons"
+
+import hmac
+
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials
+
+from core.config import settings
+from dependencies.auth import bearer_scheme
+
+
+async def require_internal_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> None:
+    """
+    Зависимость проверки служебного токена из заголовка Authorization
+
+    Raises:
+        HTTPException: 401, если служебный токен не задан в настройках, не передан или не совпадает
+
+    Examples:
+        >>> from fastapi import APIRouter, Depends
+        >>>
+        >>> router: APIRouter = APIRouter(dependencies=[Depends(require_internal_token)])
+    """
+    # Сравнение за постоянное время: время ответа не подсказывает совпавшую часть токена
+    if (
+        settings.INTERNAL_TOKEN is None
+        or credentials is None
+        or not hmac.compare_digest(credentials.credentials.encode(), settings.INTERNAL_TOKEN.encode())
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
@@ -0,0 +1,37 @@
+"""Модуль зависимости курсорной пагинации"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import datetime
+
+from fastapi import HTTPException, status
+
+from core.pagination import decode_cursor
+
+
+def get_cursor_position(cursor: str | None = None) -> tuple[datetime, int] | None:
+    """
+    Зависимость для получения позиции страницы из курсора запроса
+
+    Args:
+        cursor (str | None): курсор из параметра запроса
+
+    Returns:
+        tuple[datetime, int] | None: время создания и идентификатор последней записи предыдущей страницы
+
+    Raises:
+        HTTPException: 400, если курсор поврежден
+
+    Examples:
+        >>> from fastapi import Depends
+        >>>
+        >>> def get_entries(after: tuple[datetime, int] | None = Depends(get_cursor_position)):
+        ...     ...
+    """
+    if cursor is None:
+        return None
+
+    try:
+        return decode_cursor(cursor)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
@@ -0,0 +1,6 @@
+"""Пакет ленты записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from .fanout import fan_out_entries, sync_friend_pairs
+from .reader import get_feed_entries, get_feed_page, get_feed_positions, get_feed_version
@@ -0,0 +1,241 @@
+"""Модуль раскладки записей настроения по лентам пользователей (fan-out on write)"""
+
+__author__: str = "Digital Horizons"
+
+from collections import defaultdict
+from typing import Iterable
+
+from sqlalchemy import Connection, delete, event, inspect, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, UOWTransaction
+
+from consts.mood_entry import MoodEntryPublishStatus
+from core.config import settings
+from feed.friends import load_friends
+from feed.visibility import feed_audience, visible_to_viewer_clause
+from models import (
+    FeedInboxModel,
+    FeedPullAuthorModel,
+    FriendShipModel,
+    MoodEntryModel,
+    MoodEntryVisibilityModel,
+)
+
+
+def fan_out_entries(connection: Connection, entry_ids: Iterable[int]) -> None:
+    """
+    Пересборка строк лент для записей настроения
+
+    Args:
+        connection (Connection): подключение к БД текущей транзакции
+        entry_ids (Iterable[int]): идентификаторы новых или измененных записей
+
+    Examples:
+        >>> # После смены статуса записи 10 на "только для друзей"
+        >>> fan_out_entries(session.connection(), [10])
+
+    Notes:
+        Записи популярных авторов раскладываются только перечисленным в видимости пользователям (ONLY_USER),
+        остальным их подмешивает чтение ленты
+    """
+    entry_ids = set(entry_ids)
+
+    if not entry_ids:
+        return
+
+    connection.execute(delete(FeedInboxModel).where(FeedInboxModel.mood_entry_id.in_(entry_ids)))
+
+    entries = connection.execute(
+        select(
+            MoodEntryModel.id,
+            MoodEntryModel.user_id,
+            MoodEntryModel.status,
+            MoodEntryModel.created_at,
+        ).where(
+            MoodEntryModel.id.in_(entry_ids),
+            MoodEntryModel.deleted_at.is_(None),
+            MoodEntryModel.status != MoodEntryPublishStatus.FOR_ME,
+        )
+    ).all()
+
+    if not entries:
+        return
+
+    listed: dict[int, set[int]] = defaultdict(set)
+
+    for entry_id, user_id in connection.execute(
+        select(MoodEntryVisibilityModel.mood_entry_id, MoodEntryVisibilityModel.user_id).where(
+            MoodEntryVisibilityModel.mood_entry_id.in_(entry_ids)
+        )
+    ):
+        listed[entry_id].add(user_id)
+
+    author_ids: set[int] = {entry.user_id for entry in entries}
+    pull_author_ids: set[int] = set(
+        connection.scalars(
+            select(FeedPullAuthorModel.user_id).where(FeedPullAuthorModel.user_id.in_(author_ids))
+        )
+    )
+    friends: dict[int, set[int]] = load_friends(connection, author_ids - pull_author_ids)
+
+    rows: list[dict] = []
+
+    for entry_id, author_id, status, created_at in entries:
+        audience: set[int] = feed_audience(
+            status, set() if author_id in pull_author_ids else friends[author_id], listed[entry_id]
+        )
+        audience.discard(author_id)
+        rows.extend(
+            {
+                "owner_user_id": owner_id,
+                "mood_entry_id": entry_id,
+                "author_user_id": author_id,
+                "entry_created_at": created_at,
+            }
+            for owner_id in audience
+        )
+
+    if rows:
+        connection.execute(insert(FeedInboxModel).on_conflict_do_nothing(), rows)
+
+
+def sync_friend_pairs(connection: Connection, pairs: Iterable[tuple[int, int]]) -> None:
+    """
+    Пересборка лент двух пользователей после изменения дружбы между ними
+
+    Args:
+        connection (Connection): подключение к БД текущей транзакции
+        pairs (Iterable[tuple[int, int]]): пары идентификаторов пользователей
+
+    Notes:
+        Удаляет записи друг друга из лент и добавляет последние FEED_BACKFILL_LIMIT видимых записей
+    """
+    pairs = {tuple(sorted(pair)) for pair in pairs}
+
+    if not pairs:
+        return
+
+    user_ids: set[int] = {user_id for pair in pairs for user_id in pair}
+    friends: dict[int, set[int]] = load_friends(connection, user_ids)
+    _update_pull_authors(connection, {user_id: len(friends[user_id]) for user_id in user_ids})
+    pull_author_ids: set[int] = set(
+        connection.scalars(
+            select(FeedPullAuthorModel.user_id).where(FeedPullAuthorModel.user_id.in_(user_ids))
+        )
+    )
+
+    for first_id, second_id in pairs:
+        is_friend: bool = second_id in friends[first_id]
+
+        for owner_id, author_id in ((first_id, second_id), (second_id, first_id)):
+            connection.execute(
+                delete(FeedInboxModel).where(
+                    FeedInboxModel.owner_user_id == owner_id,
+                    FeedInboxModel.author_user_id == author_id,
+                )
+            )
+            recent_entries = (
+                select(
+                    literal(owner_id),
+                    MoodEntryModel.id,
+                    MoodEntryModel.user_id,
+                    MoodEntryModel.created_at,
+                )
+                .where(
+                    MoodEntryModel.user_id == author_id,
+                    visible_to_viewer_clause(owner_id, is_friend and author_id not in pull_author_ids),
+                )
+                .order_by(MoodEntryModel.created_at.desc())
+                .limit(settings.FEED_BACKFILL_LIMIT)
+            )
+            connection.execute(
+                insert(FeedInboxModel)
+                .from_select(
+                    ["owner_user_id", "mood_entry_id", "author_user_id", "entry_created_at"],
+                    recent_entries,
+                )
+                .on_conflict_do_nothing()
+            )
+
+
+def _update_pull_authors(connection: Connection, friends_count: dict[int, int]) -> None:
+    # Автор, переросший порог аудитории, переходит на сборку ленты при чтении. Обратного
+    # перехода нет, чтобы колебания количества друзей не пересобирали ленты раз за разом
+    new_pull_author_ids: set[int] = {
+        user_id
+        for user_id, count in friends_count.items()
+        if count > settings.FEED_FANOUT_MAX_AUDIENCE
+    }
+
+    if not new_pull_author_ids:
+        return
+
+    connection.execute(
+        insert(FeedPullAuthorModel)
+        .values([{"user_id": user_id} for user_id in new_pull_author_ids])
+        .on_conflict_do_nothing()
+    )
+    connection.execute(
+        delete(FeedInboxModel).where(
+            FeedInboxModel.author_user_id.in_(new_pull_author_ids),
+            FeedInboxModel.mood_entry_id.in_(
+                select(MoodEntryModel.id).where(
+                    MoodEntryModel.user_id.in_(new_pull_author_ids),
+                    MoodEntryModel.status != MoodEntryPublishStatus.ONLY_USER,
+                )
+            ),
+        )
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_feed_changes(session: Session, _: UOWTransaction) -> None:
+    entry_ids: set[int] = session.info.setdefault("feed_entry_ids", set())
+    friend_pairs: set[tuple[int, int]] = session.info.setdefault("feed_friend_pairs", set())
+
+    for instance in session.new:
+        if isinstance(instance, MoodEntryModel):
+            entry_ids.add(instance.id)
+        elif isinstance(instance, MoodEntryVisibilityModel):
+            entry_ids.add(instance.mood_entry_id)
+        elif isinstance(instance, FriendShipModel):
+            friend_pairs.add(
+                (instance.sender_request_user_id, instance.recipient_request_user_id)
+            )
+
+    for instance in session.dirty:
+        state = inspect(instance)
+
+        if isinstance(instance, MoodEntryModel):
+            if state.attrs.status.history.has_changes() or state.attrs.deleted_at.history.has_changes():
+                entry_ids.add(instance.id)
+        elif isinstance(instance, MoodEntryVisibilityModel):
+            entry_ids.update(state.attrs.mood_entry_id.history.sum())
+        elif isinstance(instance, FriendShipModel):
+            if state.attrs.status.history.has_changes():
+                friend_pairs.add(
+                    (instance.sender_request_user_id, instance.recipient_request_user_id)
+                )
+
+    for instance in session.deleted:
+        if isinstance(instance, MoodEntryVisibilityModel):
+            entry_ids.add(instance.mood_entry_id)
+        elif isinstance(instance, FriendShipModel):
+            friend_pairs.add(
+                (instance.sender_request_user_id, instance.recipient_request_user_id)
+            )
+
+    entry_ids.discard(None)
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _apply_feed_changes(session: Session, _: UOWTransaction) -> None:
+    entry_ids: set[int] = session.info.pop("feed_entry_ids", set())
+    friend_pairs: set[tuple[int, int]] = session.info.pop("feed_friend_pairs", set())
+
+    if not entry_ids and not friend_pairs:
+        return
+
+    connection: Connection = session.connection()
+    sync_friend_pairs(connection, friend_pairs)
+    fan_out_entries(connection, entry_ids)
@@ -0,0 +1,68 @@
+"""Модуль выборки друзей для построения ленты"""
+
+__author__: str = "Digital Horizons"
+
+from collections import defaultdict
+from typing import Iterable
+
+from sqlalchemy import CompoundSelect, Connection, select, union
+
+from consts.friendship import FriendshipStatus
+from friendship import accepted_pairs_select
+from models import FriendShipModel
+
+
+def friend_ids_select(user_id: int) -> CompoundSelect:
+    """
+    Запрос идентификаторов друзей пользователя
+
+    Args:
+        user_id (int): идентификатор пользователя
+
+    Returns:
+        CompoundSelect: запрос с одной колонкой идентификаторов друзей
+
+    Examples:
+        >>> from sqlalchemy import select
+        >>> from models import MoodEntryModel
+        >>>
+        >>> query = select(MoodEntryModel).where(MoodEntryModel.user_id.in_(friend_ids_select(user_id)))
+    """
+    return union(
+        select(FriendShipModel.recipient_request_user_id).where(
+            FriendShipModel.sender_request_user_id == user_id,
+            FriendShipModel.status == FriendshipStatus.ACCEPTED,
+        ),
+        select(FriendShipModel.sender_request_user_id).where(
+            FriendShipModel.recipient_request_user_id == user_id,
+            FriendShipModel.status == FriendshipStatus.ACCEPTED,
+        ),
+    )
+
+
+def load_friends(connection: Connection, user_ids: Iterable[int]) -> dict[int, set[int]]:
+    """
+    Загрузка друзей нескольких пользователей одним запросом
+
+    Args:
+        connection (Connection): подключение к БД текущей транзакции
+        user_ids (Iterable[int]): идентификаторы пользователей
+
+    Returns:
+        dict[int, set[int]]: идентификаторы друзей по пользователям
+
+    Notes:
+        Читает БД в текущей транзакции, а не граф дружбы воркера (friendship.friend_graph),
+        чтобы раскладка видела незакоммиченные изменения дружб
+    """
+    user_ids = set(user_ids)
+    friends: dict[int, set[int]] = defaultdict(set)
+
+    for sender_id, recipient_id in connection.execute(accepted_pairs_select(user_ids)):
+        if sender_id in user_ids:
+            friends[sender_id].add(recipient_id)
+
+        if recipient_id in user_ids:
+            friends[recipient_id].add(sender_id)
+
+    return friends
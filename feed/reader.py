@@ -0,0 +1,155 @@
+"""Модуль чтения ленты записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import datetime
+
+from sqlalchemy import Select, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from core.conditional import ResourceVersion, get_resource_version
+from core.pagination import encode_cursor
+from feed.friends import friend_ids_select
+from feed.visibility import visible_to_viewer_clause
+from models import FeedInboxModel, FeedPullAuthorModel, MoodEntryModel
+
+
+async def get_feed_page(
+    session_db: AsyncSession,
+    viewer_id: int,
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+) -> tuple[list[MoodEntryModel], str | None]:
+    """
+    Получение страницы ленты пользователя
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        viewer_id (int): идентификатор читающего ленту пользователя
+        limit (int): размер страницы
+        after (tuple[datetime, int] | None): позиция из курсора предыдущей страницы
+
+    Returns:
+        tuple[list[MoodEntryModel], str | None]: записи ленты от новых к старым и курсор следующей страницы.
+        Курсор None - страница последняя
+
+    Examples:
+        >>> from core.pagination import decode_cursor
+        >>>
+        >>> entries, cursor = await get_feed_page(session_db, identity.user_id, 20)
+        >>> next_entries, _ = await get_feed_page(session_db, identity.user_id, 20, decode_cursor(cursor))
+    """
+    entry_ids, next_cursor = await get_feed_positions(session_db, viewer_id, limit, after)
+    return await get_feed_entries(session_db, entry_ids), next_cursor
+
+
+async def get_feed_positions(
+    session_db: AsyncSession,
+    viewer_id: int,
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+) -> tuple[list[int], str | None]:
+    """
+    Получение идентификаторов записей страницы ленты без загрузки самих записей
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        viewer_id (int): идентификатор читающего ленту пользователя
+        limit (int): размер страницы
+        after (tuple[datetime, int] | None): позиция из курсора предыдущей страницы
+
+    Returns:
+        tuple[list[int], str | None]: идентификаторы записей от новых к старым и курсор следующей страницы.
+        Курсор None - страница последняя
+
+    Notes:
+        Основная часть берется из материализованной ленты, записи популярных друзей
+        (FeedPullAuthorModel) выбираются на лету и подмешиваются с сохранением порядка
+    """
+    inbox_query: Select = (
+        select(FeedInboxModel.entry_created_at, FeedInboxModel.mood_entry_id)
+        .where(FeedInboxModel.owner_user_id == viewer_id)
+        .order_by(FeedInboxModel.entry_created_at.desc(), FeedInboxModel.mood_entry_id.desc())
+        .limit(limit + 1)
+    )
+
+    if after is not None:
+        inbox_query = inbox_query.where(
+            tuple_(FeedInboxModel.entry_created_at, FeedInboxModel.mood_entry_id) < tuple_(*after)
+        )
+
+    candidates: set[tuple[datetime, int]] = set((await session_db.execute(inbox_query)).tuples())
+
+    pull_author_ids: list[int] = list(
+        await session_db.scalars(
+            select(FeedPullAuthorModel.user_id).where(
+                FeedPullAuthorModel.user_id.in_(friend_ids_select(viewer_id))
+            )
+        )
+    )
+
+    if pull_author_ids:
+        pull_query: Select = (
+            select(MoodEntryModel.created_at, MoodEntryModel.id)
+            .where(
+                MoodEntryModel.user_id.in_(pull_author_ids),
+                visible_to_viewer_clause(viewer_id),
+            )
+            .order_by(MoodEntryModel.created_at.desc(), MoodEntryModel.id.desc())
+            .limit(limit + 1)
+        )
+
+        if after is not None:
+            pull_query = pull_query.where(
+                tuple_(MoodEntryModel.created_at, MoodEntryModel.id) < tuple_(*after)
+            )
+
+        candidates.update((await session_db.execute(pull_query)).tuples())
+
+    positions: list[tuple[datetime, int]] = sorted(candidates, reverse=True)
+    next_cursor: str | None = encode_cursor(*positions[limit - 1]) if len(positions) > limit else None
+    return [entry_id for _, entry_id in positions[:limit]], next_cursor
+
+
+async def get_feed_entries(session_db: AsyncSession, entry_ids: list[int]) -> list[MoodEntryModel]:
+    """
+    Загрузка записей страницы ленты
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        entry_ids (list[int]): идентификаторы записей из get_feed_positions
+
+    Returns:
+        list[MoodEntryModel]: записи с загруженными тегами в порядке идентификаторов. Удаленные из БД записи пропускаются
+    """
+    if not entry_ids:
+        return []
+
+    entries: dict[int, MoodEntryModel] = {
+        entry.id: entry
+        for entry in await session_db.scalars(
+            select(MoodEntryModel)
+            .where(MoodEntryModel.id.in_(entry_ids))
+            .options(selectinload(MoodEntryModel.tags))
+        )
+    }
+
+    return [entries[entry_id] for entry_id in entry_ids if entry_id in entries]
+
+
+async def get_feed_version(session_db: AsyncSession, entry_ids: list[int]) -> ResourceVersion:
+    """
+    Версия записей страницы ленты для условных запросов
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        entry_ids (list[int]): идентификаторы записей из get_feed_positions
+
+    Returns:
+        ResourceVersion: наибольшее updated_at, количество и сумма updated_at записей страницы
+    """
+    if not entry_ids:
+        return ResourceVersion(None, 0, None)
+
+    return await get_resource_version(session_db, MoodEntryModel, MoodEntryModel.id.in_(entry_ids))
@@ -0,0 +1,81 @@
+"""Модуль правил видимости записей настроения в ленте"""
+
+__author__: str = "Digital Horizons"
+
+from sqlalchemy import ColumnElement, and_, exists, or_
+
+from consts.feed import FRIENDS_STATUSES, FRIENDS_EXCLUDED_STATUSES
+from consts.mood_entry import MoodEntryPublishStatus
+from models import MoodEntryModel, MoodEntryVisibilityModel
+
+
+def feed_audience(
+    status: MoodEntryPublishStatus, friends: set[int], listed: set[int]
+) -> set[int]:
+    """
+    Пользователи, в ленту которых попадает запись
+
+    Args:
+        status (MoodEntryPublishStatus): статус публикации записи
+        friends (set[int]): идентификаторы друзей автора
+        listed (set[int]): идентификаторы пользователей из видимости записи
+
+    Returns:
+        set[int]: идентификаторы получателей записи
+
+    Examples:
+        >>> # Друг 3 исключен из видимости записи
+        >>> feed_audience(MoodEntryPublishStatus.ONLY_FRIEND_EXCLUDED_USER, {2, 3}, {3}) # {2}
+
+    Notes:
+        Лента строится из записей друзей, поэтому публичные записи попадают в ленты только друзей автора.
+        Исключение - ONLY_USER: запись получают перечисленные пользователи, даже если они не друзья
+    """
+    if status in FRIENDS_STATUSES:
+        return set(friends)
+
+    if status in FRIENDS_EXCLUDED_STATUSES:
+        return friends - listed
+
+    if status == MoodEntryPublishStatus.ONLY_USER:
+        return set(listed)
+
+    return set()
+
+
+def visible_to_viewer_clause(viewer_id: int, is_friend: bool = True) -> ColumnElement[bool]:
+    """
+    Условие видимости записи автора для конкретного пользователя
+
+    Args:
+        viewer_id (int): идентификатор читающего ленту пользователя
+        is_friend (bool): читающий является другом автора записи
+
+    Returns:
+        ColumnElement[bool]: условие для запроса по MoodEntryModel
+
+    Examples:
+        >>> from sqlalchemy import select
+        >>>
+        >>> query = select(MoodEntryModel).where(visible_to_viewer_clause(viewer_id))
+
+    Notes:
+        Повторяет feed_audience на стороне БД. Не другу видны только записи ONLY_USER, где он перечислен
+    """
+    listed = exists().where(
+        MoodEntryVisibilityModel.mood_entry_id == MoodEntryModel.id,
+        MoodEntryVisibilityModel.user_id == viewer_id,
+    )
+    only_user = and_(MoodEntryModel.status == MoodEntryPublishStatus.ONLY_USER, listed)
+
+    if not is_friend:
+        return and_(MoodEntryModel.deleted_at.is_(None), only_user)
+
+    return and_(
+        MoodEntryModel.deleted_at.is_(None),
+        or_(
+            MoodEntryModel.status.in_(FRIENDS_STATUSES),
+            and_(MoodEntryModel.status.in_(FRIENDS_EXCLUDED_STATUSES), ~listed),
+            only_user,
+        ),
+    )
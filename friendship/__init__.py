@@ -0,0 +1,5 @@
+"""Пакет графа дружбы пользователей"""
+
+__author__: str = "Digital Horizons"
+
+from .graph import FriendGraph, accepted_pairs_select, friend_graph
@@ -0,0 +1,299 @@
+"""Модуль графа дружбы пользователей в памяти воркера"""
+
+__author__: str = "Digital Horizons"
+
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Any, Iterable
+
+from sqlalchemy import Select, event, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from consts.friendship import FriendshipStatus
+from core.cache import TTLCache
+from core.config import settings
+from core.database import PRIMARY_BIND_ARGUMENTS
+from core.replicas import RecentChanges
+from models import FriendShipModel
+
+# Код типа массива идентификаторов друзей (знаковое 64-битное целое)
+_ID_TYPECODE: str = "q"
+
+
+def accepted_pairs_select(user_ids: Iterable[int]) -> Select:
+    """
+    Запрос принятых дружб, в которых участвует хотя бы один из пользователей
+
+    Args:
+        user_ids (Iterable[int]): идентификаторы пользователей
+
+    Returns:
+        Select: запрос пар (отправитель, получатель) запроса в друзья
+    """
+    user_ids = set(user_ids)
+
+    return select(
+        FriendShipModel.sender_request_user_id, FriendShipModel.recipient_request_user_id
+    ).where(
+        FriendShipModel.status == FriendshipStatus.ACCEPTED,
+        or_(
+            FriendShipModel.sender_request_user_id.in_(user_ids),
+            FriendShipModel.recipient_request_user_id.in_(user_ids),
+        ),
+    )
+
+
+def _contains(friend_ids: array, user_id: int) -> bool:
+    position: int = bisect_left(friend_ids, user_id)
+    return position < len(friend_ids) and friend_ids[position] == user_id
+
+
+class FriendGraph:
+    """
+    Граф принятых дружб с отсортированными массивами друзей по пользователям
+
+    Attributes:
+        maxsize (int): максимальное количество пользователей в памяти
+        ttl (float): время жизни списка друзей пользователя в секундах
+        replica_lag (float): время после изменения дружбы, в течение которого друзья пользователя
+            загружаются из основной БД
+
+    Examples:
+        >>> if await friend_graph.are_friends(session_db, first_id, second_id):
+        ...     mutual: list[int] = await friend_graph.mutual_friends(session_db, first_id, second_id)
+
+    Notes:
+        Друзья пользователя хранятся отсортированным массивом целых (8 байт на связь), проверка
+        дружбы - двоичный поиск, общие друзья - поиск элементов меньшего массива в большем.
+        Отсутствующие в памяти пользователи догружаются из БД одним запросом на всех.
+        Изменения дружб через ORM применяются к загруженным массивам после коммита, изменения
+        из других воркеров становятся видны по истечении ttl. Загрузка, во время которой изменились
+        друзья пользователя, в память не попадает. В течение replica_lag после изменения друзья
+        загружаются из основной БД: реплика с отставанием вернула бы их без изменения на весь ttl
+    """
+
+    def __init__(self, maxsize: int, ttl: float, replica_lag: float):
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.replica_lag: float = replica_lag
+        self._adjacency: TTLCache[int, array] = TTLCache(maxsize, ttl)
+        self._recent: RecentChanges[int] = RecentChanges(replica_lag)
+        # Номер последнего изменения и номера изменений на момент начала идущих загрузок
+        self._generation: int = 0
+        self._changed: dict[int, int] = {}
+        self._loads: Counter[int] = Counter()
+
+    async def get_friends(self, session_db: AsyncSession, user_id: int) -> array:
+        """
+        Друзья пользователя
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при промахе кэша
+            user_id (int): идентификатор пользователя
+
+        Returns:
+            array: отсортированные идентификаторы друзей. Массив не изменяется вызывающим кодом
+        """
+        return (await self._load(session_db, [user_id]))[user_id]
+
+    async def are_friends(self, session_db: AsyncSession, first_id: int, second_id: int) -> bool:
+        """
+        Проверка дружбы двух пользователей
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при промахе кэша
+            first_id (int): идентификатор первого пользователя
+            second_id (int): идентификатор второго пользователя
+
+        Returns:
+            bool: пользователи друзья
+        """
+        return _contains(await self.get_friends(session_db, first_id), second_id)
+
+    async def mutual_friends(self, session_db: AsyncSession, first_id: int, second_id: int) -> list[int]:
+        """
+        Общие друзья двух пользователей
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при промахе кэша
+            first_id (int): идентификатор первого пользователя
+            second_id (int): идентификатор второго пользователя
+
+        Returns:
+            list[int]: отсортированные идентификаторы общих друзей
+        """
+        friends: dict[int, array] = await self._load(session_db, [first_id, second_id])
+        smaller, larger = sorted((friends[first_id], friends[second_id]), key=len)
+        return [user_id for user_id in smaller if _contains(larger, user_id)]
+
+    async def suggestions(
+        self, session_db: AsyncSession, user_id: int, limit: int
+    ) -> list[tuple[int, int]]:
+        """
+        Рекомендации друзей - друзья друзей, еще не ставшие друзьями
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при промахе кэша
+            user_id (int): идентификатор пользователя
+            limit (int): максимальное количество рекомендаций
+
+        Returns:
+            list[tuple[int, int]]: идентификаторы пользователей и количество общих друзей,
+            от большего количества к меньшему
+        """
+        friend_ids: array = await self.get_friends(session_db, user_id)
+        friends: dict[int, array] = await self._load(session_db, friend_ids)
+        mutual_counts: Counter[int] = Counter(
+            candidate_id for friend_id in friend_ids for candidate_id in friends[friend_id]
+        )
+        mutual_counts.pop(user_id, None)
+
+        return sorted(
+            (
+                (candidate_id, count)
+                for candidate_id, count in mutual_counts.items()
+                if not _contains(friend_ids, candidate_id)
+            ),
+            key=lambda item: (-item[1], item[0]),
+        )[:limit]
+
+    def apply(self, first_id: int, second_id: int, accepted: bool) -> None:
+        """
+        Обновление загруженных массивов после изменения дружбы
+
+        Args:
+            first_id (int): идентификатор первого пользователя
+            second_id (int): идентификатор второго пользователя
+            accepted (bool): пользователи стали друзьями. False - дружба прекращена
+        """
+        self._mark_changed(first_id, second_id)
+
+        for user_id, friend_id in ((first_id, second_id), (second_id, first_id)):
+            friend_ids: array | None = self._adjacency.peek(user_id)
+
+            if friend_ids is None:
+                continue
+
+            if accepted and not _contains(friend_ids, friend_id):
+                insort(friend_ids, friend_id)
+            elif not accepted and _contains(friend_ids, friend_id):
+                friend_ids.pop(bisect_left(friend_ids, friend_id))
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Сброс друзей пользователя
+
+        Args:
+            user_id (int): идентификатор пользователя
+        """
+        self._mark_changed(user_id)
+        self._adjacency.pop(user_id)
+
+    def clear(self) -> None:
+        """Очистка графа"""
+        self._adjacency.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика графа
+
+        Returns:
+            dict[str, int]: количество пользователей и связей в памяти, попадания и промахи
+        """
+        return {
+            **self._adjacency.stats(),
+            "edges": sum(len(friend_ids) for _, friend_ids in self._adjacency.items()),
+        }
+
+    async def _load(self, session_db: AsyncSession, user_ids: Iterable[int]) -> dict[int, array]:
+        friends: dict[int, array] = {}
+        missing_ids: set[int] = set()
+
+        for user_id in user_ids:
+            friend_ids: array | None = self._adjacency.get(user_id)
+
+            if friend_ids is None:
+                missing_ids.add(user_id)
+            else:
+                friends[user_id] = friend_ids
+
+        if not missing_ids:
+            return friends
+
+        loaded: dict[int, list[int]] = {user_id: [] for user_id in missing_ids}
+        bind_arguments: dict[str, Any] | None = (
+            PRIMARY_BIND_ARGUMENTS if any(self._recent.active(user_id) for user_id in missing_ids) else None
+        )
+        started: int = self._generation
+        self._loads[started] += 1
+
+        try:
+            rows: list[tuple[int, int]] = list(
+                await session_db.execute(accepted_pairs_select(missing_ids), bind_arguments=bind_arguments)
+            )
+        finally:
+            self._loads[started] -= 1
+
+            if not self._loads[started]:
+                del self._loads[started]
+
+        for sender_id, recipient_id in rows:
+            if sender_id in loaded:
+                loaded[sender_id].append(recipient_id)
+
+            if recipient_id in loaded:
+                loaded[recipient_id].append(sender_id)
+
+        for user_id, friend_ids in loaded.items():
+            friends[user_id] = array(_ID_TYPECODE, sorted(set(friend_ids)))
+
+            # Изменение во время загрузки уже применено к памяти, а строки загрузки могут его не содержать
+            if self._changed.get(user_id, 0) <= started:
+                self._adjacency.set(user_id, friends[user_id])
+
+        return friends
+
+    def _mark_changed(self, *user_ids: int) -> None:
+        self._generation += 1
+
+        # Номера изменений нужны только идущим загрузкам, поэтому более старые периодически удаляются
+        if len(self._changed) > 2 * self.maxsize:
+            oldest: int = min(self._loads, default=self._generation)
+            self._changed = {user_id: changed for user_id, changed in self._changed.items() if changed > oldest}
+
+        for user_id in user_ids:
+            self._changed[user_id] = self._generation
+            self._recent.mark(user_id)
+
+
+# Глобальный экземпляр графа дружбы
+friend_graph: FriendGraph = FriendGraph(
+    settings.FRIEND_GRAPH_CACHE_SIZE, settings.FRIEND_GRAPH_TTL, settings.DB_READ_YOUR_WRITES_WINDOW
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_friendship_changes(session: Session, _: UOWTransaction) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(instance, FriendShipModel):
+            continue
+
+        if instance in session.dirty and not inspect(instance).attrs.status.history.has_changes():
+            continue
+
+        session.info.setdefault("friendship_changes", {})[
+            (instance.sender_request_user_id, instance.recipient_request_user_id)
+        ] = instance not in session.deleted and instance.status == FriendshipStatus.ACCEPTED
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_friendship_changes(session: Session) -> None:
+    for (first_id, second_id), accepted in session.info.pop("friendship_changes", {}).items():
+        friend_graph.apply(first_id, second_id, accepted)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_friendship_changes(session: Session) -> None:
+    session.info.pop("friendship_changes", None)
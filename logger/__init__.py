@@ -2,5 +2,5 @@
 
 __author__: str = "Digital Horizons"
 
-from .common import app_logger
-from .middleware import logging_middleware
+from .common import app_logger, log_pipeline, setup_logger
+from .middleware import access_log_sampler, logging_middleware
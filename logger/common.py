@@ -7,87 +7,134 @@ from logging import Logger
 
 from loguru import logger
 
+from core.config import settings
 from logger.config import LoggerConfig
-from logger.consts import JSON_FORMAT, TEXT_FORMAT
+from logger.consts import TEXT_FORMAT
+from logger.pipeline import LogPipeline, LogRecord, LogTarget, serialize_json, serialize_text
+
+# Фоновая запись логов. Вызов логгера в обработке запроса только кладет запись в очередь
+log_pipeline: LogPipeline = LogPipeline(
+    settings.LOG_QUEUE_SIZE, settings.LOG_BATCH_SIZE, settings.LOG_FLUSH_INTERVAL
+)
+
+
+def _is_general_record(record: LogRecord) -> bool:
+    # Медленные выражения пишутся только в свой журнал: вместе с текстом SQL они забивали бы общие логи
+    return "slow_query" not in record["extra"]
 
 
 def setup_logger() -> Logger:
     """
-    Создание настроенного логгера приложения
+    Настройка обработчиков логгера приложения
 
     Returns:
         Logger: настроенный экземпляр логгера
 
     Examples:
-        >>> from logger.common import setup_logger
+        >>> from logger import setup_logger
         >>>
-        >>> app_logger: Logger = setup_logger()
+        >>> setup_logger() # При создании приложения или в начале команды
+
+    Notes:
+        Вызывается один раз при запуске процесса, а не при импорте: импорт модулей (тесты, миграции)
+        не создает каталог логов, файлы и поток записи. Повторные вызовы ничего не меняют.
+        До настройки записи пишутся стандартным обработчиком loguru в stderr
     """
+    if log_pipeline.started:
+        return logger
+
     config: LoggerConfig = LoggerConfig()
+    targets: list[LogTarget] = []
 
     # Удаляем стандартный обработчик
     logger.remove()
 
-    # Консольный вывод (всегда)
-    logger.add(
-        sys.stdout,
-        format=config.log_format,
-        level=config.log_level,
-        colorize=True,
-        backtrace=True,
-        diagnose=True,
-    )
+    # Консольный вывод (всегда). JSON пишется через очередь, цветной текст - сразу для разработки
+    if config.json_console:
+        targets.append(LogTarget(sys.stdout, config.log_level, serialize_json, filter=_is_general_record))
+    else:
+        logger.add(
+            sys.stdout,
+            format=TEXT_FORMAT,
+            level=config.log_level,
+            filter=_is_general_record,
+            colorize=True,
+            backtrace=True,
+            diagnose=True,
+        )
 
     # Файловый вывод для production
     if config.environment == "production":
         # Логи ошибок
-        logger.add(
-            config.log_path / "error.log",
-            format=JSON_FORMAT,
-            level="ERROR",
-            rotation="10 MB",
-            retention="30 days",
-            compression="zip",
-            backtrace=True,
-            diagnose=False,  # В production не показываем детали отладки
+        targets.append(
+            LogTarget(
+                config.log_path / "error.log",
+                "ERROR",
+                serialize_json,
+                rotation="10 MB",
+                retention="30 days",
+                compression="zip",
+            )
         )
 
         # Все логи
-        logger.add(
-            config.log_path / "app.log",
-            format=JSON_FORMAT,
-            level="INFO",
-            rotation="50 MB",
-            retention="7 days",
-            compression="zip",
-            backtrace=False,
-            diagnose=False,
+        targets.append(
+            LogTarget(
+                config.log_path / "app.log",
+                "INFO",
+                serialize_json,
+                filter=_is_general_record,
+                rotation="50 MB",
+                retention="7 days",
+                compression="zip",
+            )
         )
 
     # Логи для разработки
     else:
-        logger.add(
-            config.log_path / "debug.log",
-            format=TEXT_FORMAT,
-            level="DEBUG",
-            rotation="10 MB",
-            retention="3 days",
-            compression="zip",
+        targets.append(
+            LogTarget(
+                config.log_path / "debug.log",
+                "DEBUG",
+                serialize_text,
+                filter=_is_general_record,
+                rotation="10 MB",
+                retention="3 days",
+                compression="zip",
+            )
         )
 
     # Логи HTTP запросов
-    logger.add(
-        config.log_path / "http.log",
-        format=JSON_FORMAT,
-        level="INFO",
-        filter=lambda record: "http" in record["extra"],
-        rotation="20 MB",
-        retention="14 days",
-        compression="zip",
+    targets.append(
+        LogTarget(
+            config.log_path / "http.log",
+            "INFO",
+            serialize_json,
+            filter=lambda record: "http" in record["extra"],
+            rotation="20 MB",
+            retention="14 days",
+            compression="zip",
+        )
+    )
+
+    # Журнал медленных SQL выражений
+    targets.append(
+        LogTarget(
+            config.log_path / "slow_query.log",
+            "WARNING",
+            serialize_json,
+            filter=lambda record: "slow_query" in record["extra"],
+            rotation="20 MB",
+            retention="14 days",
+            compression="zip",
+        )
     )
 
+    log_pipeline.start(targets)
+    logger.add(log_pipeline.write, format="{message}", level=log_pipeline.min_level, catch=True)
+
     return logger
 
 
-# Глобальный экземпляр логгера
-app_logger: Logger = setup_logger()
+# Глобальный экземпляр логгера. Обработчики добавляет setup_logger при запуске процесса
+app_logger: Logger = logger
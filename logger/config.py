@@ -5,7 +5,6 @@ __author__: str = "Digital Horizons"
 from pathlib import Path
 
 from core.config import settings
-from logger.consts import JSON_FORMAT, TEXT_FORMAT
 
 
 class LoggerConfig:
@@ -16,6 +15,7 @@ class LoggerConfig:
         environment (str): текущая среда работы севрсиа
         log_level (str): устанавливаемы уровень логирования
         log_file_format (str): формат файла логирования
+        json_console (bool): вывод логов в консоль в формате JSON
 
     Examples:
         >>> import sys
@@ -60,22 +60,19 @@ class LoggerConfig:
         return path
 
     @property
-    def log_format(self) -> str:
+    def json_console(self) -> bool:
         """
-        Формат тескта логов в зависимости от выбраного типа файлов
+        Вывод логов в консоль в формате JSON в зависимости от выбраного типа файлов
 
         Returns:
-            str: формат записи логов
+            bool: True - JSON строки через очередь логов, False - цветной текст
 
         Examples:
-            Examples:
+            >>> import sys
             >>> from loguru import logger
             >>>
             >>> config: LoggerConfig = LoggerConfig()
-            >>> logger.add(
-            >>>     config.log_path / "error.log",
-            >>>     format=config.log_format,
-            >>>     level=config.log_level
-            >>> )
+            >>> if not config.json_console:
+            >>>     logger.add(sys.stdout, format=TEXT_FORMAT, colorize=True)
         """
-        return JSON_FORMAT if self.log_file_format == "json" else TEXT_FORMAT
+        return self.log_file_format == "json"
@@ -7,13 +7,21 @@ import uuid
 
 from fastapi import Request, Response
 
+from core.config import settings
+from core.db_timing import DbTiming, start_db_timing, stop_db_timing
 from logger import app_logger
+from logger.sampling import AccessLogSampler, SampleDecision
 
 
 class LoggingMiddleware:
     """
     Middleware для логирования запросов в FastAPI
 
+    Attributes:
+        sampler (AccessLogSampler): выбор запросов для журнала по правилам путей
+        combined (bool): одна запись на запрос вместо записей о начале и завершении
+        repeat_threshold (int): порог одинаковых SQL выражений в запросе для предупреждения об N+1. 0 - отключено
+
     Examples:
         >>> from fastapi import FastAPI
         >>> from logger import logging_middleware
@@ -29,60 +37,134 @@ setup_cors(app)
 @app.middleware("http")
 async def add_logging_middleware(request: Request, call_next):
     return await logging_middleware(request, call_next)
+
+    Notes:
+        Ошибочные (HTTP_LOG_ERROR_STATUS и выше) и медленные (HTTP_LOG_SLOW_REQUEST_MS и дольше) запросы
+        записываются независимо от выборки, запись о начале запроса - только для попавших в выборку.
+        Предупреждения об N+1 также пишутся независимо от выборки
     """
+    def __init__(self, sampler: AccessLogSampler, combined: bool, repeat_threshold: int = 0):
+        self.sampler: AccessLogSampler = sampler
+        self.combined: bool = combined
+        self.repeat_threshold: int = repeat_threshold
+
     async def __call__(self, request: Request, call_next):
+        path: str = request.scope["path"]
+        rule, sample_rate = self.sampler.match(path)
+
+        # Исключенные пути (документация, проверки доступности) не логируются совсем
+        if sample_rate is None:
+            self.sampler.count(rule, SampleDecision.EXCLUDED)
+            return await call_next(request)
+
         # Генерируем ID запроса
         request_id: str = str(uuid.uuid4())
+        request.state.request_id = request_id
+        query_string: bytes = request.scope["query_string"]
+        url: str = f"{path}?{query_string.decode('latin-1')}" if query_string else path
+        sampled: bool = self.sampler.sample(sample_rate)
 
-        # Засекаем время выполнения
-        start_time: float = time.time()
+        # Засекаем время выполнения и время работы с БД
+        start_time: float = time.perf_counter()
+        db_timing, db_timing_token = start_db_timing(request_id, self.repeat_threshold)
 
-        # Логируем входящий запрос
-        app_logger.bind(
-            http=True,
-            request_id=request_id,
-            method=request.method,
-            url=str(request.url),
-            client_host=request.client.host if request.client else None,
-            user_agent=request.headers.get("user-agent")
-        ).info("Incoming request")
+        # Логируем входящий запрос, если записи о начале и завершении раздельные
+        if sampled and not self.combined:
+            app_logger.bind(
+                http=True,
+                request_id=request_id,
+                method=request.method,
+                url=url,
+                client_host=request.client.host if request.client else None,
+                user_agent=request.headers.get("user-agent"),
+                sample_rate=sample_rate,
+            ).info("Incoming request")
 
         try:
             response: Response = await call_next(request)
+        except Exception as exc:
+            stop_db_timing(db_timing_token)
 
-            # Время выполнения
-            process_time: float = time.time() - start_time
+            # Ошибки логируются всегда
+            process_time: float = time.perf_counter() - start_time
+            self.sampler.count(rule, SampleDecision.SAMPLED if sampled else SampleDecision.FORCED)
 
-            # Логируем ответ
             app_logger.bind(
                 http=True,
                 request_id=request_id,
                 method=request.method,
-                url=str(request.url),
-                status_code=response.status_code,
-                process_time=round(process_time, 4)
-            ).info("Request completed")
-
-            # Добавляем ID запроса в заголовки ответа
-            response.headers["X-Request-ID"] = request_id
-
-            return response
+                url=url,
+                process_time=round(process_time, 4),
+                error_type=type(exc).__name__,
+                sample_rate=sample_rate,
+                **db_timing.log_fields(),
+            ).error(f"Request failed: {str(exc)}")
 
-        except Exception as exc:
-            # Логируем ошибку
-            process_time = time.time() - start_time
+            raise
 
-            app_logger.bind(
+        # Время выполнения
+        process_time = time.perf_counter() - start_time
+        stop_db_timing(db_timing_token)
+        self._log_repeated_statements(db_timing, request_id, request.method, url)
+        decision: SampleDecision = self.sampler.decide(
+            rule, sampled, response.status_code, process_time * 1000
+        )
+
+        # Логируем ответ: попавшие в выборку, ошибочные и медленные запросы
+        if decision != SampleDecision.SAMPLED_OUT:
+            completed_logger = app_logger.bind(
                 http=True,
                 request_id=request_id,
                 method=request.method,
-                url=str(request.url),
+                url=url,
+                status_code=response.status_code,
                 process_time=round(process_time, 4),
-                error_type=type(exc).__name__
-            ).error(f"Request failed: {str(exc)}")
+                sample_rate=sample_rate,
+                forced=decision == SampleDecision.FORCED,
+                **db_timing.log_fields(),
+            )
+
+            if self.combined:
+                completed_logger = completed_logger.bind(
+                    client_host=request.client.host if request.client else None,
+                    user_agent=request.headers.get("user-agent"),
+                )
+
+            completed_logger.info("Request completed")
+
+        # Добавляем ID запроса и время работы с БД в заголовки ответа
+        response.headers["X-Request-ID"] = request_id
+        response.headers["Server-Timing"] = (
+            f"{db_timing.server_timing()}, app;dur={round(process_time * 1000, 3)}"
+        )
+
+        return response
+
+    @staticmethod
+    def _log_repeated_statements(db_timing: DbTiming, request_id: str, method: str, url: str) -> None:
+        for pattern in db_timing.repeated_statements():
+            app_logger.bind(
+                n_plus_one=True,
+                request_id=request_id,
+                method=method,
+                url=url,
+                **pattern,
+            ).warning("N+1 query pattern detected")
 
-            raise
 
+# Выборка запросов для журнала HTTP запросов
+access_log_sampler: AccessLogSampler = AccessLogSampler(
+    settings.HTTP_LOG_SAMPLE_RATE,
+    settings.HTTP_LOG_ROUTE_SAMPLE_RATES,
+    settings.HTTP_LOG_EXCLUDE_PATHS,
+    settings.HTTP_LOG_SLOW_REQUEST_MS,
+    settings.HTTP_LOG_ERROR_STATUS,
+)
 
 # Создаем экземпляр middleware
-logging_middleware: LoggingMiddleware = LoggingMiddleware()
+# Поиск N+1 работает в режиме отладки и там, где включен явно (staging)
+logging_middleware: LoggingMiddleware = LoggingMiddleware(
+    access_log_sampler,
+    settings.HTTP_LOG_COMBINED,
+    settings.DB_N_PLUS_ONE_THRESHOLD if settings.DEBUG or settings.DB_N_PLUS_ONE_DETECTION else 0,
+)
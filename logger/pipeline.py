@@ -0,0 +1,320 @@
+"""Модуль фоновой записи логов через ограниченную очередь"""
+
+__author__: str = "Digital Horizons"
+
+import atexit
+import copy
+import queue
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, TextIO
+
+import orjson
+from loguru import logger
+
+from core.config import settings
+
+# Запись лога loguru (Message.record)
+LogRecord = dict[str, Any]
+# Строки записи лога для назначений: индекс назначения и строка
+SerializedRecord = list[tuple[int, str]]
+# Метка остановки фонового писателя в очереди
+_STOP: object = object()
+
+
+def serialize_json(record: LogRecord) -> str:
+    """
+    Сериализация записи лога в строку JSON
+
+    Args:
+        record (LogRecord): запись лога loguru
+
+    Returns:
+        str: JSON объект с полями записи и всеми полями, привязанными через bind
+
+    Examples:
+        >>> app_logger.bind(request_id="42").info('Say "hi"')
+        >>> # {"request_id":"42","time":"...","level":"INFO","message":"Say \\"hi\\"",...}
+    """
+    data: dict[str, Any] = {
+        **record["extra"],
+        "time": record["time"].isoformat(timespec="milliseconds"),
+        "level": record["level"].name,
+        "message": record["message"],
+        "module": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "environment": settings.environment,
+    }
+
+    if record["exception"] is not None:
+        data["exception"] = "".join(traceback.format_exception(*record["exception"]))
+
+    return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def serialize_text(record: LogRecord) -> str:
+    """
+    Сериализация записи лога в строку для чтения человеком
+
+    Args:
+        record (LogRecord): запись лога loguru
+
+    Returns:
+        str: строка в формате TEXT_FORMAT без цветов, с трассировкой исключения при наличии
+    """
+    line: str = (
+        f"{record['time']:%Y-%m-%d %H:%M:%S}.{record['time'].microsecond // 1000:03d} | "
+        f"{record['level'].name: <8} | "
+        f"{record['name']}:{record['function']}:{record['line']} | "
+        f"{record['message']}"
+    )
+
+    if record["exception"] is not None:
+        line += "\n" + "".join(traceback.format_exception(*record["exception"])).rstrip("\n")
+
+    return line
+
+
+@dataclass(frozen=True, slots=True)
+class LogTarget:
+    """
+    Назначение записи логов
+
+    Attributes:
+        sink (Path | TextIO): путь к файлу или поток вывода
+        level (str): минимальный уровень записей
+        serializer (Callable[[LogRecord], str]): преобразование записи в строку
+        filter (Callable[[LogRecord], bool] | None): дополнительный отбор записей
+        rotation (str | None): условие ротации файла в формате loguru
+        retention (str | None): срок хранения файлов в формате loguru
+        compression (str | None): формат сжатия файлов после ротации
+
+    Examples:
+        >>> LogTarget(Path("logs/app.log"), "INFO", serialize_json, rotation="50 MB", retention="7 days")
+    """
+
+    sink: Path | TextIO
+    level: str
+    serializer: Callable[[LogRecord], str]
+    filter: Callable[[LogRecord], bool] | None = None
+    rotation: str | None = None
+    retention: str | None = None
+    compression: str | None = None
+
+
+class LogPipeline:
+    """
+    Запись логов фоновым потоком: вызов логгера только кладет запись в очередь
+
+    Attributes:
+        maxsize (int): максимальное количество записей в очереди
+        batch_size (int): максимальное количество записей, записываемых за раз
+        flush_interval (float): время накопления пачки в секундах после первой записи
+        dropped (int): количество записей, отброшенных из-за переполнения очереди
+        written (int): количество записанных записей
+
+    Examples:
+        >>> from loguru import logger
+        >>>
+        >>> pipeline: LogPipeline = LogPipeline(maxsize=10000, batch_size=500, flush_interval=0.05)
+        >>> logger.remove()
+        >>> pipeline.start([LogTarget(Path("logs/app.log"), "INFO", serialize_json)])
+        >>> logger.add(pipeline.write, format="{message}")
+        >>> ...
+        >>> pipeline.stop() # Запись оставшихся в очереди записей
+
+    Notes:
+        Отбор по назначениям и сериализация выполняются при вызове логгера, один раз на сериализатор:
+        поток писателя, сериализующий целую пачку, держал бы GIL и задерживал обработку запросов
+        сильнее синхронной записи. Писатель только объединяет готовые строки: записи копятся не дольше
+        flush_interval и пишутся одной записью на каждое назначение, ротацию и хранение файлов выполняет loguru.
+        Обработчик loguru назначения создается писателем перед первой записью в него: создание обработчика
+        занимает миллисекунды и не задерживает запуск воркера, а назначения без записей не открываются.
+        При переполнении очереди запись отбрасывается без ожидания, писатель сообщает о количестве
+        отброшенных записей строкой в stderr в обход очереди
+    """
+
+    def __init__(self, maxsize: int, batch_size: int, flush_interval: float):
+        self.maxsize: int = maxsize
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.dropped: int = 0
+        self.written: int = 0
+        self._queue: queue.Queue = queue.Queue(maxsize)
+        self._targets: list[tuple[int, LogTarget]] = []
+        self._writer_logger = None
+        self._thread: threading.Thread | None = None
+        self._opened: set[int] = set()
+        self._reported_dropped: int = 0
+
+    def start(self, targets: list[LogTarget]) -> None:
+        """
+        Настройка назначений и запуск потока писателя
+
+        Args:
+            targets (list[LogTarget]): назначения записи логов
+
+        Notes:
+            Вызывается после logger.remove(): отдельный логгер писателя копируется из глобального без обработчиков.
+            Файлы и обработчики назначений открывает поток писателя при первой записи в назначение
+        """
+        self._writer_logger = copy.deepcopy(logger)
+        self._writer_logger.remove()
+        self._targets = [(logger.level(target.level).no, target) for target in targets]
+
+        self._thread = threading.Thread(target=self._run, name="log-pipeline", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    @property
+    def started(self) -> bool:
+        """Поток писателя запущен"""
+        return self._thread is not None
+
+    @property
+    def min_level(self) -> int:
+        """Минимальный уровень записей среди назначений"""
+        return min((level for level, _ in self._targets), default=0)
+
+    def write(self, message: Any) -> None:
+        """
+        Обработчик loguru: постановка записи в очередь без ожидания
+
+        Args:
+            message (Any): сообщение loguru с записью в атрибуте record
+        """
+        record: LogRecord = message.record
+        serialized: dict[Callable[[LogRecord], str], str] = {}
+        lines: SerializedRecord = []
+
+        for index, (level, target) in enumerate(self._targets):
+            if record["level"].no >= level and (target.filter is None or target.filter(record)):
+                if target.serializer not in serialized:
+                    serialized[target.serializer] = target.serializer(record)
+
+                lines.append((index, serialized[target.serializer]))
+
+        if not lines:
+            return
+
+        try:
+            self._queue.put_nowait(lines)
+        except queue.Full:
+            self.dropped += 1
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Запись оставшихся в очереди записей и остановка потока писателя
+
+        Args:
+            timeout (float): максимальное время ожидания в секундах
+        """
+        if self._thread is None or not self._thread.is_alive():
+            return
+
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+
+        self._thread.join(timeout)
+        self._writer_logger.remove()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика очереди логов
+
+        Returns:
+            dict[str, int]: размер очереди, количество записанных и отброшенных записей
+        """
+        return {"queued": self._queue.qsize(), "written": self.written, "dropped": self.dropped}
+
+    def _run(self) -> None:
+        stopping: bool = False
+
+        while not stopping:
+            records: list[Any] = [self._queue.get()]
+
+            # Писатель не просыпается на каждую запись: пачка копится flush_interval, если не набралась раньше
+            if records[0] is not _STOP and self._queue.qsize() < self.batch_size:
+                time.sleep(self.flush_interval)
+
+            while len(records) < self.batch_size:
+                try:
+                    records.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            if _STOP in records:
+                stopping = True
+                records = [record for record in records if record is not _STOP]
+
+            try:
+                self._write(records)
+            except Exception:  # noqa: BLE001 - поток писателя не должен останавливаться из-за одной пачки
+                traceback.print_exc(file=sys.stderr)
+
+            self._report_dropped()
+
+    def _write(self, records: list[SerializedRecord]) -> None:
+        lines: dict[int, list[str]] = {}
+
+        for record in records:
+            for index, line in record:
+                lines.setdefault(index, []).append(line)
+
+        for index, target_lines in lines.items():
+            if index not in self._opened:
+                self._open_target(index)
+
+            self._writer_logger.bind(pipeline_target=index).log("TRACE", "\n".join(target_lines))
+
+        self.written += len(records)
+
+    def _open_target(self, index: int) -> None:
+        target: LogTarget = self._targets[index][1]
+        options: dict[str, Any] = {"colorize": False}
+
+        if isinstance(target.sink, Path):
+            options = {
+                "rotation": target.rotation,
+                "retention": target.retention,
+                "compression": target.compression,
+                "encoding": "utf-8",
+            }
+
+        self._writer_logger.add(
+            target.sink,
+            format="{message}",
+            level=0,
+            filter=lambda record: record["extra"].get("pipeline_target") == index,
+            catch=True,
+            **options,
+        )
+        self._opened.add(index)
+
+    def _report_dropped(self) -> None:
+        dropped: int = self.dropped
+
+        # Сообщение через логгер попало бы в ту же переполненную очередь и тоже было бы отброшено
+        if dropped > self._reported_dropped:
+            sys.stderr.write(
+                orjson.dumps(
+                    {
+                        "time": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+                        "level": "WARNING",
+                        "message": "Log records dropped: queue is full",
+                        "dropped": dropped - self._reported_dropped,
+                        "dropped_total": dropped,
+                    }
+                ).decode()
+                + "\n"
+            )
+            sys.stderr.flush()
+            self._reported_dropped = dropped
@@ -0,0 +1,156 @@
+"""Модуль выборочного логирования HTTP запросов"""
+
+__author__: str = "Digital Horizons"
+
+import random
+from collections import Counter
+from enum import StrEnum
+
+
+class SampleDecision(StrEnum):
+    """
+    Решения о записи запроса в журнал
+
+    Attributes:
+        SAMPLED (str): запрос попал в выборку
+        SAMPLED_OUT (str): запрос не попал в выборку и не записан
+        FORCED (str): запрос не попал в выборку, но записан как ошибочный или медленный
+        EXCLUDED (str): путь исключен из журнала
+    """
+
+    SAMPLED = "sampled"
+    SAMPLED_OUT = "sampled_out"
+    FORCED = "forced"
+    EXCLUDED = "excluded"
+
+
+# Правило путей, не попавших ни под одно из настроенных
+DEFAULT_RULE: str = "*"
+
+
+class AccessLogSampler:
+    """
+    Выбор запросов для журнала HTTP запросов по правилам путей с подсчетом решений
+
+    Attributes:
+        default_rate (float): доля записываемых запросов для путей без правила
+        slow_request_ms (float): время обработки, после которого запрос записывается всегда
+        error_status (int): код ответа, начиная с которого запрос записывается всегда
+
+    Examples:
+        >>> sampler: AccessLogSampler = AccessLogSampler(1.0, {"/feed*": 0.1}, ["/docs"], 1000.0, 500)
+        >>> rule, rate = sampler.match("/feed") # ("/feed*", 0.1)
+        >>> sampled: bool = sampler.sample(rate)
+        >>> decision: SampleDecision = sampler.decide(rule, sampled, status_code=200, duration_ms=12.5)
+
+    Notes:
+        Правило с "*" на конце - префикс пути, иначе - точное совпадение; из префиксов выбирается самый длинный.
+        Счетчики ведутся по правилам, а не по путям, чтобы их количество не зависело от идентификаторов в путях.
+        Записанные запросы несут долю выборки, поэтому общее количество восстанавливается как сумма 1 / rate
+    """
+
+    def __init__(
+        self,
+        default_rate: float,
+        route_rates: dict[str, float],
+        exclude_paths: list[str],
+        slow_request_ms: float,
+        error_status: int,
+    ):
+        self.default_rate: float = default_rate
+        self.slow_request_ms: float = slow_request_ms
+        self.error_status: int = error_status
+        rules: dict[str, float | None] = {**route_rates, **dict.fromkeys(exclude_paths)}
+        self._exact: dict[str, tuple[str, float | None]] = {
+            rule: (rule, rate) for rule, rate in rules.items() if not rule.endswith("*")
+        }
+        self._prefixes: list[tuple[str, str, float | None]] = sorted(
+            ((rule[:-1], rule, rate) for rule, rate in rules.items() if rule.endswith("*")),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._counters: dict[str, Counter[SampleDecision]] = {}
+
+    def match(self, path: str) -> tuple[str, float | None]:
+        """
+        Правило и доля выборки для пути запроса
+
+        Args:
+            path (str): путь запроса без параметров
+
+        Returns:
+            tuple[str, float | None]: правило и доля выборки. None - путь исключен из журнала
+        """
+        exact: tuple[str, float | None] | None = self._exact.get(path)
+
+        if exact is not None:
+            return exact
+
+        for prefix, rule, rate in self._prefixes:
+            if path.startswith(prefix):
+                return rule, rate
+
+        return DEFAULT_RULE, self.default_rate
+
+    @staticmethod
+    def sample(rate: float) -> bool:
+        """
+        Случайный выбор запроса с заданной долей
+
+        Args:
+            rate (float): доля выборки от 0 до 1
+
+        Returns:
+            bool: запрос попал в выборку
+        """
+        return rate >= 1 or random.random() < rate
+
+    def decide(self, rule: str, sampled: bool, status_code: int, duration_ms: float) -> SampleDecision:
+        """
+        Итоговое решение о записи завершенного запроса с учетом ошибок и длительности
+
+        Args:
+            rule (str): правило пути из match
+            sampled (bool): запрос попал в выборку
+            status_code (int): код ответа
+            duration_ms (float): время обработки в миллисекундах
+
+        Returns:
+            SampleDecision: решение, учтенное в счетчиках правила
+        """
+        if sampled:
+            decision: SampleDecision = SampleDecision.SAMPLED
+        elif status_code >= self.error_status or duration_ms >= self.slow_request_ms:
+            decision = SampleDecision.FORCED
+        else:
+            decision = SampleDecision.SAMPLED_OUT
+
+        self.count(rule, decision)
+        return decision
+
+    def count(self, rule: str, decision: SampleDecision) -> None:
+        """
+        Учет решения о записи запроса
+
+        Args:
+            rule (str): правило пути
+            decision (SampleDecision): решение
+        """
+        counter: Counter[SampleDecision] | None = self._counters.get(rule)
+
+        if counter is None:
+            counter = self._counters[rule] = Counter()
+
+        counter[decision] += 1
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Счетчики решений по правилам
+
+        Returns:
+            dict[str, dict[str, int]]: количество запросов по решениям и всего для каждого правила
+        """
+        return {
+            rule: {**{decision.value: counter[decision] for decision in SampleDecision}, "total": counter.total()}
+            for rule, counter in self._counters.items()
+        }
@@ -1,25 +1,159 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+
 from fastapi import FastAPI, Request
 from fastapi.responses import RedirectResponse
 
+from consts.startup import STARTUP_PROFILE_TOP_MODULES
 from core.config import settings
-from logger import logging_middleware
-from security import setup_cors
+from core.startup import StartupProfile
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Запуск фоновых задач приложения и освобождение подключений к БД при остановке"""
+    profile: StartupProfile = app.state.startup_profile
+    background_tasks: list[asyncio.Task] = []
+
+    with profile.imports_timed(), profile.step("lifespan"):
+        from core.database import engine, replica_set
+        from core.pool import log_pool_stats
+        from logger import app_logger, log_pipeline
+        from metrics.runtime import collect_runtime_metrics
+        from mood_entries import entry_write_buffer
+
+        if settings.DB_POOL_STATS_LOG_INTERVAL > 0:
+            background_tasks.append(
+                asyncio.create_task(log_pool_stats(engine, settings.DB_POOL_STATS_LOG_INTERVAL))
+            )
+
+        if settings.METRICS_COLLECT_INTERVAL > 0:
+            background_tasks.append(
+                asyncio.create_task(
+                    collect_runtime_metrics(engine, replica_set.engines, settings.METRICS_COLLECT_INTERVAL)
+                )
+            )
+
+        if replica_set:
+            background_tasks.append(
+                asyncio.create_task(
+                    replica_set.run_health_checks(
+                        settings.DB_REPLICA_HEALTH_CHECK_INTERVAL,
+                        settings.DB_REPLICA_HEALTH_CHECK_TIMEOUT,
+                    )
+                )
+            )
+
+        if settings.ENTRY_WRITE_BUFFER:
+            entry_write_buffer.start()
+
+    if profile.enabled:
+        app_logger.bind(startup_profile=profile.report(STARTUP_PROFILE_TOP_MODULES)).info("Startup profile")
+
+    yield
+
+    # Буфер записывает принятые записи до закрытия подключений к БД
+    await entry_write_buffer.stop()
+
+    for task in background_tasks:
+        task.cancel()
+
+    await replica_set.dispose()
+    await engine.dispose()
+    log_pipeline.stop()
+
+
+def create_app() -> FastAPI:
+    """
+    Создание приложения
+
+    Returns:
+        FastAPI: приложение с маршрутами и middleware
+
+    Examples:
+        Запуск через фабрику:
+            uvicorn main:create_app --factory
+
+        Запуск с профилем запуска в логе:
+            STARTUP_PROFILE=true uvicorn main:create_app --factory
+
+    Notes:
+        Логгер, движок БД, модели и маршруты импортируются и настраиваются здесь, а не при импорте
+        модуля: импорт main ничего не создает. main:app создается при первом обращении к атрибуту
+    """
+    profile: StartupProfile = StartupProfile(settings.STARTUP_PROFILE)
+
+    with profile.imports_timed():
+        with profile.step("logger"):
+            from logger import logging_middleware, setup_logger
+
+            setup_logger()
+
+        with profile.step("models"):
+            from models import load_models
+
+            load_models()
+
+        with profile.step("routers"):
+            from routers import (
+                feed_router,
+                friends_router,
+                internal_router,
+                metrics_router,
+                mood_entries_router,
+                settings_router,
+                stats_router,
+                tags_router,
+            )
+
+        with profile.step("app"):
+            from metrics import metrics_middleware
+            from security import setup_cors
+
+            app: FastAPI = FastAPI(
+                title=settings.APP_NAME,
+                description="БЛ приложения для отслеживания настроения",
+                docs_url="/docs" if settings.environment != "production" else None,
+                lifespan=lifespan,
+            )
+            app.state.startup_profile = profile
+
+            setup_cors(app)
+
+            # Служебные маршруты подключаются только вместе с токеном доступа к ним
+            if settings.INTERNAL_TOKEN is not None:
+                app.include_router(internal_router)
+                app.include_router(metrics_router)
+
+            app.include_router(feed_router)
+            app.include_router(mood_entries_router)
+            app.include_router(stats_router)
+            app.include_router(tags_router)
+            app.include_router(friends_router)
+            app.include_router(settings_router)
+
+            @app.middleware("http")
+            async def add_logging_middleware(request: Request, call_next):
+                return await logging_middleware(request, call_next)
 
-app: FastAPI = FastAPI(
-    title=settings.APP_NAME,
-    description="БЛ приложения для отслеживания настроения",
-    docs_url="/docs" if settings.environment != "production" else None
-)
+            @app.middleware("http")
+            async def add_metrics_middleware(request: Request, call_next):
+                return await metrics_middleware(request, call_next)
 
-setup_cors(app)
+            @app.get("/")
+            def read_root():
+                """Редирект на страницу документации"""
+                return RedirectResponse(url="/docs")
 
+    return app
 
-@app.middleware("http")
-async def add_logging_middleware(request: Request, call_next):
-    return await logging_middleware(request, call_next)
 
+def __getattr__(name: str) -> Any:
+    # uvicorn main:app и from main import app создают приложение при первом обращении
+    if name == "app":
+        app: FastAPI = create_app()
+        globals()["app"] = app
+        return app
 
-@app.get("/")
-def read_root():
-    """Редирект на страницу документации"""
-    return RedirectResponse(url="/docs")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,18 @@
+"""Пакет метрик приложения"""
+
+__author__: str = "Digital Horizons"
+
+from .registry import Counter, Gauge, Histogram, MetricsRegistry
+from .common import (
+    db_pool_checked_out,
+    db_pool_overflow,
+    db_pool_size,
+    db_query_duration_seconds,
+    http_request_duration_seconds,
+    http_requests_in_progress,
+    http_requests_total,
+    log_queue_size,
+    log_records_dropped_total,
+    metrics_registry,
+)
+from .middleware import metrics_middleware
@@ -0,0 +1,42 @@
+"""Модуль метрик приложения"""
+
+__author__: str = "Digital Horizons"
+
+from consts.metrics import DB_QUERY_BUCKETS, HTTP_DURATION_BUCKETS
+from core.config import settings
+from metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+
+# Глобальный реестр метрик. Значения хранятся в файле, общем для воркеров сервера
+metrics_registry: MetricsRegistry = MetricsRegistry(
+    settings.METRICS_FILE, settings.METRICS_WORKER_SLOTS, settings.METRICS_SLOT_SIZE
+)
+
+# HTTP запросы
+http_requests_total: Counter = metrics_registry.counter(
+    "http_requests_total", "HTTP requests by route and status", ("method", "route", "status")
+)
+http_request_duration_seconds: Histogram = metrics_registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request processing time by route",
+    ("method", "route"),
+    HTTP_DURATION_BUCKETS,
+)
+http_requests_in_progress: Gauge = metrics_registry.gauge(
+    "http_requests_in_progress", "HTTP requests being processed"
+)
+
+# Работа с БД
+db_query_duration_seconds: Histogram = metrics_registry.histogram(
+    "db_query_duration_seconds", "SQL statement execution time", (), DB_QUERY_BUCKETS
+)
+db_pool_size: Gauge = metrics_registry.gauge("db_pool_size", "Persistent connections in DB pools", ("pool",))
+db_pool_checked_out: Gauge = metrics_registry.gauge("db_pool_checked_out", "DB connections in use", ("pool",))
+db_pool_overflow: Gauge = metrics_registry.gauge(
+    "db_pool_overflow", "DB connections opened over the pool size", ("pool",)
+)
+
+# Очередь логов
+log_queue_size: Gauge = metrics_registry.gauge("log_queue_size", "Log records waiting in the queue")
+log_records_dropped_total: Counter = metrics_registry.counter(
+    "log_records_dropped_total", "Log records dropped because the queue was full"
+)
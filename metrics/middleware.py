@@ -0,0 +1,52 @@
+"""Модуль middleware для метрик HTTP запросов"""
+
+__author__: str = "Digital Horizons"
+
+import time
+
+from fastapi import Request, Response
+from starlette.routing import BaseRoute
+
+from consts.metrics import UNMATCHED_ROUTE
+from metrics.common import http_request_duration_seconds, http_requests_in_progress, http_requests_total
+
+
+class MetricsMiddleware:
+    """
+    Middleware для учета количества и времени обработки HTTP запросов
+
+    Examples:
+        >>> from fastapi import FastAPI
+        >>> from metrics import metrics_middleware
+        >>>
+        >>> app: FastAPI = FastAPI()
+        >>> @app.middleware("http")
+        >>> async def add_metrics_middleware(request: Request, call_next):
+        >>>     return await metrics_middleware(request, call_next)
+
+    Notes:
+        Метка route - шаблон пути маршрута (/friends/{user_id}/mutual), а не фактический путь,
+        чтобы количество рядов метрик не зависело от идентификаторов в запросах
+    """
+
+    async def __call__(self, request: Request, call_next):
+        start_time: float = time.perf_counter()
+        status_code: int = 500
+        http_requests_in_progress.inc()
+
+        try:
+            response: Response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            process_time: float = time.perf_counter() - start_time
+            route: BaseRoute | None = request.scope.get("route")
+            route_path: str = getattr(route, "path", UNMATCHED_ROUTE)
+
+            http_requests_in_progress.dec()
+            http_requests_total.inc(request.method, route_path, str(status_code))
+            http_request_duration_seconds.observe(process_time, request.method, route_path)
+
+
+# Создаем экземпляр middleware
+metrics_middleware: MetricsMiddleware = MetricsMiddleware()
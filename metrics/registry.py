@@ -0,0 +1,326 @@
+"""Модуль реестра метрик приложения"""
+
+__author__: str = "Digital Horizons"
+
+import json
+from bisect import bisect_left
+from enum import StrEnum
+from pathlib import Path
+from typing import TypeVar
+
+from metrics.storage import SharedMetricsFile
+
+
+class MetricType(StrEnum):
+    """Тип метрики в формате Prometheus"""
+
+    COUNTER = "counter"
+    GAUGE = "gauge"
+    HISTOGRAM = "histogram"
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...] | list[str]) -> str:
+    if not names:
+        return ""
+
+    escaped: list[str] = [
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values
+    ]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(names, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+class Metric:
+    """
+    Метрика с метками
+
+    Attributes:
+        name (str): название метрики
+        documentation (str): описание метрики для HELP
+        labelnames (tuple[str, ...]): названия меток
+    """
+
+    type: MetricType
+
+    def __init__(self, storage: SharedMetricsFile, name: str, documentation: str, labelnames: tuple[str, ...]):
+        self.name: str = name
+        self.documentation: str = documentation
+        self.labelnames: tuple[str, ...] = labelnames
+        self._storage: SharedMetricsFile = storage
+        self._keys: dict[tuple[str, ...], str] = {}
+
+    def _key(self, values: tuple[str, ...], suffix: str = "") -> str:
+        # Ключ значения в общем файле: тип и название метрики, суффикс и значения меток
+        return json.dumps([self.type, self.name, suffix, values], ensure_ascii=False)
+
+    def _label_key(self, values: tuple[str, ...]) -> str:
+        key: str | None = self._keys.get(values)
+
+        if key is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {values}")
+
+            key = self._keys[values] = self._key(values)
+
+        return key
+
+    def render(self, samples: dict[tuple[str, tuple[str, ...]], float]) -> list[str]:
+        """
+        Строки метрики в текстовом формате Prometheus
+
+        Args:
+            samples (dict[tuple[str, tuple[str, ...]], float]): суммарные значения по суффиксам и значениям меток
+
+        Returns:
+            list[str]: строки HELP, TYPE и значений
+        """
+        lines: list[str] = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+
+        for (suffix, values), value in sorted(samples.items()):
+            lines.append(f"{self.name}{suffix}{_format_labels(self.labelnames, values)} {_format_value(value)}")
+
+        return lines
+
+
+class Counter(Metric):
+    """
+    Счетчик: значение только растет, суммируется по всем воркерам
+
+    Examples:
+        >>> requests_total: Counter = metrics_registry.counter("requests_total", "Requests", ("status",))
+        >>> requests_total.inc("200")
+    """
+
+    type = MetricType.COUNTER
+
+    def inc(self, *values: str, amount: float = 1.0) -> None:
+        """
+        Увеличение счетчика
+
+        Args:
+            values (str): значения меток в порядке labelnames
+            amount (float): величина увеличения
+        """
+        self._storage.add(self._label_key(values), amount)
+
+
+class Gauge(Metric):
+    """
+    Текущее значение: суммируется по работающим воркерам
+
+    Examples:
+        >>> in_progress: Gauge = metrics_registry.gauge("requests_in_progress", "Requests in progress")
+        >>> in_progress.inc()
+        >>> in_progress.dec()
+    """
+
+    type = MetricType.GAUGE
+
+    def set(self, value: float, *values: str) -> None:
+        """
+        Установка значения
+
+        Args:
+            value (float): новое значение
+            values (str): значения меток в порядке labelnames
+        """
+        self._storage.set(self._label_key(values), value)
+
+    def inc(self, *values: str, amount: float = 1.0) -> None:
+        """
+        Увеличение значения
+
+        Args:
+            values (str): значения меток в порядке labelnames
+            amount (float): величина увеличения
+        """
+        self._storage.add(self._label_key(values), amount)
+
+    def dec(self, *values: str, amount: float = 1.0) -> None:
+        """
+        Уменьшение значения
+
+        Args:
+            values (str): значения меток в порядке labelnames
+            amount (float): величина уменьшения
+        """
+        self._storage.add(self._label_key(values), -amount)
+
+
+class Histogram(Metric):
+    """
+    Гистограмма с фиксированными корзинами
+
+    Attributes:
+        buckets (tuple[float, ...]): верхние границы корзин по возрастанию, без "+Inf"
+
+    Examples:
+        >>> duration: Histogram = metrics_registry.histogram("duration_seconds", "Duration", ("route",), (0.1, 1.0))
+        >>> duration.observe(0.05, "/feed")
+
+    Notes:
+        В файле хранится количество значений в каждой корзине и сумма, накопительные значения
+        корзин и _count вычисляются при выводе
+    """
+
+    type = MetricType.HISTOGRAM
+
+    def __init__(
+        self,
+        storage: SharedMetricsFile,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...],
+    ):
+        super().__init__(storage, name, documentation, labelnames)
+        self.buckets: tuple[float, ...] = buckets
+        self._bounds: tuple[str, ...] = (*map(_format_value, map(float, buckets)), "+Inf")
+        self._bucket_keys: dict[tuple[str, ...], tuple[list[str], str]] = {}
+
+    def observe(self, value: float, *values: str) -> None:
+        """
+        Учет значения
+
+        Args:
+            value (float): наблюдаемое значение
+            values (str): значения меток в порядке labelnames
+        """
+        keys: tuple[list[str], str] | None = self._bucket_keys.get(values)
+
+        if keys is None:
+            self._label_key(values)
+            keys = self._bucket_keys[values] = (
+                [self._key(values, f"_bucket:{bound}") for bound in self._bounds],
+                self._key(values, "_sum"),
+            )
+
+        bucket_keys, sum_key = keys
+        self._storage.add(bucket_keys[bisect_left(self.buckets, value)], 1)
+        self._storage.add(sum_key, value)
+
+    def render(self, samples: dict[tuple[str, tuple[str, ...]], float]) -> list[str]:
+        lines: list[str] = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        label_values: set[tuple[str, ...]] = {values for _, values in samples}
+
+        for values in sorted(label_values):
+            cumulative: float = 0.0
+
+            for bound in self._bounds:
+                cumulative += samples.get((f"_bucket:{bound}", values), 0.0)
+                lines.append(
+                    f"{self.name}_bucket{_format_labels((*self.labelnames, 'le'), (*values, bound))} "
+                    f"{_format_value(cumulative)}"
+                )
+
+            labels: str = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(samples.get(('_sum', values), 0.0))}")
+            lines.append(f"{self.name}_count{labels} {_format_value(cumulative)}")
+
+        return lines
+
+
+MetricT = TypeVar("MetricT", bound=Metric)
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик, значения которых общие для воркеров сервера
+
+    Attributes:
+        storage (SharedMetricsFile): файл значений метрик
+
+    Examples:
+        >>> registry: MetricsRegistry = MetricsRegistry(Path("/tmp/metrics.mmap"), slots=32, slot_size=1024 * 1024)
+        >>> requests_total: Counter = registry.counter("requests_total", "Requests", ("status",))
+        >>> requests_total.inc("200")
+        >>> print(registry.render()) # Сумма по всем воркерам в формате Prometheus
+
+    Notes:
+        Метрики объявляются при импорте модулей, поэтому набор метрик одинаков во всех воркерах.
+        Текущие значения gauge завершившихся воркеров в выводе не учитываются
+    """
+
+    def __init__(self, path: Path, slots: int, slot_size: int):
+        self.storage: SharedMetricsFile = SharedMetricsFile(
+            path, slots, slot_size, lambda key: key.startswith(f'["{MetricType.GAUGE}"')
+        )
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """
+        Объявление счетчика
+
+        Args:
+            name (str): название метрики
+            documentation (str): описание метрики
+            labelnames (tuple[str, ...]): названия меток
+
+        Returns:
+            Counter: счетчик
+        """
+        return self._register(Counter(self.storage, name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """
+        Объявление текущего значения
+
+        Args:
+            name (str): название метрики
+            documentation (str): описание метрики
+            labelnames (tuple[str, ...]): названия меток
+
+        Returns:
+            Gauge: текущее значение
+        """
+        return self._register(Gauge(self.storage, name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: tuple[str, ...], buckets: tuple[float, ...]
+    ) -> Histogram:
+        """
+        Объявление гистограммы
+
+        Args:
+            name (str): название метрики
+            documentation (str): описание метрики
+            labelnames (tuple[str, ...]): названия меток
+            buckets (tuple[float, ...]): верхние границы корзин по возрастанию
+
+        Returns:
+            Histogram: гистограмма
+        """
+        return self._register(Histogram(self.storage, name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Значения всех метрик в текстовом формате Prometheus
+
+        Returns:
+            str: суммы значений по всем воркерам
+        """
+        samples: dict[str, dict[tuple[str, tuple[str, ...]], float]] = {name: {} for name in self._metrics}
+
+        for key, value in self.storage.read().items():
+            _, name, suffix, values = json.loads(key)
+
+            # Значения метрик, удаленных из кода, могут остаться в файле от прошлых запусков
+            if name in samples:
+                samples[name][(suffix, tuple(values))] = value
+
+        lines: list[str] = []
+
+        for name, metric in self._metrics.items():
+            lines.extend(metric.render(samples[name]))
+
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: MetricT) -> MetricT:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+
+        self._metrics[metric.name] = metric
+        return metric
@@ -0,0 +1,82 @@
+"""Модуль метрик состояния воркера: пулы подключений к БД и очередь логов"""
+
+__author__: str = "Digital Horizons"
+
+import asyncio
+import threading
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from core.pool import get_pool_stats
+from logger import log_pipeline
+from metrics.common import (
+    db_pool_checked_out,
+    db_pool_overflow,
+    db_pool_size,
+    log_queue_size,
+    log_records_dropped_total,
+)
+
+# Количество отброшенных записей логов воркера, уже добавленное в счетчик
+_dropped_counted: int = 0
+# Блокировка прироста счетчика: обновление идет из цикла событий и из пула потоков маршрута /metrics
+_dropped_lock: threading.Lock = threading.Lock()
+
+
+def update_runtime_metrics(engine: AsyncEngine, replicas: list[AsyncEngine]) -> None:
+    """
+    Обновление метрик пулов подключений и очереди логов текущего воркера
+
+    Args:
+        engine (AsyncEngine): асинхронный движок основной БД
+        replicas (list[AsyncEngine]): асинхронные движки реплик. Метка pool пула реплики - replica_<номер>
+
+    Notes:
+        Безопасно для одновременного вызова из цикла событий и из потоков
+    """
+    global _dropped_counted
+
+    pools: dict[str, AsyncEngine] = {"primary": engine}
+    pools.update({f"replica_{index}": replica for index, replica in enumerate(replicas)})
+
+    for pool, pool_engine in pools.items():
+        pool_stats: dict[str, Any] = get_pool_stats(pool_engine)
+
+        if "size" in pool_stats:
+            db_pool_size.set(pool_stats["size"], pool)
+            db_pool_checked_out.set(pool_stats["checked_out"], pool)
+            db_pool_overflow.set(max(pool_stats["overflow"], 0), pool)
+
+    log_stats: dict[str, int] = log_pipeline.stats()
+    log_queue_size.set(log_stats["queued"])
+
+    # В счетчик добавляется прирост с прошлого обновления: значение растет и переживает перезапуск воркера
+    with _dropped_lock:
+        if log_stats["dropped"] > _dropped_counted:
+            log_records_dropped_total.inc(amount=log_stats["dropped"] - _dropped_counted)
+            _dropped_counted = log_stats["dropped"]
+
+
+async def collect_runtime_metrics(engine: AsyncEngine, replicas: list[AsyncEngine], interval: int) -> None:
+    """
+    Периодическое обновление метрик состояния воркера
+
+    Args:
+        engine (AsyncEngine): асинхронный движок основной БД
+        replicas (list[AsyncEngine]): асинхронные движки реплик
+        interval (int): период обновления в секундах
+
+    Examples:
+        >>> import asyncio
+        >>> from core.database import engine, replica_set
+        >>>
+        >>> task: asyncio.Task = asyncio.create_task(collect_runtime_metrics(engine, replica_set.engines, 5))
+
+    Notes:
+        Значения пишутся в общий файл, поэтому вывод /metrics любым воркером содержит
+        состояние всех воркеров не старше interval
+    """
+    while True:
+        update_runtime_metrics(engine, replicas)
+        await asyncio.sleep(interval)
@@ -0,0 +1,270 @@
+"""Модуль хранения значений метрик в файле, общем для воркеров"""
+
+__author__: str = "Digital Horizons"
+
+import fcntl
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Callable, Iterator
+
+# Заголовок области воркера: занятый объем в байтах и pid владельца
+_HEADER: struct.Struct = struct.Struct("<QQ")
+# Длина ключа записи
+_KEY_LENGTH: struct.Struct = struct.Struct("<I")
+# Значение записи
+_VALUE: struct.Struct = struct.Struct("<d")
+
+
+def _aligned(size: int) -> int:
+    return (size + 7) & ~7
+
+
+class SharedMetricsFile:
+    """
+    Значения метрик воркеров в одном файле, отображенном в память
+
+    Attributes:
+        path (Path): путь к файлу
+        slots (int): количество областей воркеров в файле
+        slot_size (int): размер области одного воркера в байтах
+        slot (int | None): номер области текущего воркера. None - файл еще не открыт или области заняты
+        is_volatile (Callable[[str], bool]): отбор значений, действующих только пока жив воркер (текущие значения gauge)
+        overflowed (int): количество значений, не записанных из-за заполнения области
+
+    Examples:
+        >>> storage: SharedMetricsFile = SharedMetricsFile(
+        ...     Path("/tmp/metrics.mmap"), slots=32, slot_size=1024 * 1024, is_volatile=lambda key: False
+        ... )
+        >>> storage.add("requests", 1)
+        >>> print(storage.read()) # {'requests': 3.0} - сумма по трем воркерам
+
+    Notes:
+        Каждый воркер пишет только в свою область, которую держит блокировкой fcntl до завершения
+        процесса, поэтому запись идет без межпроцессных блокировок. Область завершившегося воркера
+        занимает следующий запущенный: накопленные значения сохраняются, а изменчивые обнуляются.
+        При чтении значения суммируются по всем областям, изменчивые - только по живым воркерам.
+        Если файл недоступен или все области заняты, значения хранятся в памяти воркера
+    """
+
+    def __init__(self, path: Path, slots: int, slot_size: int, is_volatile: Callable[[str], bool]):
+        self.path: Path = path
+        self.slots: int = slots
+        self.slot_size: int = slot_size
+        self.is_volatile: Callable[[str], bool] = is_volatile
+        self.slot: int | None = None
+        self.overflowed: int = 0
+        self._lock: threading.Lock = threading.Lock()
+        self._fd: int | None = None
+        self._file: mmap.mmap | None = None
+        self._base: int = 0
+        self._used: int = _HEADER.size
+        self._offsets: dict[str, int] = {}
+        os.register_at_fork(after_in_child=self._forget)
+
+    def open(self) -> None:
+        """
+        Открытие файла и захват свободной области текущим процессом
+
+        Notes:
+            Вызывается при первой записи. После fork процесс открывает файл заново: блокировки fcntl не наследуются
+        """
+        self.close()
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+
+            if os.fstat(self._fd).st_size < self.slots * self.slot_size:
+                os.ftruncate(self._fd, self.slots * self.slot_size)
+
+            self._file = mmap.mmap(self._fd, self.slots * self.slot_size)
+        except OSError:
+            self.close()
+
+        if self._file is not None:
+            for slot in range(self.slots):
+                try:
+                    fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot * self.slot_size)
+                except OSError:
+                    continue
+
+                self.slot = slot
+                self._base = slot * self.slot_size
+                break
+
+        # Без файла или свободной области значения воркера хранятся только в его памяти
+        if self.slot is None:
+            if self._file is not None:
+                self._file.close()
+
+            self._file = mmap.mmap(-1, self.slot_size)
+            self._base = 0
+
+        self._used = max(_HEADER.unpack_from(self._file, self._base)[0], _HEADER.size)
+
+        for key, offset in self._iter_slot(self._base):
+            self._offsets[key] = offset
+
+            if self.is_volatile(key):
+                _VALUE.pack_into(self._file, offset, 0.0)
+
+        _HEADER.pack_into(self._file, self._base, self._used, os.getpid())
+
+    def close(self) -> None:
+        """Закрытие файла и освобождение области"""
+        if self._file is not None:
+            self._file.close()
+
+        if self._fd is not None:
+            os.close(self._fd)
+
+        self._file = None
+        self._fd = None
+        self.slot = None
+        self._offsets = {}
+
+    def in_use(self) -> bool:
+        """
+        Проверка, что областью файла владеет живой процесс, например воркер другого сервера
+
+        Returns:
+            bool: True, если хотя бы одна область файла занята
+
+        Notes:
+            Вызывается до открытия файла текущим процессом: закрытие проверочного дескриптора снимает
+            все блокировки fcntl процесса на этот файл
+        """
+        try:
+            fd: int = os.open(self.path, os.O_RDWR)
+        except FileNotFoundError:
+            return False
+
+        try:
+            for slot in range(self.slots):
+                try:
+                    fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot * self.slot_size)
+                except OSError:
+                    return True
+
+                fcntl.lockf(fd, fcntl.LOCK_UN, 1, slot * self.slot_size)
+        finally:
+            os.close(fd)
+
+        return False
+
+    def add(self, key: str, amount: float) -> None:
+        """
+        Увеличение значения
+
+        Args:
+            key (str): ключ значения
+            amount (float): величина увеличения
+        """
+        with self._lock:
+            offset: int | None = self._offsets.get(key) or self._offset(key)
+
+            if offset is not None:
+                _VALUE.pack_into(self._file, offset, _VALUE.unpack_from(self._file, offset)[0] + amount)
+
+    def set(self, key: str, value: float) -> None:
+        """
+        Установка значения
+
+        Args:
+            key (str): ключ значения
+            value (float): новое значение
+        """
+        with self._lock:
+            offset: int | None = self._offsets.get(key) or self._offset(key)
+
+            if offset is not None:
+                _VALUE.pack_into(self._file, offset, value)
+
+    def read(self) -> dict[str, float]:
+        """
+        Суммы значений по всем воркерам
+
+        Returns:
+            dict[str, float]: суммы значений по ключам
+        """
+        with self._lock:
+            self._ensure_open()
+            totals: dict[str, float] = {}
+            slots: range | list[int | None] = range(self.slots) if self.slot is not None else [None]
+
+            for slot in slots:
+                base: int = self._base if slot is None else slot * self.slot_size
+
+                if _HEADER.unpack_from(self._file, base)[0] <= _HEADER.size:
+                    continue
+
+                alive: bool = slot is None or slot == self.slot or self._is_alive(slot)
+
+                for key, offset in self._iter_slot(base):
+                    if alive or not self.is_volatile(key):
+                        totals[key] = totals.get(key, 0.0) + _VALUE.unpack_from(self._file, offset)[0]
+
+            return totals
+
+    def _ensure_open(self) -> None:
+        if self._file is None:
+            self.open()
+
+    def _forget(self) -> None:
+        # Дочерний процесс не владеет областью родителя: файл откроется заново при первой записи
+        self._lock = threading.Lock()
+        self._file = None
+        self._fd = None
+        self.slot = None
+        self._offsets = {}
+
+    def _offset(self, key: str) -> int | None:
+        self._ensure_open()
+        offset: int | None = self._offsets.get(key)
+
+        if offset is not None:
+            return offset
+
+        encoded: bytes = key.encode()
+        position: int = self._base + self._used
+        offset = position + _aligned(_KEY_LENGTH.size + len(encoded))
+        used: int = offset + _VALUE.size - self._base
+
+        if used > self.slot_size:
+            self.overflowed += 1
+            return None
+
+        # Запись добавляется целиком до увеличения занятого объема: читатели не видят неполных записей
+        _KEY_LENGTH.pack_into(self._file, position, len(encoded))
+        self._file[position + _KEY_LENGTH.size : position + _KEY_LENGTH.size + len(encoded)] = encoded
+        _VALUE.pack_into(self._file, offset, 0.0)
+        _HEADER.pack_into(self._file, self._base, used, os.getpid())
+        self._used = used
+        self._offsets[key] = offset
+        return offset
+
+    def _iter_slot(self, base: int) -> Iterator[tuple[str, int]]:
+        used: int = min(_HEADER.unpack_from(self._file, base)[0], self.slot_size)
+        position: int = base + _HEADER.size
+
+        while position + _KEY_LENGTH.size <= base + used:
+            length: int = _KEY_LENGTH.unpack_from(self._file, position)[0]
+            offset: int = position + _aligned(_KEY_LENGTH.size + length)
+
+            if offset + _VALUE.size > base + used:
+                break
+
+            yield self._file[position + _KEY_LENGTH.size : position + _KEY_LENGTH.size + length].decode(), offset
+            position = offset + _VALUE.size
+
+    def _is_alive(self, slot: int) -> bool:
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot * self.slot_size)
+        except OSError:
+            return True
+
+        fcntl.lockf(self._fd, fcntl.LOCK_UN, 1, slot * self.slot_size)
+        return False
@@ -0,0 +1,54 @@
+"""Make tag_id, mood_entry_id index of mood entry tags unique
+
+Revision ID: 366852448b99
+Revises: 93e504fb3d7f
+Create Date: 2026-10-18 18:47:05.291736
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '366852448b99'
+down_revision: Union[str, Sequence[str], None] = '93e504fb3d7f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Повторные связи тега с записью удаляются, остается первая: иначе уникальный индекс не построить
+    op.execute(
+        'DELETE FROM mood_entry_tags AS duplicate USING mood_entry_tags AS original '
+        'WHERE duplicate.tag_id = original.tag_id AND duplicate.mood_entry_id = original.mood_entry_id '
+        'AND duplicate.id > original.id'
+    )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_mood_entry_tags_tag_id_mood_entry_id',
+            'mood_entry_tags',
+            ['tag_id', 'mood_entry_id'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_mood_entry_tags_tag_id_mood_entry_id', table_name='mood_entry_tags', postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mood_entry_tags_tag_id_mood_entry_id',
+            'mood_entry_tags',
+            ['tag_id', 'mood_entry_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'uq_mood_entry_tags_tag_id_mood_entry_id', table_name='mood_entry_tags', postgresql_concurrently=True
+        )
@@ -0,0 +1,42 @@
+"""Add mood entry keyset index
+
+Revision ID: 55a8ec95b8d8
+Revises: 72236686eef0
+Create Date: 2026-10-18 12:55:02.841163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '55a8ec95b8d8'
+down_revision: Union[str, Sequence[str], None] = '72236686eef0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Индекс строится без блокировки записи в таблицу, что невозможно внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mood_entry_user_id_created_at_id',
+            'mood_entry',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_mood_entry_user_id_created_at_id',
+            table_name='mood_entry',
+            postgresql_concurrently=True,
+        )
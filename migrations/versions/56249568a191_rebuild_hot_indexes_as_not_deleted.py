@@ -0,0 +1,52 @@
+"""Rebuild hot indexes as not deleted partial indexes
+
+Revision ID: 56249568a191
+Revises: 5da33a7ae6b5
+Create Date: 2026-10-18 14:48:03.125907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '56249568a191'
+down_revision: Union[str, Sequence[str], None] = '5da33a7ae6b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Полные индексы и заменяющие их частичные: таблица, колонка, старый индекс, новый индекс
+INDEXES: list[tuple[str, str, str, str]] = [
+    ('mood_entry', 'status', 'ix_mood_entry_status', 'ix_mood_entry_status_not_deleted'),
+    ('user', 'surname', 'ix_user_surname', 'ix_user_surname_not_deleted'),
+    ('user', 'name', 'ix_user_name', 'ix_user_name_not_deleted'),
+    ('user', 'patronymic', 'ix_user_patronymic', 'ix_user_patronymic_not_deleted'),
+    ('contact', 'type', 'ix_contact_type', 'ix_contact_type_not_deleted'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Новый индекс строится до удаления старого, чтобы запросы не оставались без индекса.
+    # Оба действия выполняются без блокировки записи в таблицу, что невозможно внутри транзакции
+    with op.get_context().autocommit_block():
+        for table, column, old_index, new_index in INDEXES:
+            op.create_index(
+                new_index,
+                table,
+                [column],
+                unique=False,
+                postgresql_where=sa.text('deleted_at IS NULL'),
+                postgresql_concurrently=True,
+            )
+            op.drop_index(old_index, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, column, old_index, new_index in INDEXES:
+            op.create_index(old_index, table, [column], unique=False, postgresql_concurrently=True)
+            op.drop_index(new_index, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,42 @@
+"""Add mood entry user_id updated_at index
+
+Revision ID: 5da33a7ae6b5
+Revises: 89594cf6f5f8
+Create Date: 2026-10-18 14:05:12.418236
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5da33a7ae6b5'
+down_revision: Union[str, Sequence[str], None] = '89594cf6f5f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Индекс строится без блокировки записи в таблицу, что невозможно внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mood_entry_user_id_updated_at',
+            'mood_entry',
+            ['user_id', 'updated_at'],
+            unique=False,
+            postgresql_where=sa.text('deleted_at IS NULL'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_mood_entry_user_id_updated_at',
+            table_name='mood_entry',
+            postgresql_concurrently=True,
+        )
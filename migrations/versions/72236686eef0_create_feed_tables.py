@@ -0,0 +1,60 @@
+"""Create feed tables
+
+Revision ID: 72236686eef0
+Revises: c1481f006401
+Create Date: 2026-10-18 12:10:41.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '72236686eef0'
+down_revision: Union[str, Sequence[str], None] = 'c1481f006401'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('feed_inbox',
+    sa.Column('owner_user_id', sa.Integer(), nullable=False),
+    sa.Column('mood_entry_id', sa.Integer(), nullable=False),
+    sa.Column('author_user_id', sa.Integer(), nullable=False),
+    sa.Column('entry_created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['author_user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['mood_entry_id'], ['mood_entry.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['owner_user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('owner_user_id', 'mood_entry_id')
+    )
+    op.create_index(op.f('ix_feed_inbox_id'), 'feed_inbox', ['id'], unique=False)
+    op.create_index('ix_feed_inbox_owner_user_id_entry_created_at', 'feed_inbox', ['owner_user_id', 'entry_created_at', 'mood_entry_id'], unique=False)
+    op.create_index('ix_feed_inbox_mood_entry_id', 'feed_inbox', ['mood_entry_id'], unique=False)
+    op.create_index('ix_feed_inbox_author_user_id_owner_user_id', 'feed_inbox', ['author_user_id', 'owner_user_id'], unique=False)
+    op.create_table('feed_pull_author',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_feed_pull_author_id'), 'feed_pull_author', ['id'], unique=False)
+    op.create_index(op.f('ix_feed_pull_author_user_id'), 'feed_pull_author', ['user_id'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_feed_pull_author_user_id'), table_name='feed_pull_author')
+    op.drop_index(op.f('ix_feed_pull_author_id'), table_name='feed_pull_author')
+    op.drop_table('feed_pull_author')
+    op.drop_index('ix_feed_inbox_author_user_id_owner_user_id', table_name='feed_inbox')
+    op.drop_index('ix_feed_inbox_mood_entry_id', table_name='feed_inbox')
+    op.drop_index('ix_feed_inbox_owner_user_id_entry_created_at', table_name='feed_inbox')
+    op.drop_index(op.f('ix_feed_inbox_id'), table_name='feed_inbox')
+    op.drop_table('feed_inbox')
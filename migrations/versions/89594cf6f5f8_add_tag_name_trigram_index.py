@@ -0,0 +1,45 @@
+"""Add tag name trigram index
+
+Revision ID: 89594cf6f5f8
+Revises: 8e74be16b977
+Create Date: 2026-10-18 13:21:36.508417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '89594cf6f5f8'
+down_revision: Union[str, Sequence[str], None] = '8e74be16b977'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # Индекс строится без блокировки записи в таблицу, что невозможно внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tag_name_trgm',
+            'tag',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tag_name_trgm',
+            table_name='tag',
+            postgresql_concurrently=True,
+        )
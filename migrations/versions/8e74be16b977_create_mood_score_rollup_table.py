@@ -0,0 +1,45 @@
+"""Create mood score rollup table
+
+Revision ID: 8e74be16b977
+Revises: 55a8ec95b8d8
+Create Date: 2026-10-18 13:02:47.120934
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e74be16b977'
+down_revision: Union[str, Sequence[str], None] = '55a8ec95b8d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('mood_score_rollup',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.Enum('day', 'week', 'month', name='mood_rollup_period_enum'), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.BigInteger(), nullable=False),
+    sa.Column('score_min', sa.SmallInteger(), nullable=False),
+    sa.Column('score_max', sa.SmallInteger(), nullable=False),
+    sa.Column('score_sum_squares', sa.BigInteger(), nullable=False),
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'period', 'period_start')
+    )
+    op.create_index(op.f('ix_mood_score_rollup_id'), 'mood_score_rollup', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_mood_score_rollup_id'), table_name='mood_score_rollup')
+    op.drop_table('mood_score_rollup')
@@ -0,0 +1,40 @@
+"""Make tag name unique per user instead of globally
+
+Revision ID: 93e504fb3d7f
+Revises: ff59be4f242f
+Create Date: 2026-10-18 18:02:11.583204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '93e504fb3d7f'
+down_revision: Union[str, Sequence[str], None] = 'ff59be4f242f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Индекс строится без блокировки записи, затем становится ограничением и заменяет глобальную уникальность
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'tag_user_id_name_key',
+            'tag',
+            ['user_id', 'name'],
+            unique=True,
+            postgresql_concurrently=True,
+            postgresql_nulls_not_distinct=True,
+        )
+
+    op.execute('ALTER TABLE tag ADD CONSTRAINT tag_user_id_name_key UNIQUE USING INDEX tag_user_id_name_key')
+    op.drop_constraint('tag_name_key', 'tag', type_='unique')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint('tag_name_key', 'tag', ['name'])
+    op.drop_constraint('tag_user_id_name_key', 'tag', type_='unique')
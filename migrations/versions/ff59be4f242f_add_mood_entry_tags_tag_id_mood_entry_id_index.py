@@ -0,0 +1,42 @@
+"""Add composite tag_id, mood_entry_id index for tag filters
+
+Revision ID: ff59be4f242f
+Revises: 56249568a191
+Create Date: 2026-10-18 16:21:37.402518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ff59be4f242f'
+down_revision: Union[str, Sequence[str], None] = '56249568a191'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Составной индекс заменяет индекс по tag_id: запросы по тегу используют его префикс
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mood_entry_tags_tag_id_mood_entry_id',
+            'mood_entry_tags',
+            ['tag_id', 'mood_entry_id'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.drop_index('ix_mood_entry_tags_tag_id', table_name='mood_entry_tags', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_mood_entry_tags_tag_id', 'mood_entry_tags', ['tag_id'], unique=False, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_mood_entry_tags_tag_id_mood_entry_id', table_name='mood_entry_tags', postgresql_concurrently=True
+        )
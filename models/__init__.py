@@ -1,14 +1,60 @@
-"""Пакет моделей приложения"""
+"""
+Пакет моделей приложения
+
+Модели импортируются при первом обращении к имени пакета, поэтому импорт одной модели
+не загружает остальные. Перед настройкой мапперов и автогенерацией миграций все модели
+загружаются через load_models()
+"""
 
 __author__: str = "Digital Horizons"
 
-from .user import User as UserModel
-from .access_data import AccessData as AccessDataModel
-from .contact import Contact as ContactModel
-from .friendship import FriendshipStatus as FriendshipStatusModel
-from .session import Session as SessionModel
-from .user_setting import UserSetting as UserSettingsModel
-from .tags import Tag as TagModel
-from .mood_entry import MoodEntry as MoodEntryModel
-from .mood_entry_tags import MoodEntryTags as MoodEntryTagsModel
-from .mood_entry_visibility import MoodEntryVisibility as MoodEntryVisibilityModel
+from importlib import import_module
+from typing import Any
+
+# Имена пакета: модуль и класс модели
+_MODELS: dict[str, tuple[str, str]] = {
+    "UserModel": (".user", "User"),
+    "AccessDataModel": (".access_data", "AccessData"),
+    "ContactModel": (".contact", "Contact"),
+    "FriendshipStatusModel": (".friendship", "FriendshipStatus"),
+    "SessionModel": (".session", "Session"),
+    "UserSettingsModel": (".user_setting", "UserSetting"),
+    "TagModel": (".tags", "Tag"),
+    "MoodEntryModel": (".mood_entry", "MoodEntry"),
+    "MoodEntryTagsModel": (".mood_entry_tags", "MoodEntryTags"),
+    "MoodEntryVisibilityModel": (".mood_entry_visibility", "MoodEntryVisibility"),
+    "FriendShipModel": (".friendship", "FriendShip"),
+    "FeedInboxModel": (".feed_inbox", "FeedInbox"),
+    "FeedPullAuthorModel": (".feed_pull_author", "FeedPullAuthor"),
+    "MoodScoreRollupModel": (".mood_score_rollup", "MoodScoreRollup"),
+}
+
+__all__: list[str] = [*_MODELS, "load_models"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _MODELS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, class_name = _MODELS[name]
+    model: Any = getattr(import_module(module_name, __name__), class_name)
+    globals()[name] = model
+    return model
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_MODELS})
+
+
+def load_models() -> None:
+    """
+    Загрузка всех моделей
+
+    Examples:
+        >>> from sqlalchemy.orm import configure_mappers
+        >>>
+        >>> load_models()
+        >>> configure_mappers()
+    """
+    for name in _MODELS:
+        __getattr__(name)
@@ -4,7 +4,7 @@ __author__: str = "Digital Horizons"
 
 import datetime
 
-from sqlalchemy import DateTime, String, ForeignKey, Enum
+from sqlalchemy import DateTime, String, ForeignKey, Enum, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from consts.contact import ContactType, CONTACT_VALUE_LENGTH
@@ -46,7 +46,6 @@ class Contact(BaseModel, TimestampMixin, DeletedAtMixin):
             values_callable=lambda x: [e.value for e in x],
         ),
         nullable=False,
-        index=True,
     )
     other_type: Mapped[str] = mapped_column(String(CONTACT_VALUE_LENGTH), nullable=True)
     verified_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -56,3 +55,7 @@ class Contact(BaseModel, TimestampMixin, DeletedAtMixin):
     )
 
     user: Mapped["User"] = relationship("User")
+
+
+# Индекс типа контакта только по неудаленным контактам
+Index("ix_contact_type_not_deleted", Contact.type, postgresql_where=Contact.deleted_at.is_(None))
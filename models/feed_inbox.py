@@ -0,0 +1,48 @@
+"""Модуль модели ленты записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+
+
+class FeedInbox(BaseModel):
+    """
+    Модель материализованной ленты пользователя (fan-out on write)
+
+    Attributes:
+        owner_user_id (int): идентификатор пользователя, в ленту которого попала запись
+        mood_entry_id (int): идентификатор записи настроения
+        author_user_id (int): идентификатор автора записи
+        entry_created_at (datetime): время создания записи. Копия для сортировки ленты без соединения таблиц
+
+    Notes:
+        Строки создаются и удаляются пакетом feed при изменении записей, их видимости и дружбы
+    """
+
+    __table_args__ = (
+        UniqueConstraint("owner_user_id", "mood_entry_id"),
+        Index(
+            "ix_feed_inbox_owner_user_id_entry_created_at",
+            "owner_user_id",
+            "entry_created_at",
+            "mood_entry_id",
+        ),
+        Index("ix_feed_inbox_mood_entry_id", "mood_entry_id"),
+        Index("ix_feed_inbox_author_user_id_owner_user_id", "author_user_id", "owner_user_id"),
+    )
+
+    owner_user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    mood_entry_id: Mapped[int] = mapped_column(
+        ForeignKey("mood_entry.id", ondelete="CASCADE"), nullable=False
+    )
+    author_user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    entry_created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
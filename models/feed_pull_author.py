@@ -0,0 +1,25 @@
+"""Модуль модели авторов, записи которых собираются в ленту при чтении"""
+
+__author__: str = "Digital Horizons"
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseModel
+from .mixins import TimestampMixin
+
+
+class FeedPullAuthor(BaseModel, TimestampMixin):
+    """
+    Модель популярного автора, записи которого не раскладываются по лентам (fan-out on read)
+
+    Attributes:
+        user_id (int): идентификатор автора
+
+    Notes:
+        Автор попадает сюда, когда количество его друзей превышает FEED_FANOUT_MAX_AUDIENCE
+    """
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), unique=True, index=True, nullable=False
+    )
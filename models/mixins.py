@@ -4,10 +4,12 @@ __author__: str = "Digital Horizons"
 
 from datetime import datetime
 
-from sqlalchemy import DateTime
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import DateTime, event
+from sqlalchemy.orm import Mapped, ORMExecuteState, Session, mapped_column, with_loader_criteria
 from sqlalchemy.sql import func
 
+from consts.database import INCLUDE_DELETED_OPTION
+
 
 class TimestampMixin:
     """
@@ -60,7 +62,27 @@ class DeletedAtMixin:
         >>> user: User = User()
         >>> # Вывод даты удаления записи пользователя
         >>> print(user.deleted_at)
+        >>>
+        >>> # Выборка вместе с удаленными записями
+        >>> query = select(User).execution_options(include_deleted=True)
 
+    Notes:
+        Запросы ORM через сессию не возвращают записи с deleted_at, в том числе в join и связях.
+        Запросы через Connection (Core) не фильтруются
     """
 
     deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_deleted(orm_execute_state: ORMExecuteState) -> None:
+    # Условие добавляется один раз в исходный запрос и переносится на ленивую загрузку связей и атрибутов
+    if (
+        orm_execute_state.is_select
+        and not orm_execute_state.is_column_load
+        and not orm_execute_state.is_relationship_load
+        and not orm_execute_state.execution_options.get(INCLUDE_DELETED_OPTION, False)
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(
+            with_loader_criteria(DeletedAtMixin, lambda cls: cls.deleted_at.is_(None), include_aliases=True)
+        )
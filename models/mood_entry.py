@@ -2,12 +2,13 @@
 
 __author__: str = "Digital Horizons"
 
-from sqlalchemy import SmallInteger, Text, Enum, ForeignKey
+from sqlalchemy import SmallInteger, Text, Enum, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from consts.mood_entry import MoodEntryPublishStatus
 from .base import BaseModel
 from .mixins import TimestampMixin, DeletedAtMixin
+from .mood_entry_tags import MoodEntryTags
 from .tags import Tag
 from .user import User
 
@@ -22,6 +23,13 @@ class MoodEntry(BaseModel, TimestampMixin, DeletedAtMixin):
         status (MoodEntryPublishStatus): статус публикации записи
         user_id (int): идентификатор связанного пользователя
         user (UserModel): данные о связанном пользователе
+        tags (list[TagModel]): теги записи через таблицу связи mood_entry_tags
+
+    Examples:
+        >>> from sqlalchemy.orm import selectinload
+        >>>
+        >>> # Теги всех записей страницы загружаются одним дополнительным запросом
+        >>> entries = await session_db.scalars(select(MoodEntry).options(selectinload(MoodEntry.tags)))
     """
     score: Mapped[int] = mapped_column(SmallInteger, default=0, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=True)
@@ -32,7 +40,6 @@ class MoodEntry(BaseModel, TimestampMixin, DeletedAtMixin):
             values_callable=lambda x: [e.value for e in x],
         ),
         nullable=False,
-        index=True,
         default=MoodEntryPublishStatus.FOR_ALL,
     )
     user_id: Mapped[int] = mapped_column(
@@ -40,5 +47,29 @@ class MoodEntry(BaseModel, TimestampMixin, DeletedAtMixin):
     )
 
     user: Mapped["User"] = relationship("User")
-    tags: Mapped[list[Tag]] = relationship("Tag")
+    tags: Mapped[list[Tag]] = relationship("Tag", secondary=MoodEntryTags.__table__)
+
+
+# Индекс для курсорной пагинации истории пользователя без удаленных записей
+Index(
+    "ix_mood_entry_user_id_created_at_id",
+    MoodEntry.user_id,
+    MoodEntry.created_at.desc(),
+    MoodEntry.id.desc(),
+    postgresql_where=MoodEntry.deleted_at.is_(None),
+)
+
+# Индекс версии истории пользователя (агрегаты updated_at и количество записей) для условных запросов
+Index(
+    "ix_mood_entry_user_id_updated_at",
+    MoodEntry.user_id,
+    MoodEntry.updated_at,
+    postgresql_where=MoodEntry.deleted_at.is_(None),
+)
 
+# Индекс статуса публикации только по неудаленным записям
+Index(
+    "ix_mood_entry_status_not_deleted",
+    MoodEntry.status,
+    postgresql_where=MoodEntry.deleted_at.is_(None),
+)
@@ -2,7 +2,7 @@
 
 __author__: str = "Digital Horizons"
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import BaseModel
@@ -19,6 +19,11 @@ class MoodEntryTags(BaseModel):
     mood_entry_id: Mapped[int] = mapped_column(
         ForeignKey("mood_entry.id", ondelete="CASCADE"), index=True, nullable=True
     )
-    tag_id: Mapped[int] = mapped_column(
-        ForeignKey("tag.id", ondelete="CASCADE"), index=True, nullable=True
-    )
+    tag_id: Mapped[int] = mapped_column(ForeignKey("tag.id", ondelete="CASCADE"), nullable=True)
+
+
+# Индекс поиска записей по тегам: идентификаторы записей читаются из индекса без обращения к таблице.
+# Заменяет индекс по tag_id, который является его префиксом. Уникальный: тег связан с записью один раз
+Index(
+    "uq_mood_entry_tags_tag_id_mood_entry_id", MoodEntryTags.tag_id, MoodEntryTags.mood_entry_id, unique=True
+)
@@ -0,0 +1,77 @@
+"""Модуль модели агрегатов оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, Enum, ForeignKey, Integer, SmallInteger, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from consts.mood_score_rollup import RollupPeriod
+from .base import BaseModel
+from .mixins import TimestampMixin
+
+
+class MoodScoreRollup(BaseModel, TimestampMixin):
+    """
+    Модель агрегата оценок настроения пользователя за период
+
+    Attributes:
+        user_id (int): идентификатор пользователя
+        period (RollupPeriod): период агрегации
+        period_start (date): первый день периода (UTC)
+        count (int): количество записей
+        score_sum (int): сумма оценок
+        score_min (int): минимальная оценка
+        score_max (int): максимальная оценка
+        score_sum_squares (int): сумма квадратов оценок
+
+    Examples:
+        >>> rollup: MoodScoreRollup = MoodScoreRollup(count=2, score_sum=10, score_sum_squares=52)
+        >>> print(rollup.mean) # 5.0
+        >>> print(rollup.variance) # 1.0
+
+    Notes:
+        Поддерживается пакетом mood_entries при изменении записей, пересобирается командой
+        python -m commands.rebuild_rollups
+    """
+
+    __table_args__ = (UniqueConstraint("user_id", "period", "period_start"),)
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), nullable=False
+    )
+    period: Mapped[RollupPeriod] = mapped_column(
+        Enum(
+            RollupPeriod,
+            name="mood_rollup_period_enum",
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        nullable=False,
+    )
+    period_start: Mapped[date] = mapped_column(Date, nullable=False)
+    count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    score_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    score_min: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    score_max: Mapped[int] = mapped_column(SmallInteger, nullable=False)
+    score_sum_squares: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+    @property
+    def mean(self) -> float:
+        """
+        Средняя оценка за период
+
+        Returns:
+            float: среднее значение оценки
+        """
+        return self.score_sum / self.count
+
+    @property
+    def variance(self) -> float:
+        """
+        Дисперсия оценок за период
+
+        Returns:
+            float: дисперсия генеральной совокупности оценок периода
+        """
+        return max(self.score_sum_squares / self.count - self.mean**2, 0.0)
@@ -62,7 +62,9 @@ class Session(BaseModel, TimestampMixin):
             >>> print(session.session_active)
 
         Notes:
-            Сессия считается активной если активная она сама, данные доступа и пользователь не удален
+            Сессия считается активной если активная она сама, данные доступа и пользователь не удален.
+            Обращается к ленивым связям, поэтому для проверки токена в запросе используется
+            security.auth.auth_resolver, получающий все данные одним запросом
         """
         return all(
             (
@@ -2,7 +2,7 @@
 
 __author__: str = "Digital Horizons"
 
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from consts.tag import MAX_TAG_NAME_LENGTH, MAX_COLOR_LENGTH
@@ -15,7 +15,7 @@ class Tag(BaseModel):
     Модель для работы с тегами
 
     Attributes:
-        name (str): название тега
+        name (str): название тега. Уникально среди тегов пользователя и среди общих тегов
         color (str): цвет оформления тега
         user_id (int | None): идентификатор связанного пользователя
 
@@ -23,8 +23,20 @@ class Tag(BaseModel):
         >>> # Создание тега для работы
         >>> tag = Tag(name="Работа", color="red", user_id=1)
     """
-    name: Mapped[str] = mapped_column(String(MAX_TAG_NAME_LENGTH), unique=True, nullable=False)
+    # NULLS NOT DISTINCT: общие теги (user_id IS NULL) тоже не повторяются по названию
+    __table_args__ = (UniqueConstraint("user_id", "name", postgresql_nulls_not_distinct=True),)
+
+    name: Mapped[str] = mapped_column(String(MAX_TAG_NAME_LENGTH), nullable=False)
     color: Mapped[str] = mapped_column(String(MAX_COLOR_LENGTH))
     user_id: Mapped[int] = mapped_column(
         ForeignKey("user.id", ondelete="CASCADE"), index=True, nullable=True
     )
+
+
+# Триграммный индекс для поиска тегов по части названия (ILIKE) без полного просмотра таблицы
+Index(
+    "ix_tag_name_trgm",
+    Tag.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
@@ -4,7 +4,7 @@ __author__: str = "Digital Horizons"
 
 from datetime import datetime
 
-from sqlalchemy import String, Enum, DateTime, Text
+from sqlalchemy import String, Enum, DateTime, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from consts.user import UserGender, NAME_LENGTH
@@ -32,13 +32,9 @@ class User(BaseModel, TimestampMixin, DeletedAtMixin):
         >>> print(user.avatar_url)
     """
 
-    surname: Mapped[str] = mapped_column(
-        String(NAME_LENGTH), nullable=False, index=True
-    )
-    name: Mapped[str] = mapped_column(String(NAME_LENGTH), nullable=False, index=True)
-    patronymic: Mapped[str] = mapped_column(
-        String(NAME_LENGTH), nullable=True, index=True
-    )
+    surname: Mapped[str] = mapped_column(String(NAME_LENGTH), nullable=False)
+    name: Mapped[str] = mapped_column(String(NAME_LENGTH), nullable=False)
+    patronymic: Mapped[str] = mapped_column(String(NAME_LENGTH), nullable=True)
     gender: Mapped[UserGender] = mapped_column(
         Enum(
             UserGender,
@@ -99,3 +95,9 @@ class User(BaseModel, TimestampMixin, DeletedAtMixin):
             full_name_str += f"{self.patronymic[0]}."
 
         return full_name_str
+
+
+# Индексы ФИО только по неудаленным пользователям: удаленные не попадают в выборки ORM
+Index("ix_user_surname_not_deleted", User.surname, postgresql_where=User.deleted_at.is_(None))
+Index("ix_user_name_not_deleted", User.name, postgresql_where=User.deleted_at.is_(None))
+Index("ix_user_patronymic_not_deleted", User.patronymic, postgresql_where=User.deleted_at.is_(None))
@@ -56,12 +56,29 @@ class UserSetting(BaseModel):
             >>> settings_list: UserSetting = UserSetting(value=str([1, 2, 3]), type="list")
             >>> settings_list.formatted_value # '[1, 2, 3]'
         """
-        match self.type:
+        return self.parse_value(self.value, self.type)
+
+    @staticmethod
+    def parse_value(value: str, value_type: str) -> str | bool | int | float:
+        """
+        Преобразование строкового значения параметра к его типу
+
+        Args:
+            value (str): сохраненное значение
+            value_type (str): тип параметра
+
+        Returns:
+            (str | bool | int | float): значение сохраненного типа, если он присутствует в базовых - иначе строка
+
+        Examples:
+            >>> UserSetting.parse_value("5", UserSettingType.INT) # 5
+        """
+        match value_type:
             case UserSettingType.BOOL:
-                return self.value == str(True)
+                return value == str(True)
             case UserSettingType.INT:
-                return int(self.value)
+                return int(value)
             case UserSettingType.FLOAT:
-                return float(self.value)
+                return float(value)
             case _:
-                return self.value
+                return value
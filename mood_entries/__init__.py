@@ -0,0 +1,10 @@
+"""Пакет работы с записями настроения"""
+
+__author__: str = "Digital Horizons"
+
+from .creation import create_entry
+from .export import export_entries
+from .importer import import_entries, read_staged, stage_body
+from .listing import get_user_entries_page, get_user_entries_version, tagged_entries_clause
+from .rollups import get_score_rollups, get_score_rollups_version, rebuild as rebuild_rollups
+from .write_buffer import EntryWriteBuffer, entry_write_buffer
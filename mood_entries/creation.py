@@ -0,0 +1,31 @@
+"""Модуль создания записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import MoodEntryModel
+from schemas.mood_entry import MoodEntryCreateSchema
+
+
+async def create_entry(session_db: AsyncSession, user_id: int, entry: MoodEntryCreateSchema) -> MoodEntryModel:
+    """
+    Создание записи настроения в транзакции сессии запроса
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        user_id (int): идентификатор автора записи
+        entry (MoodEntryCreateSchema): проверенные данные записи
+
+    Returns:
+        MoodEntryModel: созданная запись с заполненными БД метками времени
+
+    Notes:
+        Агрегаты оценок и ленты друзей обновляются обработчиками сессии при сбросе изменений.
+        При большом потоке создания записей включается буфер групповой записи ENTRY_WRITE_BUFFER
+    """
+    # Пустой список тегов: ответ читает теги, а догрузка коллекции новой записи не нужна
+    mood_entry: MoodEntryModel = MoodEntryModel(**entry.model_dump(), user_id=user_id, tags=[])
+    session_db.add(mood_entry)
+    await session_db.commit()
+    return mood_entry
@@ -0,0 +1,152 @@
+"""Модуль потоковой выгрузки записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import Row, Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncResult
+
+from consts.mood_entry_export import (
+    EXPORT_CSV_COLUMNS,
+    EXPORT_FETCH_SIZE,
+    EXPORT_WINDOW_SIZE,
+    ExportFormat,
+)
+from consts.mood_entry_import import CSV_TAGS_SEPARATOR
+from core.database import ReadOnlySessionLocal
+from models import MoodEntryModel, MoodEntryTagsModel, MoodEntryVisibilityModel, TagModel
+
+
+def _export_select(user_id: int, after: tuple[datetime, int] | None, limit: int) -> Select:
+    # Теги и видимость собираются коррелированными подзапросами, чтобы запись оставалась одной строкой
+    tags = (
+        select(func.array_agg(TagModel.name))
+        .join(MoodEntryTagsModel, MoodEntryTagsModel.tag_id == TagModel.id)
+        .where(MoodEntryTagsModel.mood_entry_id == MoodEntryModel.id)
+        .scalar_subquery()
+    )
+    visible_user_ids = (
+        select(func.array_agg(MoodEntryVisibilityModel.user_id))
+        .where(MoodEntryVisibilityModel.mood_entry_id == MoodEntryModel.id)
+        .scalar_subquery()
+    )
+    query: Select = (
+        select(
+            MoodEntryModel.id,
+            MoodEntryModel.created_at,
+            MoodEntryModel.updated_at,
+            MoodEntryModel.score,
+            MoodEntryModel.description,
+            MoodEntryModel.status,
+            tags.label("tags"),
+            visible_user_ids.label("visible_user_ids"),
+        )
+        .where(MoodEntryModel.user_id == user_id, MoodEntryModel.deleted_at.is_(None))
+        .order_by(MoodEntryModel.created_at, MoodEntryModel.id)
+        .limit(limit)
+    )
+
+    if after is not None:
+        query = query.where(tuple_(MoodEntryModel.created_at, MoodEntryModel.id) > tuple_(*after))
+
+    return query
+
+
+def _serialize_ndjson(rows: Sequence[Row]) -> str:
+    return "".join(
+        json.dumps(
+            {
+                "id": row.id,
+                "created_at": row.created_at.isoformat(),
+                "updated_at": row.updated_at.isoformat(),
+                "score": row.score,
+                "description": row.description,
+                "status": row.status.value,
+                "tags": sorted(row.tags or []),
+                "visible_user_ids": sorted(row.visible_user_ids or []),
+            },
+            ensure_ascii=False,
+        )
+        + "\n"
+        for row in rows
+    )
+
+
+def _serialize_csv(rows: Sequence[Row]) -> str:
+    buffer: io.StringIO = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerows(
+        (
+            row.id,
+            row.created_at.isoformat(),
+            row.updated_at.isoformat(),
+            row.score,
+            row.description or "",
+            row.status.value,
+            CSV_TAGS_SEPARATOR.join(sorted(row.tags or [])),
+            CSV_TAGS_SEPARATOR.join(map(str, sorted(row.visible_user_ids or []))),
+        )
+        for row in rows
+    )
+    return buffer.getvalue()
+
+
+async def export_entries(
+    user_id: int,
+    export_format: ExportFormat,
+    window_size: int = EXPORT_WINDOW_SIZE,
+    fetch_size: int = EXPORT_FETCH_SIZE,
+) -> AsyncIterator[str]:
+    """
+    Потоковая выгрузка всех записей настроения пользователя от старых к новым
+
+    Args:
+        user_id (int): идентификатор автора записей
+        export_format (ExportFormat): формат выгрузки
+        window_size (int): количество записей, читаемых одним серверным курсором
+        fetch_size (int): количество строк, получаемых из курсора за одно обращение
+
+    Returns:
+        AsyncIterator[str]: части выгрузки, готовые к отправке клиенту
+
+    Examples:
+        >>> from fastapi.responses import StreamingResponse
+        >>>
+        >>> StreamingResponse(export_entries(user_id, ExportFormat.CSV), media_type=ExportFormat.CSV.media_type)
+
+    Notes:
+        Строки читаются серверным курсором по fetch_size и сразу отдаются клиенту, поэтому память
+        не зависит от объема истории, а медленный клиент приостанавливает чтение из курсора.
+        Сессия открывается на каждое окно window_size записей и закрывается после него, поэтому
+        подключение не удерживается на все время скачивания. Окна продолжают друг друга по
+        (created_at, id), но не образуют единый снимок: записи, измененные во время выгрузки,
+        попадут в нее в состоянии на момент чтения своего окна
+    """
+    serialize = _serialize_csv if export_format == ExportFormat.CSV else _serialize_ndjson
+
+    if export_format == ExportFormat.CSV:
+        yield ",".join(EXPORT_CSV_COLUMNS) + "\n"
+
+    after: tuple[datetime, int] | None = None
+
+    while True:
+        read_count: int = 0
+
+        async with ReadOnlySessionLocal() as session:
+            result: AsyncResult[Any] = await session.stream(
+                _export_select(user_id, after, window_size),
+                execution_options={"yield_per": fetch_size},
+            )
+
+            async for rows in result.partitions():
+                read_count += len(rows)
+                after = (rows[-1].created_at, rows[-1].id)
+                yield serialize(rows)
+
+        if read_count < window_size:
+            return
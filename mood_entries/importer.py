@@ -0,0 +1,319 @@
+"""Модуль массового импорта записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+import codecs
+import csv
+import json
+from tempfile import SpooledTemporaryFile
+from typing import Any, AsyncIterator
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import Connection, text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from consts.mood_entry import MoodEntryPublishStatus
+from consts.mood_entry_import import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_READ_CHUNK_SIZE,
+    IMPORT_SPOOL_MAX_MEMORY,
+    MAX_IMPORT_ERRORS,
+    ImportFormat,
+)
+from consts.tag import DEFAULT_TAG_COLOR
+from core.database import engine
+from feed import fan_out_entries
+from logger import app_logger
+from mood_entries.rollups import add_entries
+from schemas.mood_entry_import import ImportProgress, ImportRowError, MoodEntryImportRow
+from tags import tag_autocomplete
+
+# Колонки промежуточной таблицы, заполняемые через COPY
+_STAGING_COLUMNS: list[str] = ["row_number", "created_at", "score", "description", "status", "tags"]
+
+_CREATE_STAGING = text(
+    """
+    CREATE TEMPORARY TABLE mood_entry_import (
+        row_number integer NOT NULL,
+        entry_id integer,
+        created_at timestamptz NOT NULL,
+        score smallint NOT NULL,
+        description text,
+        status text NOT NULL,
+        tags text[] NOT NULL
+    ) ON COMMIT DROP
+    """
+)
+_ALLOCATE_IDS = text(
+    "UPDATE mood_entry_import SET entry_id = nextval(pg_get_serial_sequence('mood_entry', 'id'))"
+)
+_UPSERT_TAGS = text(
+    """
+    INSERT INTO tag (name, color, user_id)
+    SELECT DISTINCT unnest(tags), :color, CAST(:user_id AS integer) FROM mood_entry_import
+    ON CONFLICT (user_id, name) DO NOTHING
+    """
+)
+_INSERT_ENTRIES = text(
+    """
+    INSERT INTO mood_entry (id, score, description, status, user_id, created_at, updated_at)
+    SELECT entry_id, score, description, status::mood_publish_status_enum, :user_id, created_at, created_at
+    FROM mood_entry_import
+    RETURNING id
+    """
+)
+_INSERT_ENTRY_TAGS = text(
+    """
+    INSERT INTO mood_entry_tags (mood_entry_id, tag_id)
+    SELECT DISTINCT staging.entry_id, tag.id
+    FROM mood_entry_import AS staging
+    CROSS JOIN LATERAL unnest(staging.tags) AS tag_name(name)
+    JOIN tag ON tag.user_id = :user_id AND tag.name = tag_name.name
+    """
+)
+
+
+async def stage_body(chunks: AsyncIterator[bytes]) -> UploadFile:
+    """
+    Сохранение тела запроса импорта до начала ответа
+
+    Args:
+        chunks (AsyncIterator[bytes]): части тела запроса
+
+    Returns:
+        UploadFile: тело запроса в памяти или во временном файле, позиция чтения в начале
+
+    Notes:
+        Тело читается в обработчике запроса: после начала потокового ответа сервер уже не
+        обязан отдавать тело, а обрыв соединения превратил бы импорт в обрезанный ответ 200
+    """
+    body: UploadFile = UploadFile(SpooledTemporaryFile(max_size=IMPORT_SPOOL_MAX_MEMORY))
+
+    try:
+        async for chunk in chunks:
+            await body.write(chunk)
+    except BaseException:
+        await body.close()
+        raise
+
+    await body.seek(0)
+    return body
+
+
+async def read_staged(body: UploadFile) -> AsyncIterator[bytes]:
+    """
+    Чтение сохраненного тела запроса по частям с закрытием файла в конце
+
+    Args:
+        body (UploadFile): тело запроса, сохраненное stage_body
+
+    Returns:
+        AsyncIterator[bytes]: части тела запроса
+    """
+    try:
+        while chunk := await body.read(IMPORT_READ_CHUNK_SIZE):
+            yield chunk
+    finally:
+        await body.close()
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending: str = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+
+        for line in lines:
+            yield line
+
+    pending += decoder.decode(b"", final=True)
+
+    if pending:
+        yield pending
+
+
+async def iter_records(
+    chunks: AsyncIterator[bytes], import_format: ImportFormat
+) -> AsyncIterator[tuple[int, dict[str, Any] | Exception]]:
+    """
+    Потоковое чтение записей входного файла
+
+    Args:
+        chunks (AsyncIterator[bytes]): части содержимого файла
+        import_format (ImportFormat): формат файла
+
+    Returns:
+        AsyncIterator[tuple[int, dict[str, Any] | Exception]]: номер строки и данные записи либо ошибка разбора
+
+    Notes:
+        В CSV значения в кавычках могут содержать переводы строк: строки склеиваются, пока
+        количество кавычек не станет четным
+    """
+    line_number: int = 0
+
+    if import_format == ImportFormat.NDJSON:
+        async for line in _iter_lines(chunks):
+            line_number += 1
+
+            if not line.strip():
+                continue
+
+            try:
+                record: Any = json.loads(line)
+                yield line_number, record if isinstance(record, dict) else ValueError("Expected JSON object")
+            except ValueError as exc:
+                yield line_number, exc
+
+        return
+
+    header: list[str] | None = None
+    record_lines: list[str] = []
+    record_start: int = 1
+
+    async for line in _iter_lines(chunks):
+        line_number += 1
+
+        if not record_lines:
+            record_start = line_number
+
+        record_lines.append(line)
+
+        if sum(part.count('"') for part in record_lines) % 2:
+            continue
+
+        values: list[str] = next(csv.reader(["\n".join(record_lines)]), [])
+        record_lines = []
+
+        if not values:
+            continue
+
+        if header is None:
+            header = [value.strip() for value in values]
+            continue
+
+        if len(values) != len(header):
+            yield record_start, ValueError(f"Expected {len(header)} columns, got {len(values)}")
+            continue
+
+        yield record_start, dict(zip(header, values))
+
+    if record_lines:
+        yield record_start, ValueError("Unterminated quoted value")
+
+
+async def _load_batch(
+    connection: AsyncConnection,
+    user_id: int,
+    rows: list[tuple[int, MoodEntryImportRow]],
+    default_status: MoodEntryPublishStatus,
+) -> int:
+    await connection.execute(_CREATE_STAGING)
+
+    raw_connection = await connection.get_raw_connection()
+    await raw_connection.driver_connection.copy_records_to_table(
+        "mood_entry_import",
+        records=[
+            (
+                line,
+                row.created_at,
+                row.score,
+                row.description,
+                (row.status or default_status).value,
+                row.tags,
+            )
+            for line, row in rows
+        ],
+        columns=_STAGING_COLUMNS,
+    )
+
+    await connection.execute(_ALLOCATE_IDS)
+    await connection.execute(_UPSERT_TAGS, {"color": DEFAULT_TAG_COLOR, "user_id": user_id})
+    entry_ids: list[int] = list(await connection.scalars(_INSERT_ENTRIES, {"user_id": user_id}))
+    await connection.execute(_INSERT_ENTRY_TAGS, {"user_id": user_id})
+
+    def _maintain_derived(sync_connection: Connection) -> None:
+        add_entries(sync_connection, entry_ids)
+        fan_out_entries(sync_connection, entry_ids)
+
+    await connection.run_sync(_maintain_derived)
+    return len(entry_ids)
+
+
+async def import_entries(
+    chunks: AsyncIterator[bytes],
+    import_format: ImportFormat,
+    user_id: int,
+    default_status: MoodEntryPublishStatus = MoodEntryPublishStatus.FOR_ME,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> AsyncIterator[ImportProgress]:
+    """
+    Потоковый импорт записей настроения пользователя
+
+    Args:
+        chunks (AsyncIterator[bytes]): части содержимого файла
+        import_format (ImportFormat): формат файла
+        user_id (int): идентификатор пользователя, которому принадлежат записи
+        default_status (MoodEntryPublishStatus): статус записей без явно указанного статуса
+        batch_size (int): количество строк в одной транзакции
+
+    Returns:
+        AsyncIterator[ImportProgress]: прогресс после каждой пачки, последний элемент - с done=True,
+        при ошибке загрузки пачки - еще и с error
+
+    Examples:
+        >>> async for progress in import_entries(request.stream(), ImportFormat.CSV, identity.user_id):
+        ...     print(progress.imported)
+
+    Notes:
+        Строки проверяются до загрузки, ошибочные пропускаются и попадают в отчет.
+        Каждая пачка загружается через COPY во временную таблицу в своей транзакции,
+        подключение из пула берется только на время загрузки пачки.
+        По умолчанию импортированная история видна только автору и не попадает в ленты друзей
+    """
+    progress: ImportProgress = ImportProgress()
+    errors_reported: int = 0
+    batch: list[tuple[int, MoodEntryImportRow]] = []
+
+    async def flush() -> ImportProgress:
+        nonlocal errors_reported
+
+        if batch:
+            async with engine.begin() as connection:
+                progress.imported += await _load_batch(connection, user_id, batch, default_status)
+
+            tag_autocomplete.invalidate_user(user_id)
+            batch.clear()
+
+        report: ImportProgress = progress.model_copy(update={"errors": progress.errors[errors_reported:]})
+        errors_reported = len(progress.errors)
+        return report
+
+    try:
+        async for line, record in iter_records(chunks, import_format):
+            progress.processed += 1
+
+            try:
+                if isinstance(record, Exception):
+                    raise record
+
+                batch.append((line, MoodEntryImportRow.model_validate(record)))
+            except (ValueError, ValidationError) as exc:
+                progress.failed += 1
+
+                if len(progress.errors) < MAX_IMPORT_ERRORS:
+                    progress.errors.append(ImportRowError(line=line, error=str(exc)))
+
+            if len(batch) >= batch_size:
+                yield await flush()
+
+        progress.done = True
+        yield await flush()
+    except Exception as exc:  # noqa: BLE001 - ошибка отдается последней строкой ответа, статус уже отправлен
+        app_logger.bind(user_id=user_id, imported=progress.imported, error=str(exc)).error("Mood entry import failed")
+        batch.clear()
+        progress.done = True
+        progress.error = "Import interrupted, entries of previous batches are saved"
+        yield await flush()
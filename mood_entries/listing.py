@@ -0,0 +1,119 @@
+"""Модуль постраничной выборки записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import datetime
+from typing import Collection
+
+from sqlalchemy import ColumnElement, Select, distinct, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from consts.tag import TagMatch
+from core.conditional import ResourceVersion, get_resource_version
+from core.pagination import encode_cursor
+from models import MoodEntryModel, MoodEntryTagsModel
+
+
+def tagged_entries_clause(tag_ids: Collection[int], match: TagMatch = TagMatch.ANY) -> ColumnElement[bool]:
+    """
+    Условие отбора записей, отмеченных тегами
+
+    Args:
+        tag_ids (Collection[int]): непустой набор идентификаторов тегов
+        match (TagMatch): запись отмечена хотя бы одним из тегов или всеми тегами
+
+    Returns:
+        ColumnElement[bool]: условие на идентификатор записи
+
+    Examples:
+        >>> query = select(MoodEntryModel).where(tagged_entries_clause({1, 2}, TagMatch.ALL))
+
+    Notes:
+        Подзапрос читает пары (tag_id, mood_entry_id) только из индекса ix_mood_entry_tags_tag_id_mood_entry_id.
+        Для ALL записи группируются и остаются те, у которых найдены все теги
+    """
+    tag_ids = set(tag_ids)
+    entry_ids: Select = select(MoodEntryTagsModel.mood_entry_id).where(MoodEntryTagsModel.tag_id.in_(tag_ids))
+
+    if match == TagMatch.ALL and len(tag_ids) > 1:
+        entry_ids = entry_ids.group_by(MoodEntryTagsModel.mood_entry_id).having(
+            func.count(distinct(MoodEntryTagsModel.tag_id)) == len(tag_ids)
+        )
+
+    return MoodEntryModel.id.in_(entry_ids)
+
+
+async def get_user_entries_page(
+    session_db: AsyncSession,
+    user_id: int,
+    limit: int,
+    after: tuple[datetime, int] | None = None,
+    tag_ids: Collection[int] = (),
+    tag_match: TagMatch = TagMatch.ANY,
+) -> tuple[list[MoodEntryModel], str | None]:
+    """
+    Получение страницы истории записей пользователя от новых к старым
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        user_id (int): идентификатор автора записей
+        limit (int): размер страницы
+        after (tuple[datetime, int] | None): позиция из курсора предыдущей страницы
+        tag_ids (Collection[int]): теги для отбора записей. Пустой набор - все записи
+        tag_match (TagMatch): запись отмечена хотя бы одним из тегов или всеми тегами
+
+    Returns:
+        tuple[list[MoodEntryModel], str | None]: записи страницы с загруженными тегами и курсор следующей страницы.
+        Курсор None - страница последняя
+
+    Examples:
+        >>> from core.pagination import decode_cursor
+        >>>
+        >>> entries, cursor = await get_user_entries_page(session_db, user_id, 20)
+        >>> next_entries, _ = await get_user_entries_page(session_db, user_id, 20, decode_cursor(cursor))
+
+    Notes:
+        Выборка идет по частичному индексу ix_mood_entry_user_id_created_at_id и не зависит от глубины страницы.
+        Теги всех записей страницы загружаются одним запросом независимо от размера страницы
+    """
+    query: Select = (
+        select(MoodEntryModel)
+        .where(MoodEntryModel.user_id == user_id, MoodEntryModel.deleted_at.is_(None))
+        .order_by(MoodEntryModel.created_at.desc(), MoodEntryModel.id.desc())
+        .limit(limit + 1)
+        .options(selectinload(MoodEntryModel.tags))
+    )
+
+    if tag_ids:
+        query = query.where(tagged_entries_clause(tag_ids, tag_match))
+
+    if after is not None:
+        query = query.where(tuple_(MoodEntryModel.created_at, MoodEntryModel.id) < tuple_(*after))
+
+    entries: list[MoodEntryModel] = list(await session_db.scalars(query))
+
+    if len(entries) <= limit:
+        return entries, None
+
+    entries = entries[:limit]
+    return entries, encode_cursor(entries[-1].created_at, entries[-1].id)
+
+
+async def get_user_entries_version(session_db: AsyncSession, user_id: int) -> ResourceVersion:
+    """
+    Версия истории записей пользователя для условных запросов
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        user_id (int): идентификатор автора записей
+
+    Returns:
+        ResourceVersion: наибольшее updated_at, количество и сумма updated_at неудаленных записей пользователя
+
+    Notes:
+        Версия общая для всех страниц истории. Запрос читает только индекс ix_mood_entry_user_id_updated_at
+    """
+    return await get_resource_version(
+        session_db, MoodEntryModel, MoodEntryModel.user_id == user_id, MoodEntryModel.deleted_at.is_(None)
+    )
@@ -0,0 +1,388 @@
+"""Модуль агрегатов оценок настроения по дням, неделям и месяцам"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable
+
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    Connection,
+    Date,
+    Select,
+    and_,
+    cast,
+    delete,
+    event,
+    func,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from consts.mood_score_rollup import RollupPeriod
+from core.conditional import ResourceVersion, get_resource_version
+from models import MoodEntryModel, MoodScoreRollupModel
+
+# Колонки агрегата, заполняемые из выборки записей
+_ROLLUP_COLUMNS: list[str] = [
+    "user_id",
+    "period",
+    "period_start",
+    "count",
+    "score_sum",
+    "score_min",
+    "score_max",
+    "score_sum_squares",
+]
+
+
+def period_start(period: RollupPeriod, day: date) -> date:
+    """
+    Первый день периода, в который входит дата
+
+    Args:
+        period (RollupPeriod): период агрегации
+        day (date): дата (UTC)
+
+    Returns:
+        date: первый день периода
+
+    Examples:
+        >>> period_start(RollupPeriod.MONTH, date(2025, 11, 6)) # date(2025, 11, 1)
+    """
+    match period:
+        case RollupPeriod.WEEK:
+            return day - timedelta(days=day.weekday())
+        case RollupPeriod.MONTH:
+            return day.replace(day=1)
+        case _:
+            return day
+
+
+def period_end(period: RollupPeriod, start: date) -> date:
+    """
+    Первый день следующего периода
+
+    Args:
+        period (RollupPeriod): период агрегации
+        start (date): первый день периода
+
+    Returns:
+        date: первый день следующего периода
+    """
+    match period:
+        case RollupPeriod.WEEK:
+            return start + timedelta(days=7)
+        case RollupPeriod.MONTH:
+            return (start.replace(day=28) + timedelta(days=4)).replace(day=1)
+        case _:
+            return start + timedelta(days=1)
+
+
+def _aggregate_select(period: RollupPeriod, *where: ColumnElement[bool]) -> Select:
+    # Литералы вместо параметров: иначе выражения в SELECT и GROUP BY для Postgres различаются
+    start = cast(
+        func.date_trunc(
+            literal_column(f"'{period.value}'"),
+            func.timezone(literal_column("'UTC'"), MoodEntryModel.created_at),
+        ),
+        Date,
+    )
+
+    return (
+        select(
+            MoodEntryModel.user_id,
+            literal(period, MoodScoreRollupModel.__table__.c.period.type),
+            start,
+            func.count(),
+            func.sum(MoodEntryModel.score),
+            func.min(MoodEntryModel.score),
+            func.max(MoodEntryModel.score),
+            func.sum(cast(MoodEntryModel.score, BigInteger) * MoodEntryModel.score),
+        )
+        .where(MoodEntryModel.deleted_at.is_(None), MoodEntryModel.user_id.is_not(None), *where)
+        .group_by(MoodEntryModel.user_id, start)
+    )
+
+
+def add_entries(connection: Connection, entry_ids: Iterable[int]) -> None:
+    """
+    Добавление новых записей в агрегаты без пересчета периодов
+
+    Args:
+        connection (Connection): подключение к БД текущей транзакции
+        entry_ids (Iterable[int]): идентификаторы новых записей
+    """
+    entry_ids = set(entry_ids)
+
+    if not entry_ids:
+        return
+
+    for period in RollupPeriod:
+        statement = insert(MoodScoreRollupModel).from_select(
+            _ROLLUP_COLUMNS, _aggregate_select(period, MoodEntryModel.id.in_(entry_ids))
+        )
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=["user_id", "period", "period_start"],
+                set_={
+                    "count": MoodScoreRollupModel.count + statement.excluded.count,
+                    "score_sum": MoodScoreRollupModel.score_sum + statement.excluded.score_sum,
+                    "score_min": func.least(MoodScoreRollupModel.score_min, statement.excluded.score_min),
+                    "score_max": func.greatest(MoodScoreRollupModel.score_max, statement.excluded.score_max),
+                    "score_sum_squares": MoodScoreRollupModel.score_sum_squares
+                    + statement.excluded.score_sum_squares,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+
+def entry_days(connection: Connection, entry_ids: Iterable[int]) -> set[tuple[int, date]]:
+    """
+    Пользователи и дни (UTC) записей
+
+    Args:
+        connection (Connection): подключение к БД текущей транзакции
+        entry_ids (Iterable[int]): идентификаторы записей
+
+    Returns:
+        set[tuple[int, date]]: пары идентификатора автора и дня записи
+    """
+    entry_ids = set(entry_ids)
+
+    if not entry_ids:
+        return set()
+
+    return set(
+        connection.execute(
+            select(
+                MoodEntryModel.user_id,
+                cast(func.timezone("UTC", MoodEntryModel.created_at), Date),
+            )
+            .where(MoodEntryModel.id.in_(entry_ids), MoodEntryModel.user_id.is_not(None))
+            .distinct()
+        ).tuples()
+    )
+
+
+def recompute_days(connection: Connection, days: Iterable[tuple[int, date]]) -> None:
+    """
+    Пересчет агрегатов всех периодов, в которые входят дни пользователей
+
+    Args:
+        connection (Connection): подключение к БД текущей транзакции
+        days (Iterable[tuple[int, date]]): пары идентификатора пользователя и дня (UTC)
+
+    Notes:
+        Минимум и максимум нельзя уменьшить без исходных данных, поэтому изменение и удаление
+        записи пересчитывает ее день, неделю и месяц по записям пользователя за этот период.
+        Перенос записи на другой день пересчитывает и прежний, и новый день
+    """
+    days = set(days)
+
+    if not days:
+        return
+
+    for period in RollupPeriod:
+        buckets: set[tuple[int, date]] = {(user_id, period_start(period, day)) for user_id, day in days}
+
+        # Удаление нужно для периодов, в которых не осталось записей: выборка их не вернет
+        connection.execute(
+            delete(MoodScoreRollupModel).where(
+                MoodScoreRollupModel.period == period,
+                tuple_(MoodScoreRollupModel.user_id, MoodScoreRollupModel.period_start).in_(buckets),
+            )
+        )
+
+        # Одно выражение на все пересчитываемые периоды. Агрегат, вставленный параллельным пересчетом после удаления,
+        # заменяется, а не приводит к нарушению уникальности
+        statement = insert(MoodScoreRollupModel).from_select(
+            _ROLLUP_COLUMNS,
+            _aggregate_select(
+                period,
+                or_(
+                    *(
+                        and_(
+                            MoodEntryModel.user_id == user_id,
+                            MoodEntryModel.created_at >= datetime.combine(start, time(), timezone.utc),
+                            MoodEntryModel.created_at
+                            < datetime.combine(period_end(period, start), time(), timezone.utc),
+                        )
+                        for user_id, start in buckets
+                    )
+                ),
+            ),
+        )
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=["user_id", "period", "period_start"],
+                set_={
+                    **{column: statement.excluded[column] for column in _ROLLUP_COLUMNS[3:]},
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+
+def rebuild(connection: Connection, user_ids: Iterable[int] | None = None) -> None:
+    """
+    Полная пересборка агрегатов по исходным записям
+
+    Args:
+        connection (Connection): подключение к БД текущей транзакции
+        user_ids (Iterable[int] | None): идентификаторы пользователей. None - все пользователи
+
+    Examples:
+        >>> from core.database import engine
+        >>>
+        >>> async with engine.begin() as connection:
+        ...     await connection.run_sync(rebuild)
+    """
+    delete_statement = delete(MoodScoreRollupModel)
+    where: list[ColumnElement[bool]] = []
+
+    if user_ids is not None:
+        user_ids = set(user_ids)
+        delete_statement = delete_statement.where(MoodScoreRollupModel.user_id.in_(user_ids))
+        where.append(MoodEntryModel.user_id.in_(user_ids))
+
+    connection.execute(delete_statement)
+
+    for period in RollupPeriod:
+        connection.execute(
+            insert(MoodScoreRollupModel).from_select(_ROLLUP_COLUMNS, _aggregate_select(period, *where))
+        )
+
+
+async def get_score_rollups(
+    session_db: AsyncSession,
+    user_id: int,
+    period: RollupPeriod,
+    start: date,
+    end: date,
+    limit: int,
+) -> list[MoodScoreRollupModel]:
+    """
+    Получение агрегатов оценок пользователя за интервал
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        user_id (int): идентификатор пользователя
+        period (RollupPeriod): период агрегации
+        start (date): первый день интервала
+        end (date): последний день интервала включительно
+        limit (int): максимальное количество периодов
+
+    Returns:
+        list[MoodScoreRollupModel]: агрегаты от старых периодов к новым. Периоды без записей пропускаются
+    """
+    return list(
+        await session_db.scalars(
+            select(MoodScoreRollupModel)
+            .where(*_rollups_where(user_id, period, start, end))
+            .order_by(MoodScoreRollupModel.period_start)
+            .limit(limit)
+        )
+    )
+
+
+async def get_score_rollups_version(
+    session_db: AsyncSession,
+    user_id: int,
+    period: RollupPeriod,
+    start: date,
+    end: date,
+) -> ResourceVersion:
+    """
+    Версия агрегатов оценок пользователя за интервал для условных запросов
+
+    Args:
+        session_db (AsyncSession): сессия подключения к БД
+        user_id (int): идентификатор пользователя
+        period (RollupPeriod): период агрегации
+        start (date): первый день интервала
+        end (date): последний день интервала включительно
+
+    Returns:
+        ResourceVersion: наибольшее updated_at, количество и сумма updated_at агрегатов интервала
+
+    Notes:
+        Пересчет агрегата заменяет строку, поэтому у пересчитанного агрегата новое updated_at
+    """
+    return await get_resource_version(
+        session_db, MoodScoreRollupModel, *_rollups_where(user_id, period, start, end)
+    )
+
+
+def _rollups_where(user_id: int, period: RollupPeriod, start: date, end: date) -> list[ColumnElement[bool]]:
+    return [
+        MoodScoreRollupModel.user_id == user_id,
+        MoodScoreRollupModel.period == period,
+        MoodScoreRollupModel.period_start >= period_start(period, start),
+        MoodScoreRollupModel.period_start <= end,
+    ]
+
+
+@event.listens_for(Session, "before_flush")
+def _collect_previous_days(session: Session, _: UOWTransaction, __: object) -> None:
+    # Прежний день перенесенной записи читается из БД до flush: прежнее значение может быть не загружено
+    moved_ids: set[int] = {
+        instance.id
+        for instance in session.dirty
+        if isinstance(instance, MoodEntryModel) and inspect(instance).attrs.created_at.history.has_changes()
+    }
+
+    if moved_ids:
+        session.info.setdefault("rollup_removed_days", set()).update(entry_days(session.connection(), moved_ids))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_rollup_changes(session: Session, _: UOWTransaction) -> None:
+    new_ids: set[int] = session.info.setdefault("rollup_new_ids", set())
+    changed_ids: set[int] = session.info.setdefault("rollup_changed_ids", set())
+    removed_days: set[tuple[int, date]] = session.info.setdefault("rollup_removed_days", set())
+
+    for instance in session.new:
+        if isinstance(instance, MoodEntryModel):
+            new_ids.add(instance.id)
+
+    for instance in session.dirty:
+        if isinstance(instance, MoodEntryModel):
+            state = inspect(instance)
+
+            if any(
+                state.attrs[name].history.has_changes() for name in ("score", "deleted_at", "created_at")
+            ):
+                changed_ids.add(instance.id)
+
+    for instance in session.deleted:
+        if isinstance(instance, MoodEntryModel):
+            loaded: dict = inspect(instance).dict
+
+            if loaded.get("user_id") is not None and loaded.get("created_at") is not None:
+                removed_days.add(
+                    (loaded["user_id"], loaded["created_at"].astimezone(timezone.utc).date())
+                )
+
+
+@event.listens_for(Session, "after_flush_postexec")
+def _apply_rollup_changes(session: Session, _: UOWTransaction) -> None:
+    new_ids: set[int] = session.info.pop("rollup_new_ids", set())
+    changed_ids: set[int] = session.info.pop("rollup_changed_ids", set())
+    removed_days: set[tuple[int, date]] = session.info.pop("rollup_removed_days", set())
+
+    if not new_ids and not changed_ids and not removed_days:
+        return
+
+    connection: Connection = session.connection()
+    add_entries(connection, new_ids)
+    recompute_days(connection, entry_days(connection, changed_ids) | removed_days)
@@ -0,0 +1,223 @@
+"""Модуль групповой записи новых записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Connection, Row, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from core.config import settings
+from core.database import engine
+from core.replicas import mark_write
+from feed import fan_out_entries
+from logger import app_logger
+from models import MoodEntryModel
+from mood_entries.rollups import add_entries
+from schemas.mood_entry import MoodEntryCreateSchema
+
+# Признак остановки в очереди записи
+_STOP: object = object()
+
+# Колонки записи, возвращаемые вызывающему коду
+_RETURNING = MoodEntryModel.__table__.c
+
+
+@dataclass(slots=True)
+class _PendingEntry:
+    values: dict[str, Any]
+    future: asyncio.Future
+
+
+async def _insert_batch(connection: AsyncConnection, values: list[dict[str, Any]]) -> list[Row]:
+    # Строки RETURNING возвращаются в порядке параметров: SQLAlchemy собирает один INSERT ... VALUES на пачку
+    rows: list[Row] = list(
+        await connection.execute(
+            insert(MoodEntryModel.__table__).returning(*_RETURNING, sort_by_parameter_order=True), values
+        )
+    )
+    entry_ids: list[int] = [row.id for row in rows]
+
+    def _maintain_derived(sync_connection: Connection) -> None:
+        add_entries(sync_connection, entry_ids)
+        fan_out_entries(sync_connection, entry_ids)
+
+    await connection.run_sync(_maintain_derived)
+    return rows
+
+
+class EntryWriteBuffer:
+    """
+    Буфер создания записей настроения: записи из разных запросов вставляются одной транзакцией
+
+    Attributes:
+        engine (AsyncEngine): движок БД, в который записываются пачки
+        maxsize (int): максимальное количество записей в очереди. При заполнении запрос ждет места
+        batch_size (int): максимальное количество записей в одной транзакции
+        flush_interval (float): время накопления пачки в секундах после первой записи. Набравшаяся пачка
+            записывается сразу
+        written (int): количество созданных записей
+        failed (int): количество записей, завершившихся ошибкой
+        flushes (int): количество транзакций записи
+
+    Examples:
+        >>> entry_write_buffer.start()
+        >>> row: Row = await entry_write_buffer.submit(user_id, MoodEntryCreateSchema(score=7))
+        >>> ...
+        >>> await entry_write_buffer.stop() # Запись оставшихся в очереди записей
+
+    Notes:
+        Пачка вставляется одним INSERT ... RETURNING, агрегаты оценок и ленты друзей обновляются в той же
+        транзакции, как при импорте. Подключение из пула берет только фоновая задача буфера, по одному на
+        пачку. Если пачка не записалась, записи повторяются по одной в отдельных транзакциях, и каждый
+        запрос получает свой результат или свою ошибку. Запись, запрос которой отменен после постановки
+        в очередь, все равно создается
+    """
+
+    def __init__(self, engine: AsyncEngine, maxsize: int, batch_size: int, flush_interval: float):
+        self.engine: AsyncEngine = engine
+        self.maxsize: int = maxsize
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.written: int = 0
+        self.failed: int = 0
+        self.flushes: int = 0
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        self._batch_ready: asyncio.Event | None = None
+        self._stopping: bool = False
+
+    def start(self) -> None:
+        """Запуск фоновой задачи записи в текущем event loop"""
+        self._queue = asyncio.Queue(self.maxsize)
+        self._batch_ready = asyncio.Event()
+        self._stopping = False
+        self._task = asyncio.create_task(self._run(), name="entry-write-buffer")
+
+    @property
+    def started(self) -> bool:
+        """Буфер принимает записи"""
+        return self._task is not None and not self._stopping
+
+    async def submit(self, user_id: int, entry: MoodEntryCreateSchema) -> Row:
+        """
+        Создание записи в ближайшей пачке
+
+        Args:
+            user_id (int): идентификатор автора записи
+            entry (MoodEntryCreateSchema): проверенные данные записи
+
+        Returns:
+            Row: созданная запись со всеми колонками таблицы
+
+        Raises:
+            RuntimeError: буфер не запущен или остановлен
+            sqlalchemy.exc.SQLAlchemyError: ошибка записи именно этой записи
+        """
+        if not self.started:
+            raise RuntimeError("Entry write buffer is not running")
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingEntry({**entry.model_dump(), "user_id": user_id}, future))
+
+        # Первую запись пачки фоновая задача уже забрала из очереди
+        if self._queue.qsize() >= self.batch_size - 1:
+            self._batch_ready.set()
+
+        row: Row = await future
+        mark_write(settings.DB_READ_YOUR_WRITES_WINDOW)
+        return row
+
+    async def stop(self) -> None:
+        """Запись оставшихся в очереди записей и остановка фоновой задачи"""
+        if self._task is None or self._stopping:
+            return
+
+        self._stopping = True
+        await self._queue.put(_STOP)
+        self._batch_ready.set()
+        await self._task
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика буфера
+
+        Returns:
+            dict[str, int]: размер очереди, количество созданных и неудачных записей, количество транзакций
+        """
+        return {
+            "queued": self._queue.qsize() if self._queue else 0,
+            "written": self.written,
+            "failed": self.failed,
+            "flushes": self.flushes,
+        }
+
+    async def _run(self) -> None:
+        stopping: bool = False
+
+        while not stopping:
+            pending: list[Any] = [await self._queue.get()]
+
+            # Пачка копится flush_interval, если не наберется раньше: запросы за это время попадут в ту же транзакцию
+            self._batch_ready.clear()
+
+            if pending[0] is not _STOP and self._queue.qsize() < self.batch_size - 1:
+                try:
+                    await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+                except TimeoutError:
+                    pass
+
+            while len(pending) < self.batch_size and not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+
+            if _STOP in pending:
+                stopping = True
+                pending = [item for item in pending if item is not _STOP]
+
+            if pending:
+                await self._flush(pending)
+
+        # Записи, поставленные в очередь одновременно с остановкой
+        while not self._queue.empty():
+            item: Any = self._queue.get_nowait()
+
+            if item is not _STOP and not item.future.done():
+                item.future.set_exception(RuntimeError("Entry write buffer is stopped"))
+
+    async def _flush(self, pending: list[_PendingEntry]) -> None:
+        self.flushes += 1
+
+        try:
+            async with self.engine.begin() as connection:
+                rows: list[Row] = await _insert_batch(connection, [item.values for item in pending])
+        except Exception as exc:  # noqa: BLE001 - ошибка возвращается запросам, задача буфера продолжает работу
+            if len(pending) == 1:
+                self.failed += 1
+
+                if not pending[0].future.done():
+                    pending[0].future.set_exception(exc)
+
+                return
+
+            app_logger.bind(batch_size=len(pending), error=str(exc)).warning(
+                "Entry batch insert failed, retrying entries one by one"
+            )
+
+            for item in pending:
+                await self._flush([item])
+
+            return
+
+        self.written += len(rows)
+
+        for item, row in zip(pending, rows):
+            if not item.future.done():
+                item.future.set_result(row)
+
+
+# Глобальный экземпляр буфера записи
+entry_write_buffer: EntryWriteBuffer = EntryWriteBuffer(
+    engine, settings.ENTRY_WRITE_BUFFER_SIZE, settings.ENTRY_WRITE_BATCH_SIZE, settings.ENTRY_WRITE_FLUSH_INTERVAL
+)
@@ -0,0 +1,12 @@
+"""Пакет маршрутов приложения"""
+
+__author__: str = "Digital Horizons"
+
+from .internal import router as internal_router
+from .metrics import router as metrics_router
+from .feed import router as feed_router
+from .mood_entries import router as mood_entries_router
+from .stats import router as stats_router
+from .tags import router as tags_router
+from .friends import router as friends_router
+from .settings import router as settings_router
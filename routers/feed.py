@@ -0,0 +1,43 @@
+"""Модуль маршрутов ленты записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from consts.feed import FEED_PAGE_SIZE, MAX_FEED_PAGE_SIZE
+from core.conditional import ResourceVersion, conditional_response
+from dependencies.auth import get_current_identity
+from dependencies.database import ReadOnlySessionDB
+from dependencies.pagination import get_cursor_position
+from feed import get_feed_entries, get_feed_positions, get_feed_version
+from schemas.mood_entry_page import MoodEntryPageSchema
+from security import AuthIdentity
+
+router: APIRouter = APIRouter(prefix="/feed", tags=["feed"])
+
+
+@router.get("", response_model=MoodEntryPageSchema)
+async def read_feed(
+    request: Request,
+    session_db: ReadOnlySessionDB,
+    identity: AuthIdentity = Depends(get_current_identity),
+    limit: int = Query(FEED_PAGE_SIZE, ge=1, le=MAX_FEED_PAGE_SIZE),
+    after: tuple[datetime, int] | None = Depends(get_cursor_position),
+) -> Response:
+    """
+    Страница ленты записей друзей текущего пользователя
+
+    Поддерживает условные запросы: если состав страницы и ее записи не изменились, ответ 304 без тела
+    """
+    entry_ids, next_cursor = await get_feed_positions(session_db, identity.user_id, limit, after)
+    version: ResourceVersion = await get_feed_version(session_db, entry_ids)
+
+    async def render() -> MoodEntryPageSchema:
+        return MoodEntryPageSchema.model_validate(
+            {"items": await get_feed_entries(session_db, entry_ids), "next_cursor": next_cursor},
+            from_attributes=True,
+        )
+
+    return await conditional_response(request, version, render, identity.user_id, tuple(entry_ids), next_cursor)
@@ -0,0 +1,48 @@
+"""Модуль маршрутов друзей"""
+
+__author__: str = "Digital Horizons"
+
+from fastapi import APIRouter, Depends, Query
+
+from consts.friendship import FRIEND_SUGGESTIONS_LIMIT, MAX_FRIEND_SUGGESTIONS_LIMIT
+from dependencies.auth import get_current_identity
+from dependencies.database import ReadOnlySessionDB
+from friendship import friend_graph
+from schemas.friendship import FriendIdsSchema, FriendSuggestionSchema
+from security import AuthIdentity
+
+router: APIRouter = APIRouter(prefix="/friends", tags=["friends"])
+
+
+@router.get("", response_model=FriendIdsSchema)
+async def read_friends(
+    session_db: ReadOnlySessionDB,
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> FriendIdsSchema:
+    """Друзья текущего пользователя"""
+    return FriendIdsSchema(user_ids=list(await friend_graph.get_friends(session_db, identity.user_id)))
+
+
+@router.get("/suggestions", response_model=list[FriendSuggestionSchema])
+async def read_friend_suggestions(
+    session_db: ReadOnlySessionDB,
+    limit: int = Query(FRIEND_SUGGESTIONS_LIMIT, ge=1, le=MAX_FRIEND_SUGGESTIONS_LIMIT),
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> list[FriendSuggestionSchema]:
+    """Друзья друзей текущего пользователя от большего количества общих друзей к меньшему"""
+    return [
+        FriendSuggestionSchema(user_id=user_id, mutual_count=mutual_count)
+        for user_id, mutual_count in await friend_graph.suggestions(session_db, identity.user_id, limit)
+    ]
+
+
+@router.get("/{user_id}/mutual", response_model=FriendIdsSchema)
+async def read_mutual_friends(
+    user_id: int,
+    session_db: ReadOnlySessionDB,
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> FriendIdsSchema:
+    """Общие друзья текущего пользователя и пользователя user_id"""
+    return FriendIdsSchema(
+        user_ids=await friend_graph.mutual_friends(session_db, identity.user_id, user_id)
+    )
@@ -0,0 +1,68 @@
+"""Модуль служебных маршрутов приложения"""
+
+__author__: str = "Digital Horizons"
+
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from core.conditional import response_cache
+from core.database import engine, replica_set
+from core.pool import get_pool_stats
+from dependencies.internal import require_internal_token
+from friendship import friend_graph
+from logger import access_log_sampler, log_pipeline
+from mood_entries import entry_write_buffer
+from security import auth_resolver
+from tags import tag_autocomplete
+from user_settings import user_settings_store
+
+router: APIRouter = APIRouter(
+    prefix="/internal", tags=["internal"], include_in_schema=False, dependencies=[Depends(require_internal_token)]
+)
+
+
+@router.get("/db/pool")
+def read_pool_stats() -> dict[str, Any]:
+    """Текущая статистика пула подключений к БД воркера"""
+    return get_pool_stats(engine)
+
+
+@router.get("/db/replicas")
+def read_replicas_state() -> list[dict[str, Any]]:
+    """Доступность реплик БД и статистика их пулов подключений"""
+    return [
+        {
+            "url": replica.url.render_as_string(hide_password=True),
+            "healthy": healthy,
+            "pool": get_pool_stats(replica),
+        }
+        for replica, healthy in zip(replica_set.engines, replica_set.healthy)
+    ]
+
+
+@router.get("/caches")
+def read_caches_stats() -> dict[str, dict[str, int]]:
+    """Статистика внутрипроцессных кэшей воркера"""
+    from analytics import mood_series_cache
+
+    return {
+        "auth": auth_resolver.cache.stats(),
+        "tags": tag_autocomplete.stats(),
+        "friend_graph": friend_graph.stats(),
+        "user_settings": user_settings_store.stats(),
+        "responses": response_cache.stats(),
+        "analytics": mood_series_cache.stats(),
+    }
+
+
+@router.get("/logging")
+def read_logging_stats() -> dict[str, Any]:
+    """Очередь логов воркера и решения выборки журнала HTTP запросов по правилам путей"""
+    return {**log_pipeline.stats(), "access_log": access_log_sampler.stats()}
+
+
+@router.get("/write-buffer")
+def read_write_buffer_stats() -> dict[str, int]:
+    """Очередь буфера групповой записи записей настроения воркера"""
+    return entry_write_buffer.stats()
@@ -0,0 +1,23 @@
+"""Модуль маршрута метрик в формате Prometheus"""
+
+__author__: str = "Digital Horizons"
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from consts.metrics import PROMETHEUS_CONTENT_TYPE
+from core.database import engine, replica_set
+from dependencies.internal import require_internal_token
+from metrics import metrics_registry
+from metrics.runtime import update_runtime_metrics
+
+router: APIRouter = APIRouter(
+    tags=["metrics"], include_in_schema=False, dependencies=[Depends(require_internal_token)]
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def read_metrics() -> PlainTextResponse:
+    """Метрики всех воркеров сервера в текстовом формате Prometheus"""
+    update_runtime_metrics(engine, replica_set.engines)
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,122 @@
+"""Модуль маршрутов записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import datetime
+
+from typing import AsyncIterator
+
+from fastapi import APIRouter, Depends, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+
+from consts.mood_entry import MAX_PAGE_SIZE, PAGE_SIZE, MoodEntryPublishStatus
+from consts.mood_entry_export import ExportFormat
+from consts.mood_entry_import import ImportFormat
+from consts.tag import MAX_FILTER_TAGS, TagMatch
+from core.conditional import ResourceVersion, conditional_response
+from core.config import settings
+from dependencies.auth import get_current_identity
+from dependencies.database import ReadOnlySessionDB, SessionDB
+from dependencies.pagination import get_cursor_position
+from mood_entries import (
+    create_entry,
+    entry_write_buffer,
+    export_entries,
+    get_user_entries_page,
+    get_user_entries_version,
+    import_entries,
+    read_staged,
+    stage_body,
+)
+from schemas.mood_entry import MoodEntryCreateSchema, MoodEntrySchema
+from schemas.mood_entry_page import MoodEntryPageSchema
+from security import AuthIdentity
+
+router: APIRouter = APIRouter(prefix="/mood-entries", tags=["mood-entries"])
+
+
+@router.get("", response_model=MoodEntryPageSchema)
+async def read_mood_entries(
+    request: Request,
+    session_db: ReadOnlySessionDB,
+    identity: AuthIdentity = Depends(get_current_identity),
+    limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    after: tuple[datetime, int] | None = Depends(get_cursor_position),
+    tag_ids: list[int] = Query([], alias="tag", max_length=MAX_FILTER_TAGS),
+    tag_match: TagMatch = Query(TagMatch.ANY),
+) -> Response:
+    """
+    Страница истории записей настроения текущего пользователя с тегами записей
+
+    Параметры tag отбирают записи, отмеченные хотя бы одним из тегов (tag_match=any) или всеми (tag_match=all).
+    Поддерживает условные запросы: при неизменной истории ответ 304 без тела
+    """
+    version: ResourceVersion = await get_user_entries_version(session_db, identity.user_id)
+
+    async def render() -> MoodEntryPageSchema:
+        entries, next_cursor = await get_user_entries_page(
+            session_db, identity.user_id, limit, after, tag_ids, tag_match
+        )
+        return MoodEntryPageSchema.model_validate(
+            {"items": entries, "next_cursor": next_cursor}, from_attributes=True
+        )
+
+    return await conditional_response(request, version, render, identity.user_id)
+
+
+@router.post("", response_model=MoodEntrySchema, status_code=201)
+async def create_mood_entry(
+    entry: MoodEntryCreateSchema,
+    session_db: SessionDB,
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> MoodEntrySchema:
+    """
+    Создание записи настроения текущего пользователя
+
+    При включенном ENTRY_WRITE_BUFFER запись создается вместе с записями других запросов одной
+    транзакцией фоновой задачи воркера, сессия запроса к БД не подключается
+    """
+    if settings.ENTRY_WRITE_BUFFER:
+        return MoodEntrySchema.model_validate(await entry_write_buffer.submit(identity.user_id, entry))
+
+    return MoodEntrySchema.model_validate(await create_entry(session_db, identity.user_id, entry))
+
+
+@router.post("/import")
+async def import_mood_entries(
+    request: Request,
+    identity: AuthIdentity = Depends(get_current_identity),
+    import_format: ImportFormat = Query(ImportFormat.CSV, alias="format"),
+    default_status: MoodEntryPublishStatus = Query(MoodEntryPublishStatus.FOR_ME),
+) -> StreamingResponse:
+    """
+    Импорт истории записей настроения текущего пользователя из CSV или NDJSON
+
+    Тело запроса сохраняется до начала ответа (в памяти или во временном файле), затем в ответ
+    построчно (NDJSON) отдается прогресс после каждой пачки. Последняя строка всегда с done=true,
+    при прерванном импорте - с error
+    """
+    body: UploadFile = await stage_body(request.stream())
+
+    async def progress_lines() -> AsyncIterator[str]:
+        async for progress in import_entries(read_staged(body), import_format, identity.user_id, default_status):
+            yield progress.model_dump_json() + "\n"
+
+    return StreamingResponse(progress_lines(), media_type="application/x-ndjson")
+
+
+@router.get("/export")
+async def export_mood_entries(
+    identity: AuthIdentity = Depends(get_current_identity),
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+) -> StreamingResponse:
+    """
+    Выгрузка всей истории записей настроения текущего пользователя с тегами и видимостью
+
+    Записи читаются серверным курсором и отдаются потоком по мере чтения клиентом
+    """
+    return StreamingResponse(
+        export_entries(identity.user_id, export_format),
+        media_type=export_format.media_type,
+        headers={"Content-Disposition": f'attachment; filename="mood-entries.{export_format.value}"'},
+    )
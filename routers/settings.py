@@ -0,0 +1,23 @@
+"""Модуль маршрутов настроек пользователя"""
+
+__author__: str = "Digital Horizons"
+
+from fastapi import APIRouter, Depends
+
+from dependencies.auth import get_current_identity
+from dependencies.database import ReadOnlySessionDB
+from schemas.user_setting import UserSettingsSchema
+from security import AuthIdentity
+from user_settings import SettingsSnapshot, user_settings_store
+
+router: APIRouter = APIRouter(prefix="/settings", tags=["settings"])
+
+
+@router.get("", response_model=UserSettingsSchema)
+async def read_settings(
+    session_db: ReadOnlySessionDB,
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> UserSettingsSchema:
+    """Действующие настройки текущего пользователя: общие параметры с его переопределениями"""
+    snapshot: SettingsSnapshot = await user_settings_store.get(session_db, identity.user_id)
+    return UserSettingsSchema(values=dict(snapshot.values))
@@ -0,0 +1,88 @@
+"""Модуль маршрутов статистики настроения"""
+
+__author__: str = "Digital Horizons"
+
+import time
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+
+from consts.analytics import (
+    DEFAULT_ANALYTICS_DAYS,
+    DEFAULT_EWMA_ALPHA,
+    DEFAULT_ROLLING_WINDOW,
+    MAX_ANALYTICS_DAYS,
+    MAX_ROLLING_WINDOW,
+    SECONDS_PER_DAY,
+)
+from consts.mood_score_rollup import MAX_STATS_PERIODS, RollupPeriod
+from core.conditional import ResourceVersion, conditional_response
+from dependencies.auth import get_current_identity
+from dependencies.database import ReadOnlySessionDB
+from models import MoodScoreRollupModel
+from mood_entries import get_score_rollups, get_score_rollups_version, get_user_entries_version
+from schemas.mood_analytics import MoodAnalyticsSchema
+from schemas.mood_stats import MoodScoreStatsSchema, MoodStatsSchema
+from security import AuthIdentity
+
+router: APIRouter = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get("/mood", response_model=MoodStatsSchema)
+async def read_mood_stats(
+    request: Request,
+    session_db: ReadOnlySessionDB,
+    start: date,
+    end: date,
+    period: RollupPeriod = RollupPeriod.DAY,
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> Response:
+    """
+    Статистика оценок настроения текущего пользователя по агрегатам периодов
+
+    Поддерживает условные запросы: при неизменных агрегатах интервала ответ 304 без тела
+    """
+    version: ResourceVersion = await get_score_rollups_version(session_db, identity.user_id, period, start, end)
+
+    async def render() -> MoodStatsSchema:
+        rollups: list[MoodScoreRollupModel] = await get_score_rollups(
+            session_db, identity.user_id, period, start, end, MAX_STATS_PERIODS
+        )
+
+        return MoodStatsSchema(
+            period=period,
+            items=[MoodScoreStatsSchema.from_rollups([rollup], rollup.period_start) for rollup in rollups],
+            total=MoodScoreStatsSchema.from_rollups(rollups) if rollups else None,
+        )
+
+    return await conditional_response(request, version, render, identity.user_id)
+
+
+@router.get("/analytics", response_model=MoodAnalyticsSchema)
+async def read_mood_analytics(
+    request: Request,
+    session_db: ReadOnlySessionDB,
+    window: int = Query(DEFAULT_ROLLING_WINDOW, ge=1, le=MAX_ROLLING_WINDOW),
+    alpha: float = Query(DEFAULT_EWMA_ALPHA, gt=0, le=1),
+    days: int = Query(DEFAULT_ANALYTICS_DAYS, ge=1, le=MAX_ANALYTICS_DAYS),
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> Response:
+    """
+    Аналитика всей истории оценок текущего пользователя: скользящее и экспоненциальное средние по дням,
+    оценки по дням недели и часам суток (UTC), серии дней с записями
+
+    История загружается в память воркера один раз, новые записи догружаются. Поддерживает условные
+    запросы: при неизменной истории в течение дня ответ 304 без тела
+    """
+    now: int = int(time.time())
+    version: ResourceVersion = await get_user_entries_version(session_db, identity.user_id)
+
+    async def render() -> MoodAnalyticsSchema:
+        # Расчеты аналитики и numpy загружаются при первом запросе аналитики, а не при запуске воркера
+        from analytics import MoodSeries, analyze, mood_series_cache
+
+        series: MoodSeries = await mood_series_cache.get(session_db, identity.user_id, version)
+        return MoodAnalyticsSchema.from_analytics(analyze(series, now, window, alpha), window, alpha, days)
+
+    # Текущий день входит в ответ: серии и ряды по дням меняются со сменой дня без новых записей
+    return await conditional_response(request, version, render, identity.user_id, now // SECONDS_PER_DAY)
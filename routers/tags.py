@@ -0,0 +1,28 @@
+"""Модуль маршрутов тегов"""
+
+__author__: str = "Digital Horizons"
+
+from fastapi import APIRouter, Depends, Query
+
+from consts.tag import MAX_TAG_AUTOCOMPLETE_LIMIT, MAX_TAG_NAME_LENGTH, TAG_AUTOCOMPLETE_LIMIT
+from dependencies.auth import get_current_identity
+from dependencies.database import ReadOnlySessionDB
+from schemas.tag import TagSuggestionSchema
+from security import AuthIdentity
+from tags import tag_autocomplete
+
+router: APIRouter = APIRouter(prefix="/tags", tags=["tags"])
+
+
+@router.get("/autocomplete", response_model=list[TagSuggestionSchema])
+async def autocomplete_tags(
+    session_db: ReadOnlySessionDB,
+    q: str = Query("", max_length=MAX_TAG_NAME_LENGTH),
+    limit: int = Query(TAG_AUTOCOMPLETE_LIMIT, ge=1, le=MAX_TAG_AUTOCOMPLETE_LIMIT),
+    identity: AuthIdentity = Depends(get_current_identity),
+) -> list[TagSuggestionSchema]:
+    """Подсказки тегов текущего пользователя по началу названия от часто используемых к редким"""
+    return [
+        TagSuggestionSchema.model_validate(suggestion)
+        for suggestion in await tag_autocomplete.suggest(session_db, identity.user_id, q, limit)
+    ]
@@ -0,0 +1,3 @@
+"""Пакет схем данных API"""
+
+__author__: str = "Digital Horizons"
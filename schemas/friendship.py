@@ -0,0 +1,29 @@
+"""Модуль схем дружбы пользователей"""
+
+__author__: str = "Digital Horizons"
+
+from pydantic import BaseModel
+
+
+class FriendIdsSchema(BaseModel):
+    """
+    Схема списка друзей
+
+    Attributes:
+        user_ids (list[int]): отсортированные идентификаторы пользователей
+    """
+
+    user_ids: list[int]
+
+
+class FriendSuggestionSchema(BaseModel):
+    """
+    Схема рекомендации друга
+
+    Attributes:
+        user_id (int): идентификатор рекомендуемого пользователя
+        mutual_count (int): количество общих друзей
+    """
+
+    user_id: int
+    mutual_count: int
@@ -0,0 +1,164 @@
+"""Модуль схем аналитики истории оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+import math
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from consts.analytics import ANALYTICS_PRECISION
+
+# Схемы нужны при создании приложения, а numpy и расчеты аналитики - только при первом запросе аналитики
+if TYPE_CHECKING:
+    import numpy as np
+
+    from analytics import MoodAnalytics, MoodProfile
+
+# Первый день эпохи, от которого отсчитываются номера дней аналитики
+_EPOCH_DAY: date = date(1970, 1, 1)
+
+
+def _optional(values: "np.ndarray") -> list[float | None]:
+    return [None if value != value else value for value in values.round(ANALYTICS_PRECISION).tolist()]
+
+
+class MoodDayAnalyticsSchema(BaseModel):
+    """
+    Схема показателей дня
+
+    Attributes:
+        day (date): день (UTC)
+        count (int): количество записей
+        mean (float | None): средняя оценка. None - записей нет
+        rolling_mean (float | None): средняя оценка за окно дней, заканчивающееся днем. None - записей нет
+        ewma (float | None): экспоненциальное среднее средних оценок дней. None - записей еще не было
+    """
+
+    day: date
+    count: int
+    mean: float | None
+    rolling_mean: float | None
+    ewma: float | None
+
+
+class MoodProfileItemSchema(BaseModel):
+    """
+    Схема оценок по значению признака
+
+    Attributes:
+        key (int): значение признака: день недели (понедельник - 0) или час суток (UTC)
+        count (int): количество записей
+        mean (float | None): средняя оценка. None - записей нет
+    """
+
+    key: int
+    count: int
+    mean: float | None
+
+    @classmethod
+    def from_profile(cls, profile: "MoodProfile") -> list["MoodProfileItemSchema"]:
+        """
+        Схемы всех значений признака
+
+        Args:
+            profile (MoodProfile): распределение оценок по значениям признака
+
+        Returns:
+            list[MoodProfileItemSchema]: схемы по возрастанию значения признака
+        """
+        return [
+            cls(key=key, count=count, mean=mean)
+            for key, (count, mean) in enumerate(zip(profile.counts.tolist(), _optional(profile.means)))
+        ]
+
+
+class MoodStreaksSchema(BaseModel):
+    """
+    Схема серий дней с записями
+
+    Attributes:
+        current (int): текущая серия дней подряд с записями. Продолжается, если сегодня записей еще нет
+        longest (int): наибольшая серия дней подряд с записями
+        active_days (int): количество дней с записями
+    """
+
+    current: int
+    longest: int
+    active_days: int
+
+
+class MoodAnalyticsSchema(BaseModel):
+    """
+    Схема ответа аналитики истории оценок
+
+    Attributes:
+        count (int): количество записей
+        mean (float | None): средняя оценка за все время. None - записей нет
+        window (int): окно скользящего среднего в днях
+        alpha (float): коэффициент сглаживания экспоненциального среднего
+        days (list[MoodDayAnalyticsSchema]): показатели последних дней от старых к новым
+        weekday (list[MoodProfileItemSchema]): оценки по дням недели за все время
+        hour (list[MoodProfileItemSchema]): оценки по часам суток за все время
+        streaks (MoodStreaksSchema): серии дней с записями
+    """
+
+    count: int
+    mean: float | None
+    window: int
+    alpha: float
+    days: list[MoodDayAnalyticsSchema]
+    weekday: list[MoodProfileItemSchema]
+    hour: list[MoodProfileItemSchema]
+    streaks: MoodStreaksSchema
+
+    @classmethod
+    def from_analytics(
+        cls, analytics: "MoodAnalytics", window: int, alpha: float, days: int
+    ) -> "MoodAnalyticsSchema":
+        """
+        Схема ответа по результатам расчета
+
+        Args:
+            analytics (MoodAnalytics): аналитика истории пользователя
+            window (int): окно скользящего среднего в днях
+            alpha (float): коэффициент сглаживания экспоненциального среднего
+            days (int): количество последних дней в ответе
+
+        Returns:
+            MoodAnalyticsSchema: схема ответа
+        """
+        recent: slice = slice(max(len(analytics.counts) - days, 0), None)
+        first_day: date = _EPOCH_DAY + timedelta(days=analytics.first_day + recent.start)
+
+        return cls(
+            count=analytics.count,
+            mean=None if math.isnan(analytics.mean) else round(analytics.mean, ANALYTICS_PRECISION),
+            window=window,
+            alpha=alpha,
+            days=[
+                MoodDayAnalyticsSchema(
+                    day=first_day + timedelta(days=offset),
+                    count=count,
+                    mean=mean,
+                    rolling_mean=rolling_mean,
+                    ewma=ewma,
+                )
+                for offset, (count, mean, rolling_mean, ewma) in enumerate(
+                    zip(
+                        analytics.counts[recent].tolist(),
+                        _optional(analytics.means[recent]),
+                        _optional(analytics.rolling_means[recent]),
+                        _optional(analytics.ewma[recent]),
+                    )
+                )
+            ],
+            weekday=MoodProfileItemSchema.from_profile(analytics.weekday),
+            hour=MoodProfileItemSchema.from_profile(analytics.hour),
+            streaks=MoodStreaksSchema(
+                current=analytics.current_streak,
+                longest=analytics.longest_streak,
+                active_days=analytics.active_days,
+            ),
+        )
@@ -0,0 +1,53 @@
+"""Модуль схем записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from consts.mood_entry import MoodEntryPublishStatus
+from consts.mood_entry_import import MAX_SCORE, MIN_SCORE
+from schemas.tag import TagSchema
+
+
+class MoodEntrySchema(BaseModel):
+    """
+    Схема записи настроения для ответа API
+
+    Attributes:
+        id (int): идентификатор записи
+        score (int): оценка состояния настроения
+        description (str | None): описание своих впечатлений и мыслей
+        status (MoodEntryPublishStatus): статус публикации записи
+        user_id (int | None): идентификатор автора записи
+        created_at (datetime): время создания записи
+        updated_at (datetime): время последнего изменения записи
+        tags (list[TagSchema]): теги записи
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    score: int
+    description: str | None
+    status: MoodEntryPublishStatus
+    user_id: int | None
+    created_at: datetime
+    updated_at: datetime
+    tags: list[TagSchema] = []
+
+
+class MoodEntryCreateSchema(BaseModel):
+    """
+    Схема создания записи настроения
+
+    Attributes:
+        score (int): оценка состояния настроения
+        description (str | None): описание своих впечатлений и мыслей
+        status (MoodEntryPublishStatus): статус публикации записи
+    """
+
+    score: int = Field(ge=MIN_SCORE, le=MAX_SCORE)
+    description: str | None = None
+    status: MoodEntryPublishStatus = MoodEntryPublishStatus.FOR_ALL
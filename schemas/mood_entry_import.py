@@ -0,0 +1,92 @@
+"""Модуль схем импорта записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from pydantic import AwareDatetime, BaseModel, Field, field_validator
+
+from consts.mood_entry import MoodEntryPublishStatus
+from consts.mood_entry_import import CSV_TAGS_SEPARATOR, MAX_SCORE, MIN_SCORE
+from consts.tag import MAX_TAG_NAME_LENGTH
+
+
+class MoodEntryImportRow(BaseModel):
+    """
+    Схема строки импорта записи настроения
+
+    Attributes:
+        created_at (datetime): время создания записи с часовым поясом
+        score (int): оценка состояния настроения
+        description (str | None): описание своих впечатлений и мыслей
+        status (MoodEntryPublishStatus | None): статус публикации. None - статус импорта по умолчанию
+        tags (list[str]): названия тегов записи
+    """
+
+    created_at: AwareDatetime
+    score: int = Field(ge=MIN_SCORE, le=MAX_SCORE)
+    description: str | None = None
+    status: MoodEntryPublishStatus | None = None
+    tags: list[str] = []
+
+    @field_validator("description", "status", mode="before")
+    @classmethod
+    def empty_as_none(cls, value: str | None) -> str | None:
+        """Пустые значения колонок CSV считаются отсутствующими"""
+        return value or None
+
+    @field_validator("tags", mode="before")
+    @classmethod
+    def split_tags(cls, value: str | list[str] | None) -> list[str]:
+        """Теги CSV передаются одной строкой через разделитель"""
+        if value is None:
+            return []
+
+        if isinstance(value, str):
+            value = value.split(CSV_TAGS_SEPARATOR)
+
+        return value
+
+    @field_validator("tags")
+    @classmethod
+    def normalize_tags(cls, value: list[str]) -> list[str]:
+        """Удаление пустых и повторяющихся тегов с проверкой длины названия"""
+        tags: list[str] = list(dict.fromkeys(tag.strip() for tag in value if tag.strip()))
+
+        for tag in tags:
+            if len(tag) > MAX_TAG_NAME_LENGTH:
+                raise ValueError(f"Tag name is longer than {MAX_TAG_NAME_LENGTH} characters")
+
+        return tags
+
+
+class ImportRowError(BaseModel):
+    """
+    Схема ошибки строки импорта
+
+    Attributes:
+        line (int): номер строки во входном файле
+        error (str): описание ошибки
+    """
+
+    line: int
+    error: str
+
+
+class ImportProgress(BaseModel):
+    """
+    Схема прогресса импорта
+
+    Attributes:
+        processed (int): количество прочитанных строк
+        imported (int): количество сохраненных записей
+        failed (int): количество строк с ошибками
+        errors (list[ImportRowError]): ошибки строк, появившиеся с прошлого отчета
+        done (bool): импорт завершен
+        error (str | None): ошибка, прервавшая импорт. Записи уже загруженных пачек сохранены
+    """
+
+    processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []
+    done: bool = False
+    error: str | None = None
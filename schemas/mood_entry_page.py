@@ -0,0 +1,20 @@
+"""Модуль схемы страницы записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+from pydantic import BaseModel
+
+from schemas.mood_entry import MoodEntrySchema
+
+
+class MoodEntryPageSchema(BaseModel):
+    """
+    Схема страницы записей настроения
+
+    Attributes:
+        items (list[MoodEntrySchema]): записи страницы от новых к старым
+        next_cursor (str | None): курсор следующей страницы. None - страница последняя
+    """
+
+    items: list[MoodEntrySchema]
+    next_cursor: str | None = None
@@ -0,0 +1,74 @@
+"""Модуль схем статистики оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+import math
+from datetime import date
+
+from pydantic import BaseModel
+
+from consts.mood_score_rollup import RollupPeriod
+from models import MoodScoreRollupModel
+
+
+class MoodScoreStatsSchema(BaseModel):
+    """
+    Схема статистики оценок настроения за период
+
+    Attributes:
+        period_start (date | None): первый день периода. None - итог по всем периодам ответа
+        count (int): количество записей
+        mean (float): средняя оценка
+        min (int): минимальная оценка
+        max (int): максимальная оценка
+        stddev (float): стандартное отклонение оценок
+    """
+
+    period_start: date | None
+    count: int
+    mean: float
+    min: int
+    max: int
+    stddev: float
+
+    @classmethod
+    def from_rollups(
+        cls, rollups: list[MoodScoreRollupModel], period_start: date | None = None
+    ) -> "MoodScoreStatsSchema":
+        """
+        Объединение агрегатов в одну статистику
+
+        Args:
+            rollups (list[MoodScoreRollupModel]): непустой список агрегатов
+            period_start (date | None): первый день периода результата
+
+        Returns:
+            MoodScoreStatsSchema: статистика по всем переданным агрегатам
+        """
+        count: int = sum(rollup.count for rollup in rollups)
+        mean: float = sum(rollup.score_sum for rollup in rollups) / count
+        sum_squares: int = sum(rollup.score_sum_squares for rollup in rollups)
+
+        return cls(
+            period_start=period_start,
+            count=count,
+            mean=mean,
+            min=min(rollup.score_min for rollup in rollups),
+            max=max(rollup.score_max for rollup in rollups),
+            stddev=math.sqrt(max(sum_squares / count - mean**2, 0.0)),
+        )
+
+
+class MoodStatsSchema(BaseModel):
+    """
+    Схема ответа статистики оценок настроения
+
+    Attributes:
+        period (RollupPeriod): период агрегации
+        items (list[MoodScoreStatsSchema]): статистика по периодам от старых к новым
+        total (MoodScoreStatsSchema | None): итог по всем периодам ответа. None - записей нет
+    """
+
+    period: RollupPeriod
+    items: list[MoodScoreStatsSchema]
+    total: MoodScoreStatsSchema | None
@@ -0,0 +1,41 @@
+"""Модуль схем тегов"""
+
+__author__: str = "Digital Horizons"
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TagSchema(BaseModel):
+    """
+    Схема тега записи настроения
+
+    Attributes:
+        id (int): идентификатор тега
+        name (str): название тега
+        color (str): цвет оформления тега
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    color: str
+
+
+class TagSuggestionSchema(BaseModel):
+    """
+    Схема подсказки автодополнения тега
+
+    Attributes:
+        id (int): идентификатор тега
+        name (str): название тега
+        color (str): цвет оформления тега
+        usage_count (int): количество записей пользователя с тегом
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    color: str
+    usage_count: int
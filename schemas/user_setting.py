@@ -0,0 +1,16 @@
+"""Модуль схем настроек пользователей"""
+
+__author__: str = "Digital Horizons"
+
+from pydantic import BaseModel
+
+
+class UserSettingsSchema(BaseModel):
+    """
+    Схема действующих настроек пользователя
+
+    Attributes:
+        values (dict[str, str | bool | int | float]): значения параметров с учетом общих параметров
+    """
+
+    values: dict[str, str | bool | int | float]
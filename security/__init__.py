@@ -4,3 +4,4 @@ __author__: str = "Digital Horizons"
 
 
 from .cors import setup_cors
+from .auth import AuthIdentity, auth_resolver
@@ -0,0 +1,239 @@
+"""Модуль аутентификации пользователей по токену сессии"""
+
+__author__: str = "Digital Horizons"
+
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import event, inspect, select, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from core.cache import TTLCache
+from core.config import settings
+from models import SessionModel, AccessDataModel, UserModel
+
+
+@dataclass(frozen=True, slots=True)
+class AuthIdentity:
+    """
+    Неизменяемый снимок данных аутентифицированного пользователя
+
+    Attributes:
+        session_id (int): идентификатор сессии
+        access_data_id (int): идентификатор данных доступа в систему
+        login (str): логин пользователя
+        user_id (int): идентификатор пользователя
+        full_name (str): полное имя пользователя
+
+    Notes:
+        Хранится в кэше вместо ORM объектов, чтобы не делить изменяемые экземпляры моделей между запросами
+    """
+
+    session_id: int
+    access_data_id: int
+    login: str
+    user_id: int
+    full_name: str
+
+
+class AuthResolver:
+    """
+    Получение пользователя по токену сессии одним запросом с кэшированием результата
+
+    Attributes:
+        cache (TTLCache[str, AuthIdentity]): кэш активных сессий по токену
+
+    Examples:
+        >>> from security.auth import auth_resolver
+        >>>
+        >>> identity: AuthIdentity | None = await auth_resolver.resolve(session_db, token)
+        >>> # Сброс кэша после деактивации сессии вне ORM
+        >>> auth_resolver.invalidate_session(identity.session_id)
+
+    Notes:
+        Сессия считается активной по тем же правилам, что и SessionModel.session_active.
+        Изменения через ORM сбрасывают кэш воркера, в котором сделан коммит, при массовых UPDATE
+        нужно вызывать методы invalidate_* вручную. Кэш локален для воркера: другие воркеры принимают
+        деактивированную сессию не дольше AUTH_CACHE_TTL после коммита. Промахи кэша читаются с основной БД,
+        иначе реплика с отставанием вернула бы сессию активной и продлила этот срок
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.cache: TTLCache[str, AuthIdentity] = TTLCache(maxsize, ttl)
+        self._tokens_by_session: dict[int, str] = {}
+        self._tokens_by_access_data: dict[int, set[str]] = {}
+        self._tokens_by_user: dict[int, set[str]] = {}
+
+    async def resolve(self, session_db: AsyncSession, token: str) -> AuthIdentity | None:
+        """
+        Получение данных пользователя по токену сессии
+
+        Args:
+            session_db (AsyncSession): сессия подключения к основной БД
+            token (str): токен сессии
+
+        Returns:
+            AuthIdentity | None: данные пользователя или None, если сессия не найдена или не активна
+        """
+        identity: AuthIdentity | None = self.cache.get(token)
+
+        if identity is not None:
+            return identity
+
+        row: Row | None = (
+            await session_db.execute(
+                select(
+                    SessionModel.id,
+                    SessionModel.deactivated_at,
+                    AccessDataModel.id,
+                    AccessDataModel.login,
+                    AccessDataModel.deactivated_at,
+                    UserModel.id,
+                    UserModel.surname,
+                    UserModel.name,
+                    UserModel.patronymic,
+                    UserModel.deleted_at,
+                )
+                .join(AccessDataModel, SessionModel.access_data_id == AccessDataModel.id)
+                .join(UserModel, AccessDataModel.user_id == UserModel.id)
+                .where(SessionModel.token == token)
+            )
+        ).first()
+
+        if row is None:
+            return None
+
+        (
+            session_id,
+            session_deactivated_at,
+            access_data_id,
+            login,
+            access_data_deactivated_at,
+            user_id,
+            surname,
+            name,
+            patronymic,
+            user_deleted_at,
+        ) = row
+
+        if session_deactivated_at or access_data_deactivated_at or user_deleted_at:
+            return None
+
+        identity = AuthIdentity(
+            session_id=session_id,
+            access_data_id=access_data_id,
+            login=login,
+            user_id=user_id,
+            full_name=UserModel(surname=surname, name=name, patronymic=patronymic).full_name,
+        )
+        self._remember(token, identity)
+        return identity
+
+    def invalidate_session(self, session_id: int) -> None:
+        """
+        Сброс кэша сессии
+
+        Args:
+            session_id (int): идентификатор сессии
+        """
+        token: str | None = self._tokens_by_session.get(session_id)
+
+        if token is not None:
+            self._forget(token)
+
+    def invalidate_access_data(self, access_data_id: int) -> None:
+        """
+        Сброс кэша всех сессий данных доступа
+
+        Args:
+            access_data_id (int): идентификатор данных доступа
+        """
+        for token in tuple(self._tokens_by_access_data.get(access_data_id, ())):
+            self._forget(token)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Сброс кэша всех сессий пользователя
+
+        Args:
+            user_id (int): идентификатор пользователя
+        """
+        for token in tuple(self._tokens_by_user.get(user_id, ())):
+            self._forget(token)
+
+    def clear(self) -> None:
+        """Полная очистка кэша"""
+        self.cache.clear()
+        self._tokens_by_session.clear()
+        self._tokens_by_access_data.clear()
+        self._tokens_by_user.clear()
+
+    def _remember(self, token: str, identity: AuthIdentity) -> None:
+        # Вытесненные из кэша токены остаются в обратных индексах до сброса, поэтому индексы
+        # периодически пересобираются, чтобы не расти бесконечно
+        if len(self._tokens_by_session) > 2 * self.cache.maxsize:
+            self._compact()
+
+        self.cache.set(token, identity)
+        self._tokens_by_session[identity.session_id] = token
+        self._tokens_by_access_data.setdefault(identity.access_data_id, set()).add(token)
+        self._tokens_by_user.setdefault(identity.user_id, set()).add(token)
+
+    def _forget(self, token: str) -> None:
+        identity: AuthIdentity | None = self.cache.pop(token)
+
+        if identity is None:
+            return
+
+        self._tokens_by_session.pop(identity.session_id, None)
+        self._tokens_by_access_data.get(identity.access_data_id, set()).discard(token)
+        self._tokens_by_user.get(identity.user_id, set()).discard(token)
+
+    def _compact(self) -> None:
+        self._tokens_by_session.clear()
+        self._tokens_by_access_data.clear()
+        self._tokens_by_user.clear()
+
+        for token, identity in self.cache.items():
+            self._tokens_by_session[identity.session_id] = token
+            self._tokens_by_access_data.setdefault(identity.access_data_id, set()).add(token)
+            self._tokens_by_user.setdefault(identity.user_id, set()).add(token)
+
+
+# Глобальный экземпляр получения пользователя по токену
+auth_resolver: AuthResolver = AuthResolver(settings.AUTH_CACHE_SIZE, settings.AUTH_CACHE_TTL)
+
+# Поля, изменение которых делает сессию неактивной, и обработчики сброса кэша по ним
+_INVALIDATING_FIELDS: dict[type, tuple[str, Callable[[int], None]]] = {
+    SessionModel: ("deactivated_at", auth_resolver.invalidate_session),
+    AccessDataModel: ("deactivated_at", auth_resolver.invalidate_access_data),
+    UserModel: ("deleted_at", auth_resolver.invalidate_user),
+}
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_auth_invalidations(session: Session, _: UOWTransaction) -> None:
+    for instance in (*session.dirty, *session.deleted):
+        field_and_handler: tuple[str, Callable[[int], None]] | None = _INVALIDATING_FIELDS.get(
+            type(instance)
+        )
+
+        if field_and_handler is None:
+            continue
+
+        field, handler = field_and_handler
+
+        if instance in session.deleted or inspect(instance).attrs[field].history.has_changes():
+            session.info.setdefault("auth_invalidations", []).append((handler, instance.id))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_auth_invalidations(session: Session) -> None:
+    for handler, instance_id in session.info.pop("auth_invalidations", ()):
+        handler(instance_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_auth_invalidations(session: Session) -> None:
+    session.info.pop("auth_invalidations", None)
@@ -0,0 +1,5 @@
+"""Пакет работы с тегами"""
+
+__author__: str = "Digital Horizons"
+
+from .autocomplete import PrefixIndex, TagSuggestion, tag_autocomplete
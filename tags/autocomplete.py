@@ -0,0 +1,263 @@
+"""Модуль автодополнения тегов по префиксу названия"""
+
+__author__: str = "Digital Horizons"
+
+import heapq
+from bisect import bisect_left
+from dataclasses import dataclass, replace
+from typing import Iterable
+
+from sqlalchemy import event, func, inspect, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from consts.tag import TAG_INDEX_MAX_TAGS
+from core.cache import TTLCache
+from core.config import settings
+from models import MoodEntryModel, MoodEntryTagsModel, TagModel
+
+# Символ больше любого символа названия: граница диапазона названий с общим префиксом
+_PREFIX_UPPER_BOUND: str = "\U0010ffff"
+# Ключ кэша общих тегов (user_id IS NULL)
+_GLOBAL_KEY: str = "global"
+
+
+@dataclass(frozen=True, slots=True)
+class TagSuggestion:
+    """
+    Подсказка автодополнения тега
+
+    Attributes:
+        id (int): идентификатор тега
+        name (str): название тега
+        color (str): цвет оформления тега
+        usage_count (int): количество записей пользователя с тегом
+    """
+
+    id: int
+    name: str
+    color: str
+    usage_count: int = 0
+
+
+class PrefixIndex:
+    """
+    Отсортированный по названию список тегов с поиском по префиксу
+
+    Examples:
+        >>> index: PrefixIndex = PrefixIndex([TagSuggestion(1, "Работа", "red", 5), TagSuggestion(2, "Радость", "green", 9)])
+        >>> print([tag.name for tag in index.search("ра", 10)]) # ["Радость", "Работа"]
+
+    Notes:
+        Границы диапазона находятся двоичным поиском, из диапазона выбираются limit самых
+        используемых тегов без полной сортировки
+    """
+
+    def __init__(self, tags: Iterable[TagSuggestion]):
+        self._tags: list[TagSuggestion] = sorted(tags, key=lambda tag: tag.name.lower())
+        self._keys: list[str] = [tag.name.lower() for tag in self._tags]
+
+    def __len__(self) -> int:
+        return len(self._tags)
+
+    def search(self, prefix: str, limit: int) -> list[TagSuggestion]:
+        """
+        Поиск тегов по началу названия без учета регистра
+
+        Args:
+            prefix (str): начало названия
+            limit (int): максимальное количество тегов
+
+        Returns:
+            list[TagSuggestion]: теги от часто используемых к редким, при равенстве - по названию
+        """
+        key: str = prefix.lower()
+        start: int = bisect_left(self._keys, key)
+        end: int = bisect_left(self._keys, key + _PREFIX_UPPER_BOUND, lo=start)
+        return heapq.nsmallest(
+            limit, self._tags[start:end], key=lambda tag: (-tag.usage_count, tag.name.lower())
+        )
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class TagAutocomplete:
+    """
+    Автодополнение тегов пользователя с индексами в памяти воркера
+
+    Attributes:
+        maxsize (int): максимальное количество индексов пользователей в кэше
+        ttl (float): время жизни индекса пользователя в секундах
+
+    Examples:
+        >>> suggestions: list[TagSuggestion] = await tag_autocomplete.suggest(session_db, user_id, "ра", 10)
+
+    Notes:
+        Индекс пользователя объединяет общие теги, собственные теги и теги, которые он использовал.
+        Создание, изменение и удаление тегов через ORM сбрасывает индексы сразу после коммита,
+        количество использований обновляется по истечении ttl. Пользователи с числом тегов больше
+        TAG_INDEX_MAX_TAGS обслуживаются запросом в БД по триграммному индексу ix_tag_name_trgm
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self._indexes: TTLCache[int, PrefixIndex] = TTLCache(maxsize, ttl)
+        self._oversized: TTLCache[int, bool] = TTLCache(maxsize, ttl)
+        self._global_tags: TTLCache[str, list[TagSuggestion]] = TTLCache(1, ttl)
+
+    async def suggest(
+        self, session_db: AsyncSession, user_id: int, prefix: str, limit: int
+    ) -> list[TagSuggestion]:
+        """
+        Подсказки тегов по началу названия
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при промахе кэша
+            user_id (int): идентификатор пользователя
+            prefix (str): введенное начало названия
+            limit (int): максимальное количество подсказок
+
+        Returns:
+            list[TagSuggestion]: теги от часто используемых пользователем к редким
+        """
+        index: PrefixIndex | None = self._indexes.get(user_id)
+
+        if index is None and not self._oversized.get(user_id):
+            index = await self._load(session_db, user_id)
+
+        if index is None:
+            return await self._query(session_db, user_id, prefix, limit)
+
+        return index.search(prefix, limit)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Сброс индекса пользователя
+
+        Args:
+            user_id (int): идентификатор пользователя
+        """
+        self._indexes.pop(user_id)
+        self._oversized.pop(user_id)
+
+    def invalidate_global(self) -> None:
+        """Сброс индексов всех пользователей после изменения общих тегов"""
+        self.clear()
+
+    def clear(self) -> None:
+        """Очистка всех индексов"""
+        self._indexes.clear()
+        self._oversized.clear()
+        self._global_tags.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика использования кэша индексов
+
+        Returns:
+            dict[str, int]: размер кэша, количество попаданий и промахов
+        """
+        return self._indexes.stats()
+
+    async def _load(self, session_db: AsyncSession, user_id: int) -> PrefixIndex | None:
+        global_tags: list[TagSuggestion] | None = self._global_tags.get(_GLOBAL_KEY)
+
+        if global_tags is None:
+            global_tags = [
+                TagSuggestion(*row)
+                for row in await session_db.execute(
+                    select(TagModel.id, TagModel.name, TagModel.color).where(TagModel.user_id.is_(None))
+                )
+            ]
+            self._global_tags.set(_GLOBAL_KEY, global_tags)
+
+        own_count: int = await session_db.scalar(
+            select(func.count()).select_from(TagModel).where(TagModel.user_id == user_id)
+        )
+
+        if len(global_tags) + own_count > TAG_INDEX_MAX_TAGS:
+            self._oversized.set(user_id, True)
+            return None
+
+        tags: dict[int, TagSuggestion] = {tag.id: tag for tag in global_tags}
+        tags.update(
+            (row.id, TagSuggestion(*row))
+            for row in await session_db.execute(
+                select(TagModel.id, TagModel.name, TagModel.color).where(TagModel.user_id == user_id)
+            )
+        )
+
+        for tag_id, name, color, usage_count in await session_db.execute(
+            select(TagModel.id, TagModel.name, TagModel.color, func.count())
+            .join(MoodEntryTagsModel, MoodEntryTagsModel.tag_id == TagModel.id)
+            .join(MoodEntryModel, MoodEntryModel.id == MoodEntryTagsModel.mood_entry_id)
+            .where(MoodEntryModel.user_id == user_id, MoodEntryModel.deleted_at.is_(None))
+            .group_by(TagModel.id)
+        ):
+            tags[tag_id] = replace(tags.get(tag_id, TagSuggestion(tag_id, name, color)), usage_count=usage_count)
+
+        index: PrefixIndex = PrefixIndex(tags.values())
+        self._indexes.set(user_id, index)
+        return index
+
+    async def _query(
+        self, session_db: AsyncSession, user_id: int, prefix: str, limit: int
+    ) -> list[TagSuggestion]:
+        usage_count = (
+            select(func.count())
+            .select_from(MoodEntryTagsModel)
+            .join(MoodEntryModel, MoodEntryModel.id == MoodEntryTagsModel.mood_entry_id)
+            .where(
+                MoodEntryTagsModel.tag_id == TagModel.id,
+                MoodEntryModel.user_id == user_id,
+                MoodEntryModel.deleted_at.is_(None),
+            )
+            .scalar_subquery()
+        )
+
+        return [
+            TagSuggestion(*row)
+            for row in await session_db.execute(
+                select(TagModel.id, TagModel.name, TagModel.color, usage_count.label("usage_count"))
+                .where(
+                    or_(TagModel.user_id.is_(None), TagModel.user_id == user_id),
+                    TagModel.name.ilike(_escape_like(prefix) + "%", escape="\\"),
+                )
+                .order_by(usage_count.desc(), func.lower(TagModel.name))
+                .limit(limit)
+            )
+        ]
+
+
+# Глобальный экземпляр автодополнения тегов
+tag_autocomplete: TagAutocomplete = TagAutocomplete(settings.TAG_INDEX_CACHE_SIZE, settings.TAG_INDEX_TTL)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_tag_invalidations(session: Session, _: UOWTransaction) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if not isinstance(instance, TagModel):
+            continue
+
+        user_ids: list[int | None] = inspect(instance).attrs.user_id.history.sum() or [instance.user_id]
+        session.info.setdefault("tag_invalidations", set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_tag_invalidations(session: Session) -> None:
+    user_ids: set[int | None] = session.info.pop("tag_invalidations", set())
+
+    if None in user_ids:
+        tag_autocomplete.invalidate_global()
+        return
+
+    for user_id in user_ids:
+        tag_autocomplete.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_tag_invalidations(session: Session) -> None:
+    session.info.pop("tag_invalidations", None)
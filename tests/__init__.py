@@ -0,0 +1,3 @@
+"""Тесты приложения"""
+
+__author__: str = "Digital Horizons"
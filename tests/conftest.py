@@ -0,0 +1,9 @@
+"""Общая настройка тестов"""
+
+__author__: str = "Digital Horizons"
+
+import os
+
+# Настройки без значений по умолчанию: тестам без БД достаточно адреса, подключение не открывается
+os.environ.setdefault("DB_URL", "postgresql+asyncpg://postgres@localhost:5432/mood_tracker_test")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
@@ -0,0 +1,73 @@
+"""Тесты выборочного логирования HTTP запросов"""
+
+__author__: str = "Digital Horizons"
+
+import pytest
+
+from logger.sampling import DEFAULT_RULE, AccessLogSampler, SampleDecision
+
+
+@pytest.fixture
+def sampler() -> AccessLogSampler:
+    """Выбор запросов с правилами точного пути, префиксов и исключений"""
+    return AccessLogSampler(
+        default_rate=1.0,
+        route_rates={"/feed*": 0.1, "/feed/friends*": 0.5, "/entries": 0.2},
+        exclude_paths=["/health", "/internal/*"],
+        slow_request_ms=1000.0,
+        error_status=500,
+    )
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/entries", ("/entries", 0.2)),
+        ("/entries/15", (DEFAULT_RULE, 1.0)),
+        ("/feed", ("/feed*", 0.1)),
+        ("/feed/friends/3", ("/feed/friends*", 0.5)),
+        ("/health", ("/health", None)),
+        ("/internal/caches", ("/internal/*", None)),
+        ("/users/me", (DEFAULT_RULE, 1.0)),
+    ],
+)
+def test_match_prefers_exact_then_longest_prefix(
+    sampler: AccessLogSampler, path: str, expected: tuple[str, float | None]
+) -> None:
+    assert sampler.match(path) == expected
+
+
+def test_sample_bounds() -> None:
+    assert AccessLogSampler.sample(1.0)
+    assert not any(AccessLogSampler.sample(0.0) for _ in range(100))
+
+
+@pytest.mark.parametrize(
+    ("sampled", "status_code", "duration_ms", "expected"),
+    [
+        (True, 200, 5.0, SampleDecision.SAMPLED),
+        (True, 503, 5.0, SampleDecision.SAMPLED),
+        (False, 200, 5.0, SampleDecision.SAMPLED_OUT),
+        (False, 500, 5.0, SampleDecision.FORCED),
+        (False, 200, 1000.0, SampleDecision.FORCED),
+        (False, 404, 999.9, SampleDecision.SAMPLED_OUT),
+    ],
+)
+def test_decide_forces_errors_and_slow_requests(
+    sampler: AccessLogSampler, sampled: bool, status_code: int, duration_ms: float, expected: SampleDecision
+) -> None:
+    assert sampler.decide("/feed*", sampled, status_code, duration_ms) == expected
+
+
+def test_decisions_are_counted_by_rule(sampler: AccessLogSampler) -> None:
+    for path in ("/feed/1", "/feed/2", "/feed/3"):
+        rule, _ = sampler.match(path)
+        sampler.decide(rule, False, 200, 1.0)
+
+    sampler.decide("/feed*", True, 200, 1.0)
+    sampler.count("/health", SampleDecision.EXCLUDED)
+
+    assert sampler.stats() == {
+        "/feed*": {"sampled": 1, "sampled_out": 3, "forced": 0, "excluded": 0, "total": 4},
+        "/health": {"sampled": 0, "sampled_out": 0, "forced": 0, "excluded": 1, "total": 1},
+    }
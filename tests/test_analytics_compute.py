@@ -0,0 +1,100 @@
+"""Тесты векторных расчетов по ряду оценок настроения"""
+
+__author__: str = "Digital Horizons"
+
+import math
+
+import numpy as np
+import pytest
+
+from analytics.compute import MoodProfile, ewma, profile, rolling_mean, streaks
+from analytics.series import MoodSeries
+from core.conditional import ResourceVersion
+
+# Версия истории рядов тестов: расчеты от нее не зависят
+VERSION: ResourceVersion = ResourceVersion(None, 0, None)
+
+
+def _naive_ewma(values: list[float], alpha: float) -> list[float]:
+    result: list[float] = []
+    previous: float = math.nan
+
+    for value in values:
+        if not math.isnan(value):
+            previous = value if math.isnan(previous) else (1 - alpha) * previous + alpha * value
+
+        result.append(previous)
+
+    return result
+
+
+def _naive_rolling_mean(sums: list[float], counts: list[int], window: int) -> list[float]:
+    result: list[float] = []
+
+    for day in range(len(sums)):
+        start: int = max(0, day - window + 1)
+        count: int = sum(counts[start : day + 1])
+        result.append(sum(sums[start : day + 1]) / count if count else math.nan)
+
+    return result
+
+
+@pytest.mark.parametrize("window", [1, 3, 7, 30])
+def test_rolling_mean_matches_naive(window: int) -> None:
+    randomizer: np.random.Generator = np.random.default_rng(0)
+    counts: np.ndarray = randomizer.integers(0, 3, 60) * randomizer.integers(0, 2, 60)
+    sums: np.ndarray = (counts * randomizer.integers(0, 11, 60)).astype(np.float64)
+
+    np.testing.assert_allclose(
+        rolling_mean(sums, counts, window), _naive_rolling_mean(sums.tolist(), counts.tolist(), window)
+    )
+
+
+def test_ewma_example_with_gaps() -> None:
+    np.testing.assert_allclose(ewma(np.array([np.nan, 1.0, np.nan, 3.0]), 0.5), [np.nan, 1.0, 1.0, 2.0])
+
+
+@pytest.mark.parametrize("alpha", [0.001, 0.3, 0.9, 1.0])
+def test_ewma_matches_recurrence_on_long_series(alpha: float) -> None:
+    # Ряд длиннее блока расчета: среднее переносится между блоками
+    values: np.ndarray = np.random.default_rng(1).uniform(0, 10, 5000)
+    values[::7] = np.nan
+
+    np.testing.assert_allclose(ewma(values, alpha), _naive_ewma(values.tolist(), alpha), rtol=1e-9)
+
+
+def test_ewma_without_values() -> None:
+    assert np.isnan(ewma(np.full(3, np.nan), 0.3)).all()
+
+
+@pytest.mark.parametrize(
+    ("counts", "expected"),
+    [
+        ([0, 0, 0], (0, 0)),
+        ([1, 1, 0, 1, 1, 1], (3, 3)),
+        ([1, 1, 1, 0, 1, 0], (1, 3)),
+        ([1, 1, 1, 0, 0, 0], (0, 3)),
+        ([2, 0, 1, 1, 0, 0], (0, 2)),
+    ],
+)
+def test_streaks(counts: list[int], expected: tuple[int, int]) -> None:
+    assert streaks(np.array(counts)) == expected
+
+
+def test_profile_counts_and_means() -> None:
+    result: MoodProfile = profile(np.array([0, 2, 2, 0, 2]), np.array([4, 1, 2, 6, 3]), 4)
+
+    assert result.counts.tolist() == [2, 0, 3, 0]
+    np.testing.assert_allclose(result.means, [5.0, np.nan, 2.0, np.nan])
+
+
+def test_series_appended_keeps_time_order() -> None:
+    series: MoodSeries = MoodSeries.from_rows([(2, 200, 5), (1, 100, 4)], VERSION)
+    # Импортированная запись с прошлым временем встает на свое место
+    appended: MoodSeries = series.appended([(3, 300, 7), (4, 150, 1)], VERSION)
+
+    assert series.timestamps.tolist() == [100, 200]
+    assert appended.timestamps.tolist() == [100, 150, 200, 300]
+    assert appended.scores.tolist() == [4, 1, 5, 7]
+    assert appended.max_id == 4
+    assert appended.nbytes == 4 * 10
@@ -0,0 +1,79 @@
+"""Тесты графа дружбы в памяти воркера"""
+
+__author__: str = "Digital Horizons"
+
+import asyncio
+from typing import Any
+
+from core.database import PRIMARY_BIND_ARGUMENTS
+from friendship.graph import FriendGraph
+
+
+class FakeSession:
+    """Сессия без БД: возвращает заданные пары дружб и запоминает аргументы выполнения"""
+
+    def __init__(self, pairs: list[tuple[int, int]]):
+        self.pairs: list[tuple[int, int]] = pairs
+        self.bind_arguments: list[dict[str, Any] | None] = []
+        self.release: asyncio.Event = asyncio.Event()
+        self.release.set()
+
+    async def execute(self, _: Any, bind_arguments: dict[str, Any] | None = None) -> list[tuple[int, int]]:
+        self.bind_arguments.append(bind_arguments)
+        rows: list[tuple[int, int]] = list(self.pairs)
+        await self.release.wait()
+        return rows
+
+
+def _graph() -> FriendGraph:
+    return FriendGraph(maxsize=100, ttl=60, replica_lag=5)
+
+
+async def test_friends_are_loaded_once() -> None:
+    graph: FriendGraph = _graph()
+    session: FakeSession = FakeSession([(1, 2), (3, 1)])
+
+    assert list(await graph.get_friends(session, 1)) == [2, 3]
+    assert await graph.are_friends(session, 1, 3)
+    assert session.bind_arguments == [None]
+
+
+async def test_load_racing_apply_is_not_cached() -> None:
+    graph: FriendGraph = _graph()
+    session: FakeSession = FakeSession([(1, 2)])
+    session.release.clear()
+
+    loading: asyncio.Task = asyncio.create_task(graph.get_friends(session, 1))
+    await asyncio.sleep(0)
+    # Дружба принята, пока загрузка ждала строки без нее
+    graph.apply(1, 3, accepted=True)
+    session.release.set()
+    await loading
+
+    session.pairs = [(1, 2), (1, 3)]
+    assert list(await graph.get_friends(session, 1)) == [2, 3]
+    assert len(session.bind_arguments) == 2
+
+
+async def test_load_after_change_reads_primary() -> None:
+    graph: FriendGraph = _graph()
+    graph.apply(1, 2, accepted=True)
+    session: FakeSession = FakeSession([(1, 2)])
+
+    await graph.get_friends(session, 1)
+    await graph.get_friends(session, 5)
+
+    assert session.bind_arguments == [PRIMARY_BIND_ARGUMENTS, None]
+
+
+async def test_apply_updates_loaded_users_without_counting_lookups() -> None:
+    graph: FriendGraph = _graph()
+    session: FakeSession = FakeSession([(1, 2)])
+    await graph.get_friends(session, 1)
+    stats: dict[str, int] = graph.stats()
+
+    graph.apply(1, 4, accepted=True)
+    graph.apply(1, 2, accepted=False)
+
+    assert graph.stats() == {**stats, "edges": 1}
+    assert list(await graph.get_friends(session, 1)) == [4]
@@ -0,0 +1,37 @@
+"""Тесты фоновой записи логов"""
+
+__author__: str = "Digital Horizons"
+
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from logger.pipeline import LogPipeline, LogTarget, serialize_text
+
+
+def test_targets_are_opened_on_first_record(tmp_path: Path) -> None:
+    pipeline: LogPipeline = LogPipeline(maxsize=100, batch_size=10, flush_interval=0.01)
+    # Как в setup_logger: логгер писателя копируется из глобального без обработчиков
+    logger.remove()
+    pipeline.start(
+        [
+            LogTarget(tmp_path / "app.log", "INFO", serialize_text),
+            LogTarget(tmp_path / "error.log", "ERROR", serialize_text),
+        ]
+    )
+    handler_id: int = logger.add(pipeline.write, format="{message}", level=pipeline.min_level)
+
+    try:
+        # Запуск не открывает файлы: они создаются писателем при первой записи в назначение
+        assert list(tmp_path.iterdir()) == []
+
+        logger.info("started")
+    finally:
+        logger.remove(handler_id)
+        pipeline.stop()
+        logger.add(sys.stderr)
+
+    assert [path.name for path in tmp_path.iterdir()] == ["app.log"]
+    assert "started" in (tmp_path / "app.log").read_text(encoding="utf-8")
+    assert pipeline.stats() == {"queued": 0, "written": 1, "dropped": 0}
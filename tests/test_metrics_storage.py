@@ -0,0 +1,103 @@
+"""Тесты файла значений метрик, общего для воркеров"""
+
+__author__: str = "Digital Horizons"
+
+import multiprocessing
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+import pytest
+
+from metrics.storage import SharedMetricsFile
+
+# Ключ изменчивого значения: как текущее значение gauge, действует только пока жив воркер
+VOLATILE_KEY: str = "gauge"
+# Ключ накопленного значения: как значение счетчика, переживает воркер
+COUNTER_KEY: str = "counter"
+
+# Блокировки fcntl принадлежат процессу, поэтому воркеры в тестах - отдельные процессы
+_context = multiprocessing.get_context("fork")
+
+
+def _storage(path: Path, slots: int = 4, slot_size: int = 4096) -> SharedMetricsFile:
+    return SharedMetricsFile(path, slots, slot_size, lambda key: key == VOLATILE_KEY)
+
+
+def _worker(path: Path, connection: Connection) -> None:
+    storage: SharedMetricsFile = _storage(path)
+    storage.add(COUNTER_KEY, 2)
+    storage.set(VOLATILE_KEY, 7)
+    connection.send(storage.slot)
+    # Воркер держит область, пока тест не разрешит ему завершиться
+    connection.recv()
+
+
+@pytest.fixture
+def path(tmp_path: Path) -> Path:
+    """Путь к файлу метрик теста"""
+    return tmp_path / "metrics.mmap"
+
+
+def test_values_of_one_process(path: Path) -> None:
+    storage: SharedMetricsFile = _storage(path)
+    storage.add(COUNTER_KEY, 1)
+    storage.add(COUNTER_KEY, 2.5)
+    storage.set(VOLATILE_KEY, 4)
+    storage.set(VOLATILE_KEY, 3)
+
+    assert storage.read() == {COUNTER_KEY: 3.5, VOLATILE_KEY: 3.0}
+    assert storage.slot == 0
+
+
+def test_values_are_summed_over_workers_and_slot_is_reused(path: Path) -> None:
+    parent_connection, child_connection = _context.Pipe()
+    worker = _context.Process(target=_worker, args=(path, child_connection))
+    worker.start()
+    worker_slot: int = parent_connection.recv()
+
+    reader: SharedMetricsFile = _storage(path)
+    reader.add(COUNTER_KEY, 1)
+
+    # Живой воркер занимает свою область: значения суммируются, изменчивые учитываются
+    assert reader.slot != worker_slot
+    assert reader.read() == {COUNTER_KEY: 3.0, VOLATILE_KEY: 7.0}
+
+    parent_connection.send(None)
+    worker.join()
+
+    # Изменчивое значение завершившегося воркера не учитывается, накопленное остается
+    assert reader.read() == {COUNTER_KEY: 3.0}
+
+    reader.close()
+    successor: SharedMetricsFile = _storage(path)
+
+    # Следующий процесс занимает свободную область и обнуляет в ней изменчивые значения
+    assert successor.read() == {COUNTER_KEY: 3.0, VOLATILE_KEY: 0.0}
+    assert successor.slot == 0
+    successor.close()
+
+
+def test_in_use_without_live_owner(path: Path) -> None:
+    assert not _storage(path).in_use()
+
+    parent_connection, child_connection = _context.Pipe()
+    worker = _context.Process(target=_worker, args=(path, child_connection))
+    worker.start()
+    parent_connection.recv()
+
+    assert _storage(path).in_use()
+
+    parent_connection.send(None)
+    worker.join()
+
+    assert not _storage(path).in_use()
+
+
+def test_full_slot_counts_overflow(path: Path) -> None:
+    storage: SharedMetricsFile = _storage(path, slot_size=64)
+
+    for index in range(10):
+        storage.add(f"{COUNTER_KEY}_{index}", 1)
+
+    assert 0 < len(storage.read()) < 10
+    assert storage.overflowed == 10 - len(storage.read())
@@ -0,0 +1,49 @@
+"""Тесты курсоров пагинации"""
+
+__author__: str = "Digital Horizons"
+
+import base64
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from core.pagination import decode_cursor, encode_cursor
+
+
+@pytest.mark.parametrize(
+    "created_at",
+    [
+        datetime(2026, 10, 18, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=3))),
+        datetime(1999, 12, 31, 23, 59, 59, tzinfo=timezone.utc),
+    ],
+)
+def test_cursor_round_trip(created_at: datetime) -> None:
+    cursor: str = encode_cursor(created_at, 42)
+
+    assert decode_cursor(cursor) == (created_at, 42)
+    # Курсор передается в параметре запроса без экранирования
+    assert "=" not in cursor and "+" not in cursor and "/" not in cursor
+
+
+def test_cursor_keeps_order_position() -> None:
+    created_at: datetime = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+    assert encode_cursor(created_at, 1) != encode_cursor(created_at, 2)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        base64.urlsafe_b64encode(b"2026-10-18T00:00:00+00:00").decode(),
+        base64.urlsafe_b64encode(b"2026-10-18T00:00:00+00:00|abc").decode(),
+        base64.urlsafe_b64encode(b"yesterday|1").decode(),
+        base64.urlsafe_b64encode(b"2026-10-18|1|2").decode(),
+        base64.urlsafe_b64encode(b"\xff\xfe|1").decode(),
+    ],
+)
+def test_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
@@ -0,0 +1,62 @@
+"""Тесты нормализации SQL выражений"""
+
+__author__: str = "Digital Horizons"
+
+import pytest
+
+from core.query_log import normalize_sql, redact_parameters
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("SELECT * FROM tag WHERE id = $1::INTEGER", "SELECT * FROM tag WHERE id = ?"),
+        ("SELECT * FROM tag WHERE name = 'it''s' AND id > 10", "SELECT * FROM tag WHERE name = ? AND id > ?"),
+        ("SELECT * FROM tag WHERE id = %(id_1)s AND name = %s", "SELECT * FROM tag WHERE id = ? AND name = ?"),
+        ("SELECT * FROM tag WHERE id = :id AND name = ?", "SELECT * FROM tag WHERE id = ? AND name = ?"),
+        ("SELECT *\n  FROM   tag\n WHERE id = $1", "SELECT * FROM tag WHERE id = ?"),
+    ],
+)
+def test_values_are_replaced(statement: str, expected: str) -> None:
+    assert normalize_sql(statement) == expected
+
+
+def test_casts_without_values_are_kept() -> None:
+    assert (
+        normalize_sql("SELECT CAST(name AS VARCHAR(20)), $1::TIMESTAMP WITH TIME ZONE, note::NUMERIC(10, 2)")
+        == "SELECT CAST(name AS VARCHAR(20)), ?, note::NUMERIC(10, 2)"
+    )
+
+
+def test_in_lists_of_any_length_share_fingerprint() -> None:
+    short: str = normalize_sql("SELECT * FROM tag WHERE id IN ($1::INTEGER, $2::INTEGER)")
+    long: str = normalize_sql(f"SELECT * FROM tag WHERE id IN ({', '.join(f'${n}' for n in range(1, 51))})")
+
+    assert short == long == "SELECT * FROM tag WHERE id IN (?)"
+
+
+def test_multi_row_values_share_fingerprint() -> None:
+    single: str = normalize_sql("INSERT INTO tag (name, color) VALUES ($1, $2) RETURNING tag.id")
+    batch: str = normalize_sql("INSERT INTO tag (name, color) VALUES ($1, $2), ($3, $4), ($5, $6) RETURNING tag.id")
+
+    assert single == batch == "INSERT INTO tag (name, color) VALUES (?) RETURNING tag.id"
+
+
+def test_multi_row_values_with_defaults_are_folded() -> None:
+    assert (
+        normalize_sql("INSERT INTO tag (name, color) VALUES ($1, DEFAULT), ($2, DEFAULT)")
+        == "INSERT INTO tag (name, color) VALUES (?, DEFAULT)"
+    )
+
+
+@pytest.mark.parametrize(
+    ("parameters", "expected"),
+    [
+        ({"name": "secret", "id": 1}, ["id", "name"]),
+        (("secret", 1), {"count": 2}),
+        ([("secret", 1), ("other", 2)], {"rows": 2}),
+        (None, None),
+    ],
+)
+def test_parameters_are_redacted(parameters: object, expected: object) -> None:
+    assert redact_parameters(parameters) == expected
@@ -0,0 +1,53 @@
+"""Тесты отметок недавних изменений для чтения с реплик"""
+
+__author__: str = "Digital Horizons"
+
+import pytest
+
+from core import replicas
+from core.replicas import RecentChanges
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    """Управляемое время time.monotonic модуля реплик"""
+    now: list[float] = [100.0]
+    monkeypatch.setattr(replicas.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_change_is_active_within_window(clock: list[float]) -> None:
+    recent: RecentChanges[int] = RecentChanges(5.0)
+    recent.mark(1)
+
+    assert recent.active(1)
+    assert not recent.active(2)
+
+    clock[0] += 4.9
+    assert recent.active(1)
+
+    clock[0] += 0.1
+    assert not recent.active(1)
+
+
+def test_repeated_change_extends_window(clock: list[float]) -> None:
+    recent: RecentChanges[str] = RecentChanges(5.0)
+    recent.mark("defaults")
+    clock[0] += 4.0
+    recent.mark("defaults")
+    clock[0] += 4.0
+
+    assert recent.active("defaults")
+
+
+def test_expired_marks_are_compacted(clock: list[float], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(replicas, "RECENT_CHANGES_COMPACT_SIZE", 3)
+    recent: RecentChanges[int] = RecentChanges(1.0)
+
+    for key in range(4):
+        recent.mark(key)
+
+    clock[0] += 2.0
+    recent.mark(10)
+
+    assert recent._until == {10: clock[0] + 1.0}
@@ -0,0 +1,139 @@
+"""Тесты буфера групповой записи записей настроения"""
+
+__author__: str = "Digital Horizons"
+
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from typing import Any, AsyncIterator
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from mood_entries import write_buffer
+from mood_entries.write_buffer import EntryWriteBuffer
+from schemas.mood_entry import MoodEntryCreateSchema
+
+# Описание записи, на которой вставка пачки завершается ошибкой
+FAILING_DESCRIPTION: str = "fail"
+
+
+class FakeEngine:
+    """Движок без БД: транзакции пустые, вставку выполняет подмененный _insert_batch"""
+
+    def __init__(self):
+        self.transactions: int = 0
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[None]:
+        self.transactions += 1
+        yield None
+
+
+@pytest.fixture
+def batches(monkeypatch: pytest.MonkeyPatch) -> list[list[dict[str, Any]]]:
+    """Значения записей каждой вызванной вставки пачки"""
+    calls: list[list[dict[str, Any]]] = []
+    next_id: list[int] = [1]
+
+    async def insert_batch(_: Any, values: list[dict[str, Any]]) -> list[SimpleNamespace]:
+        calls.append(values)
+
+        if any(item["description"] == FAILING_DESCRIPTION for item in values):
+            raise IntegrityError("INSERT INTO mood_entry", {}, ValueError("check constraint"))
+
+        rows: list[SimpleNamespace] = [
+            SimpleNamespace(id=next_id[0] + offset, **item) for offset, item in enumerate(values)
+        ]
+        next_id[0] += len(values)
+        return rows
+
+    monkeypatch.setattr(write_buffer, "_insert_batch", insert_batch)
+    return calls
+
+
+def _entry(score: int, description: str | None = None) -> MoodEntryCreateSchema:
+    return MoodEntryCreateSchema(score=score, description=description)
+
+
+async def test_concurrent_entries_share_one_transaction(batches: list[list[dict[str, Any]]]) -> None:
+    engine: FakeEngine = FakeEngine()
+    buffer: EntryWriteBuffer = EntryWriteBuffer(engine, maxsize=100, batch_size=100, flush_interval=0.01)
+    buffer.start()
+
+    rows: list[Any] = await asyncio.gather(*(buffer.submit(user_id, _entry(user_id)) for user_id in range(20)))
+    await buffer.stop()
+
+    assert [len(batch) for batch in batches] == [20]
+    assert engine.transactions == 1
+    # Каждый запрос получает свою строку: строки RETURNING сопоставляются по порядку параметров
+    assert [(row.user_id, row.score) for row in rows] == [(user_id, user_id) for user_id in range(20)]
+    assert len({row.id for row in rows}) == 20
+    assert buffer.stats() == {"queued": 0, "written": 20, "failed": 0, "flushes": 1}
+
+
+async def test_batch_size_limits_transaction(batches: list[list[dict[str, Any]]]) -> None:
+    buffer: EntryWriteBuffer = EntryWriteBuffer(FakeEngine(), maxsize=100, batch_size=8, flush_interval=0.01)
+    buffer.start()
+
+    await asyncio.gather(*(buffer.submit(1, _entry(score)) for score in range(20)))
+    await buffer.stop()
+
+    assert [len(batch) for batch in batches] == [8, 8, 4]
+
+
+async def test_full_batch_is_flushed_before_interval(batches: list[list[dict[str, Any]]]) -> None:
+    buffer: EntryWriteBuffer = EntryWriteBuffer(FakeEngine(), maxsize=100, batch_size=5, flush_interval=60)
+    buffer.start()
+
+    # Первая запись запускает накопление пачки, остальные добирают ее до batch_size во время ожидания
+    first: asyncio.Task = asyncio.create_task(buffer.submit(1, _entry(0)))
+    await asyncio.sleep(0.01)
+    rows: list[Any] = await asyncio.wait_for(
+        asyncio.gather(first, *(buffer.submit(1, _entry(score)) for score in range(1, 5))), timeout=1
+    )
+    await buffer.stop()
+
+    assert [row.score for row in rows] == list(range(5))
+    assert [len(batch) for batch in batches] == [5]
+
+
+async def test_failed_batch_retries_entries_one_by_one(batches: list[list[dict[str, Any]]]) -> None:
+    buffer: EntryWriteBuffer = EntryWriteBuffer(FakeEngine(), maxsize=100, batch_size=100, flush_interval=0.01)
+    buffer.start()
+
+    results: list[Any] = await asyncio.gather(
+        *(buffer.submit(1, _entry(score, FAILING_DESCRIPTION if score == 2 else None)) for score in range(5)),
+        return_exceptions=True,
+    )
+    await buffer.stop()
+
+    # Ошибка достается только своему запросу, остальные записи созданы отдельными транзакциями
+    assert isinstance(results[2], IntegrityError)
+    assert [row.score for index, row in enumerate(results) if index != 2] == [0, 1, 3, 4]
+    assert [len(batch) for batch in batches] == [5, 1, 1, 1, 1, 1]
+    assert buffer.stats() == {"queued": 0, "written": 4, "failed": 1, "flushes": 6}
+
+
+async def test_stop_drains_queued_entries(batches: list[list[dict[str, Any]]]) -> None:
+    buffer: EntryWriteBuffer = EntryWriteBuffer(FakeEngine(), maxsize=100, batch_size=100, flush_interval=0.2)
+    buffer.start()
+
+    tasks: list[asyncio.Task] = [asyncio.create_task(buffer.submit(1, _entry(score))) for score in range(10)]
+    await asyncio.sleep(0)
+    await buffer.stop()
+
+    assert all(task.done() for task in tasks)
+    assert [task.result().score for task in tasks] == list(range(10))
+    assert [len(batch) for batch in batches] == [10]
+
+
+async def test_submit_after_stop_fails(batches: list[list[dict[str, Any]]]) -> None:
+    buffer: EntryWriteBuffer = EntryWriteBuffer(FakeEngine(), maxsize=100, batch_size=100, flush_interval=0.01)
+    buffer.start()
+    await buffer.stop()
+
+    with pytest.raises(RuntimeError):
+        await buffer.submit(1, _entry(5))
+
+    assert batches == []
@@ -0,0 +1,5 @@
+"""Пакет настроек пользователей"""
+
+__author__: str = "Digital Horizons"
+
+from .store import SettingsSnapshot, SettingValue, UserSettingsStore, user_settings_store
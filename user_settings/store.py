@@ -0,0 +1,285 @@
+"""Модуль снимков настроек пользователей"""
+
+__author__: str = "Digital Horizons"
+
+from dataclasses import dataclass
+from itertools import batched
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, UOWTransaction
+
+from consts.user_setting import SETTINGS_LOAD_CHUNK_SIZE
+from core.cache import TTLCache
+from core.config import settings
+from core.database import PRIMARY_BIND_ARGUMENTS
+from core.replicas import RecentChanges
+from logger import app_logger
+from models import UserSettingsModel
+
+# Значение параметра после преобразования к его типу
+SettingValue = str | bool | int | float
+
+# Ключ кэша общих параметров (user_id IS NULL)
+_DEFAULTS_KEY: str = "defaults"
+
+
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """
+    Неизменяемый снимок действующих настроек пользователя
+
+    Attributes:
+        user_id (int): идентификатор пользователя
+        values (Mapping[str, SettingValue]): типизированные значения: общие параметры с переопределениями пользователя
+        defaults_version (int): версия общих параметров, из которых собран снимок
+        user_version (int): версия параметров пользователя, из которых собран снимок
+
+    Examples:
+        >>> snapshot: SettingsSnapshot = await user_settings_store.get(session_db, user_id)
+        >>> reminder_enabled: bool = snapshot.get("reminder_enabled", False)
+    """
+
+    user_id: int
+    values: Mapping[str, SettingValue]
+    defaults_version: int
+    user_version: int
+
+    def __getitem__(self, name: str) -> SettingValue:
+        return self.values[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+    def get(self, name: str, default: SettingValue | None = None) -> SettingValue | None:
+        """
+        Значение параметра
+
+        Args:
+            name (str): название параметра
+            default (SettingValue | None): значение, если параметр не задан ни общим, ни пользователем
+
+        Returns:
+            SettingValue | None: значение параметра
+        """
+        return self.values.get(name, default)
+
+
+class UserSettingsStore:
+    """
+    Кэш снимков настроек пользователей с версионной инвалидацией
+
+    Attributes:
+        maxsize (int): максимальное количество снимков в кэше
+        ttl (float): время жизни снимка в секундах
+        replica_lag (float): время после изменения параметров, в течение которого снимок собирается
+            по основной БД
+
+    Examples:
+        >>> snapshot: SettingsSnapshot = await user_settings_store.get(session_db, user_id)
+        >>> # Фоновая задача получает снимки всех пользователей одним запросом
+        >>> snapshots: dict[int, SettingsSnapshot] = await user_settings_store.get_many(session_db, user_ids)
+
+    Notes:
+        Значения преобразуются к типу один раз при сборке снимка. Запись параметров через ORM
+        повышает версию пользователя или общих параметров после коммита, и снимок со старой версией
+        пересобирается при следующем чтении - в том числе собранный параллельно с записью. В течение
+        replica_lag после изменения снимок пересобирается по основной БД: реплика с отставанием вернула
+        бы старые значения, и они попали бы в кэш с новой версией. Изменения из других воркеров
+        и массовые UPDATE становятся видны по истечении ttl
+    """
+
+    def __init__(self, maxsize: int, ttl: float, replica_lag: float):
+        self.maxsize: int = maxsize
+        self.ttl: float = ttl
+        self.replica_lag: float = replica_lag
+        self._snapshots: TTLCache[int, SettingsSnapshot] = TTLCache(maxsize, ttl)
+        self._defaults: TTLCache[str, tuple[int, Mapping[str, SettingValue]]] = TTLCache(1, ttl)
+        self._defaults_version: int = 0
+        self._user_versions: dict[int, int] = {}
+        self._recent: RecentChanges[int | str] = RecentChanges(replica_lag)
+
+    async def get(self, session_db: AsyncSession, user_id: int) -> SettingsSnapshot:
+        """
+        Снимок настроек пользователя
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при промахе кэша
+            user_id (int): идентификатор пользователя
+
+        Returns:
+            SettingsSnapshot: действующие настройки пользователя
+        """
+        return (await self.get_many(session_db, [user_id]))[user_id]
+
+    async def get_many(
+        self, session_db: AsyncSession, user_ids: Iterable[int]
+    ) -> dict[int, SettingsSnapshot]:
+        """
+        Снимки настроек нескольких пользователей
+
+        Args:
+            session_db (AsyncSession): сессия подключения к БД, используется только при промахе кэша
+            user_ids (Iterable[int]): идентификаторы пользователей
+
+        Returns:
+            dict[int, SettingsSnapshot]: снимки по идентификаторам пользователей
+
+        Notes:
+            Отсутствующие в кэше пользователи загружаются запросами по SETTINGS_LOAD_CHUNK_SIZE пользователей
+        """
+        snapshots: dict[int, SettingsSnapshot] = {}
+        missing_ids: list[int] = []
+
+        for user_id in dict.fromkeys(user_ids):
+            snapshot: SettingsSnapshot | None = self._snapshots.get(user_id)
+
+            if snapshot is not None and self._is_current(snapshot):
+                snapshots[user_id] = snapshot
+            else:
+                missing_ids.append(user_id)
+
+        if not missing_ids:
+            return snapshots
+
+        # Версии фиксируются до чтения, чтобы запись во время загрузки сделала снимок устаревшим
+        user_versions: dict[int, int] = {user_id: self._user_versions.get(user_id, 0) for user_id in missing_ids}
+        defaults_version, defaults = await self._load_defaults(session_db)
+        overrides: dict[int, dict[str, SettingValue]] = {user_id: {} for user_id in missing_ids}
+        bind_arguments: dict[str, Any] | None = (
+            PRIMARY_BIND_ARGUMENTS if any(self._recent.active(user_id) for user_id in missing_ids) else None
+        )
+
+        for chunk in batched(missing_ids, SETTINGS_LOAD_CHUNK_SIZE):
+            for user_id, name, value, value_type in await session_db.execute(
+                select(
+                    UserSettingsModel.user_id,
+                    UserSettingsModel.name,
+                    UserSettingsModel.value,
+                    UserSettingsModel.type,
+                ).where(UserSettingsModel.user_id.in_(chunk)),
+                bind_arguments=bind_arguments,
+            ):
+                parsed: SettingValue | None = _parse(name, value, value_type)
+
+                if parsed is not None:
+                    overrides[user_id][name] = parsed
+
+        for user_id in missing_ids:
+            snapshots[user_id] = SettingsSnapshot(
+                user_id=user_id,
+                values=MappingProxyType({**defaults, **overrides[user_id]}),
+                defaults_version=defaults_version,
+                user_version=user_versions[user_id],
+            )
+            self._snapshots.set(user_id, snapshots[user_id])
+
+        return snapshots
+
+    def invalidate_user(self, user_id: int) -> None:
+        """
+        Повышение версии настроек пользователя
+
+        Args:
+            user_id (int): идентификатор пользователя
+        """
+        # Версии нужны только для снимков в кэше и загружаемых сейчас, поэтому словарь
+        # периодически сокращается до пользователей из кэша
+        if len(self._user_versions) > 2 * self.maxsize:
+            self._user_versions = {
+                cached_id: self._user_versions[cached_id]
+                for cached_id, _ in self._snapshots.items()
+                if cached_id in self._user_versions
+            }
+
+        self._user_versions[user_id] = self._user_versions.get(user_id, 0) + 1
+        self._recent.mark(user_id)
+        self._snapshots.pop(user_id)
+
+    def invalidate_defaults(self) -> None:
+        """Повышение версии общих параметров, делающее устаревшими все снимки"""
+        self._defaults_version += 1
+        self._recent.mark(_DEFAULTS_KEY)
+        self._defaults.clear()
+
+    def clear(self) -> None:
+        """Очистка кэша"""
+        self._snapshots.clear()
+        self._defaults.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Статистика использования кэша
+
+        Returns:
+            dict[str, int]: размер кэша, количество попаданий и промахов
+        """
+        return self._snapshots.stats()
+
+    def _is_current(self, snapshot: SettingsSnapshot) -> bool:
+        return (
+            snapshot.defaults_version == self._defaults_version
+            and snapshot.user_version == self._user_versions.get(snapshot.user_id, 0)
+        )
+
+    async def _load_defaults(self, session_db: AsyncSession) -> tuple[int, Mapping[str, SettingValue]]:
+        cached: tuple[int, Mapping[str, SettingValue]] | None = self._defaults.get(_DEFAULTS_KEY)
+
+        if cached is not None and cached[0] == self._defaults_version:
+            return cached
+
+        version: int = self._defaults_version
+        defaults: dict[str, SettingValue] = {}
+
+        for name, value, value_type in await session_db.execute(
+            select(UserSettingsModel.name, UserSettingsModel.value, UserSettingsModel.type).where(
+                UserSettingsModel.user_id.is_(None)
+            ),
+            bind_arguments=PRIMARY_BIND_ARGUMENTS if self._recent.active(_DEFAULTS_KEY) else None,
+        ):
+            parsed: SettingValue | None = _parse(name, value, value_type)
+
+            if parsed is not None:
+                defaults[name] = parsed
+
+        loaded: tuple[int, Mapping[str, SettingValue]] = (version, MappingProxyType(defaults))
+        self._defaults.set(_DEFAULTS_KEY, loaded)
+        return loaded
+
+
+def _parse(name: str, value: str, value_type: str) -> SettingValue | None:
+    try:
+        return UserSettingsModel.parse_value(value, value_type)
+    except ValueError:
+        app_logger.bind(setting=name, value=value, type=value_type).warning("Invalid user setting value")
+        return None
+
+
+# Глобальный экземпляр кэша настроек пользователей
+user_settings_store: UserSettingsStore = UserSettingsStore(
+    settings.USER_SETTINGS_CACHE_SIZE, settings.USER_SETTINGS_TTL, settings.DB_READ_YOUR_WRITES_WINDOW
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_settings_changes(session: Session, _: UOWTransaction) -> None:
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(instance, UserSettingsModel):
+            user_ids: list[int | None] = inspect(instance).attrs.user_id.history.sum() or [instance.user_id]
+            session.info.setdefault("settings_changes", set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_settings_changes(session: Session) -> None:
+    for user_id in session.info.pop("settings_changes", set()):
+        if user_id is None:
+            user_settings_store.invalidate_defaults()
+        else:
+            user_settings_store.invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_settings_changes(session: Session) -> None:
+    session.info.pop("settings_changes", None)